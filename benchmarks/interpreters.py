@@ -0,0 +1,65 @@
+"""Story runs per second of the process pool and the interpreter pool.
+
+Subinterpreters import the service by its module name, so put this
+directory on the path of every interpreter:
+
+    PYTHONPATH=benchmarks python3.14 benchmarks/interpreters.py
+
+Pass the worker counts to measure as arguments.  Default is 1 2 4.
+Before Python 3.14 both pools use worker processes.
+"""
+import sys
+import time
+from importlib import import_module
+
+from stories import arguments
+from stories import Result
+from stories import story
+from stories import Success
+from stories.pool import InterpreterPool
+from stories.pool import ProcessPool
+
+
+class Fibonacci(object):
+    @story
+    @arguments("number")
+    def compute(I):
+        I.iterate
+        I.finish
+
+    def iterate(self, ctx):
+        a, b = 0, 1
+        for _ in range(ctx.number):
+            a, b = b, (a + b) % 1000000007
+        return Success(value=a)
+
+    def finish(self, ctx):
+        return Result(ctx.value)
+
+
+def measure(pool_cls, factory, workers, runs):
+    kwargs_list = [{"number": 20000 + number} for number in range(runs)]
+    started = time.perf_counter()
+    with pool_cls(factory, "compute", workers=workers) as pool:
+        results = pool.run_many(kwargs_list, chunksize=10)
+        engine = pool.engine
+    assert all(result.is_success for result in results)
+    return engine, runs / (time.perf_counter() - started)
+
+
+def main(argv):
+    # Pickled by reference from the importable module, not from __main__.
+    factory = import_module("interpreters").Fibonacci
+    counts = [int(arg) for arg in argv] or [1, 2, 4]
+    print("Python %s" % sys.version.split()[0])
+    for workers in counts:
+        for pool_cls in [ProcessPool, InterpreterPool]:
+            engine, throughput = measure(pool_cls, factory, workers, 400)
+            print(
+                "%-16s %-12s %2d workers: %7.0f runs/s"
+                % (pool_cls.__name__, engine, workers, throughput)
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,57 @@
+"""Round trip time of NumPy arrays through the process pool.
+
+Compares arrays moved through shared memory with arrays pickled
+together with the rest of the arguments and results:
+
+    python3 benchmarks/shared.py
+
+Pass array sizes in megabytes as arguments.  Default is 1 10 100 1000.
+"""
+import sys
+import time
+
+import numpy
+
+from stories import arguments
+from stories import Result
+from stories import story
+from stories.pool import ProcessPool
+
+
+class Echo(object):
+    @story
+    @arguments("data")
+    def send(I):
+        I.finish
+
+    def finish(self, ctx):
+        return Result(ctx.data)
+
+
+def measure(data, shared, repeat):
+    with ProcessPool(Echo, "send", workers=1, shared=shared) as pool:
+        pool.run_many([{"data": data[:1]}])
+        started = time.perf_counter()
+        for _ in range(repeat):
+            [result] = pool.run_many([{"data": data}])
+            assert len(result.value) == len(data)
+            del result
+        return (time.perf_counter() - started) / repeat
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [1, 10, 100, 1000]
+    print("%8s %12s %12s" % ("size", "pickle", "shared"))
+    for size in sizes:
+        data = numpy.ones(size * 1024 * 1024, dtype="uint8")
+        repeat = max(1, 100 // size)
+        pickled = measure(data, None, repeat)
+        shared = measure(data, 1024 * 1024, repeat)
+        print(
+            "%6d MB %10.1f ms %10.1f ms  x%.1f"
+            % (size, pickled * 1000, shared * 1000, pickled / shared)
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
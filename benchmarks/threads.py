@@ -0,0 +1,70 @@
+"""Story runs per second for a growing number of threads.
+
+Run it with the free-threaded build to see how throughput scales
+without the GIL:
+
+    python3.14t benchmarks/threads.py
+
+Pass the thread counts to measure as arguments.  Default is 1 2 4 8.
+"""
+import sys
+import threading
+import time
+
+from stories import arguments
+from stories import Result
+from stories import story
+from stories import Success
+
+
+class Checkout(object):
+    @story
+    @arguments("order_id")
+    def buy(I):
+        I.find_order
+        I.calculate
+        I.show
+
+    def find_order(self, ctx):
+        return Success(items=list(range(ctx.order_id % 20)))
+
+    def calculate(self, ctx):
+        return Success(total=sum(item * item for item in ctx.items))
+
+    def show(self, ctx):
+        return Result(ctx.total)
+
+
+def work(runs):
+    checkout = Checkout()
+    for order_id in range(runs):
+        checkout.buy(order_id=order_id)
+
+
+def measure(threads, runs):
+    workers = [threading.Thread(target=work, args=(runs,)) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * runs / (time.perf_counter() - started)
+
+
+def main(argv):
+    counts = [int(arg) for arg in argv] or [1, 2, 4, 8]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python %s, GIL %s" % (sys.version.split()[0], "on" if gil else "off"))
+    work(1000)
+    single = None
+    for threads in counts:
+        throughput = measure(threads, 20000)
+        single = single or throughput
+        print(
+            "%3d threads: %9.0f runs/s  x%.2f"
+            % (threads, throughput, throughput / single)
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
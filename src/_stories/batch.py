@@ -0,0 +1,28 @@
+from _stories.exceptions import StoryDefinitionError
+
+
+# Markers.
+
+
+def batch(name):
+    if not isinstance(name, str):
+        raise StoryDefinitionError(wrong_batch_message)
+
+    def decorator(f):
+        f.stories_batch = name
+        return f
+
+    return decorator
+
+
+def get_batch(method):
+    name = getattr(method, "stories_batch", None)
+    if name is None:
+        return None
+    return getattr(method.__self__, name)
+
+
+# Messages.
+
+
+wrong_batch_message = "Batch variant of the step can only be defined with its name"
@@ -0,0 +1,10 @@
+from typing import Callable
+from typing import Optional
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+def batch(name: str) -> Callable[[_T], _T]: ...
+def get_batch(method: Callable) -> Optional[Callable]: ...
+
+wrong_batch_message: str
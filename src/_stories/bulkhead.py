@@ -0,0 +1,166 @@
+from collections import deque
+from threading import Event
+from threading import Lock
+
+from _stories.compat import perf_counter
+from _stories.exceptions import BulkheadFull
+from _stories.exceptions import StoryDefinitionError
+from _stories.instrument import current_step
+
+
+# Markers.
+
+
+def bulkhead(limit, queue=None):
+    if type(limit) is not int or limit < 1:
+        raise StoryDefinitionError(wrong_limit_message)
+
+    if queue is not None and (type(queue) is not int or queue < 0):
+        raise StoryDefinitionError(wrong_queue_message)
+
+    def decorator(f):
+        f.stories_bulkhead = Bulkhead(limit, queue)
+        return f
+
+    return decorator
+
+
+def get_bulkhead(method):
+    default = getattr(getattr(method, "__self__", None), "stories_bulkhead", None)
+    return getattr(method, "stories_bulkhead", default)
+
+
+# Limit.
+
+
+# Slots are counted under the lock shared by threads and event loops.
+# Released slot is handed to the first waiter directly, so the waiter
+# could be woken up by the thread or the event loop it does not belong
+# to.
+
+
+class Bulkhead(object):
+    def __init__(self, limit, queue):
+        self.limit = limit
+        self.queue = queue
+        self.lock = Lock()
+        self.running = 0
+        self.waiters = deque()
+
+    @property
+    def waiting(self):
+        return len(self.waiters)
+
+    def enter(self, wake):
+        with self.lock:
+            if self.running < self.limit and not self.waiters:
+                self.running += 1
+                return True
+            if self.queue is not None and len(self.waiters) >= self.queue:
+                raise BulkheadFull(bulkhead_full_template.format(limit=self))
+            self.waiters.append(wake)
+            return False
+
+    def cancel(self, wake):
+        with self.lock:
+            if wake in self.waiters:
+                self.waiters.remove(wake)
+                return
+        # The slot was already handed to the cancelled waiter.
+        self.release()
+
+    def acquire(self):
+        event = Event()
+        if self.enter(event.set):
+            return 0.0
+        started = perf_counter()
+        event.wait()
+        return perf_counter() - started
+
+    def release(self):
+        with self.lock:
+            if not self.waiters:
+                self.running -= 1
+                return
+            wake = self.waiters.popleft()
+        wake()
+
+
+# Step.
+
+
+def limit_step(method):
+    limit = get_bulkhead(method)
+    if limit is None:
+        return method
+    return Limited(method, limit)
+
+
+class Limited(object):
+    def __init__(self, method, bulkhead):
+        self.__self__ = method.__self__
+        self.__name__ = method.__name__
+        self.method = method
+        self.bulkhead = bulkhead
+
+    def __call__(self, ctx):
+        report_wait(self.bulkhead.acquire())
+        try:
+            return self.method(ctx)
+        finally:
+            self.bulkhead.release()
+
+    def __getattr__(self, name):
+        return getattr(self.method, name)
+
+
+def report_wait(waited):
+    step = current_step()
+    if step is not None:
+        step.waited = waited
+
+
+# Substory.
+
+
+# Substory holds the slot from its beginning to its end.  Slots are
+# stacked in the order of substory beginnings.  Substories without the
+# limit hold nothing.
+
+
+class Slots(object):
+    def __init__(self):
+        self.held = []
+
+    def hold(self, bulkhead):
+        self.held.append(bulkhead)
+
+    def enter(self, bulkhead):
+        if bulkhead is not None:
+            bulkhead.acquire()
+        self.hold(bulkhead)
+
+    def exit(self):
+        if not self.held:
+            return
+        bulkhead = self.held.pop()
+        if bulkhead is not None:
+            bulkhead.release()
+
+    def close(self):
+        while self.held:
+            self.exit()
+
+
+# Messages.
+
+
+wrong_limit_message = "Bulkhead limit should be a positive integer"
+
+
+wrong_queue_message = "Bulkhead queue should be a non-negative integer"
+
+
+bulkhead_full_template = """
+Bulkhead queue is full: {limit.waiting} calls are waiting for {limit.limit} slots
+""".strip()
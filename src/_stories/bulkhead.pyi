@@ -0,0 +1,58 @@
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import List
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+
+from _stories.context import Context
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+_T = TypeVar("_T")
+
+def bulkhead(limit: int, queue: Optional[int] = ...) -> Callable[[_T], _T]: ...
+def get_bulkhead(method: Callable) -> Optional[Bulkhead]: ...
+
+class Bulkhead:
+    limit: int
+    queue: Optional[int]
+    lock: Lock
+    running: int
+    waiters: Deque[Callable[[], Any]]
+    def __init__(self, limit: int, queue: Optional[int]) -> None: ...
+    @property
+    def waiting(self) -> int: ...
+    def enter(self, wake: Callable[[], Any]) -> bool: ...
+    def cancel(self, wake: Callable[[], Any]) -> None: ...
+    def acquire(self) -> float: ...
+    def release(self) -> None: ...
+
+def limit_step(method: Callable) -> Union[Callable, Limited]: ...
+
+class Limited:
+    __self__: Any
+    __name__: str
+    method: Callable
+    bulkhead: Bulkhead
+    def __init__(self, method: Callable, bulkhead: Bulkhead) -> None: ...
+    def __call__(self, ctx: Context) -> Union[Result, Success, Failure, Skip]: ...
+    def __getattr__(self, name: str) -> Any: ...
+
+def report_wait(waited: float) -> None: ...
+
+class Slots:
+    held: List[Optional[Bulkhead]]
+    def __init__(self) -> None: ...
+    def hold(self, bulkhead: Optional[Bulkhead]) -> None: ...
+    def enter(self, bulkhead: Optional[Bulkhead]) -> None: ...
+    def exit(self) -> None: ...
+    def close(self) -> None: ...
+
+wrong_limit_message: str
+wrong_queue_message: str
+bulkhead_full_template: str
@@ -0,0 +1,279 @@
+import os
+import sqlite3
+from pickle import dumps  # nosec: B403
+from pickle import loads  # nosec: B403
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from uuid import uuid4
+
+from _stories.compat import replace
+from _stories.context import assign_namespace
+from _stories.context import make_context
+from _stories.effects import restore_effects
+from _stories.exceptions import StoryError
+from _stories.history import History
+from _stories.jobs import story_path
+from _stories.marker import Dataflow
+from _stories.marker import Parallel
+
+
+# Checkpoint is saved after each step of the story finished with
+# success.  It keeps story arguments, variables assigned by steps with
+# the step which assigned them, and the history.  Variables are checked
+# by the contract again when the context is restored.  Deferred effects
+# are kept as well.  Effects bound to the service object are saved by
+# name and bound to the new service object when the story is resumed.
+#
+# Checkpoints are pickled.  Stores keep them in local files created by
+# the application, which are as trusted as its own code.
+
+
+def make_checkpoint(story, kwargs, history):
+    if story.checkpoints is None:
+        return null_checkpoint
+    return Checkpoint(story, uuid4().hex, kwargs, [], [], history, 0)
+
+
+def restore_checkpoint(story, run_id):
+    __tracebackhide__ = True
+    if story.checkpoints is None:
+        message = no_store_template.format(cls=story.cls_name, method=story.name)
+        raise StoryError(message)
+    data = story.checkpoints.load(run_id)
+    if data is None:
+        message = unknown_run_template.format(
+            run_id=run_id, cls=story.cls_name, method=story.name
+        )
+        raise StoryError(message)
+    state = loads(data)  # nosec: B301
+    history = History()
+    history.lines = state["history"]
+    history.indent = state["indent"]
+    ctx = make_context(story.methods[0][1], state["kwargs"], history)
+    methods = method_positions(story.methods)
+    for position, kwargs in state["assigned"]:
+        method, contract = methods[position]
+        kwargs = contract.check_success_statement(method, ctx, kwargs)
+        assign_namespace(ctx, method, kwargs, null_checkpoint)
+    # Checkpoints saved by older versions have no effects.
+    effects = state.get("effects", [])
+    restore_effects(
+        ctx, [restore_effect(story.obj, effect, args) for effect, args in effects]
+    )
+    checkpoint = Checkpoint(
+        story,
+        run_id,
+        state["kwargs"],
+        state["assigned"],
+        effects,
+        history,
+        state["index"] + 1,
+    )
+    return ctx, history, checkpoint
+
+
+def method_positions(methods):
+    positions = {}
+    for index, (method, contract, _protocol) in enumerate(methods):
+        positions[(index, None)] = (method, contract)
+        if type(method) in (Parallel, Dataflow):
+            for member, submethod in enumerate(method.methods):
+                positions[(index, member)] = (submethod, contract)
+    return positions
+
+
+def save_effect(obj, effect, args):
+    if getattr(effect, "__self__", None) is obj:
+        return effect.__name__, args
+    return effect, args
+
+
+def restore_effect(obj, effect, args):
+    if isinstance(effect, str):
+        return getattr(obj, effect), args
+    return effect, args
+
+
+class NullCheckpoint(object):
+    start = 0
+
+    def record(self, method, kwargs):
+        pass
+
+    def defer(self, effects):
+        pass
+
+    def save(self, index):
+        pass
+
+    def finish(self):
+        pass
+
+
+null_checkpoint = NullCheckpoint()
+
+
+class Checkpoint(object):
+    def __init__(self, story, run_id, kwargs, assigned, effects, history, start):
+        self.story = story
+        self.run_id = run_id
+        self.kwargs = kwargs
+        self.assigned = list(assigned)
+        self.effects = list(effects)
+        self.recorded = []
+        self.positions = None
+        self.history = history
+        self.start = start
+
+    def record(self, method, kwargs):
+        self.recorded.append((method, kwargs))
+
+    def defer(self, effects):
+        self.effects.extend(
+            save_effect(self.story.obj, effect, args) for effect, args in effects
+        )
+
+    def save(self, index):
+        if self.recorded:
+            if self.positions is None:
+                self.positions = {
+                    method: position
+                    for position, (method, _) in method_positions(
+                        self.story.methods
+                    ).items()
+                }
+            self.assigned.extend(
+                (self.positions[method], kwargs) for method, kwargs in self.recorded
+            )
+            self.recorded = []
+        state = {
+            "kwargs": self.kwargs,
+            "assigned": self.assigned,
+            "effects": self.effects,
+            "history": self.history.lines,
+            "indent": self.history.indent,
+            "index": index,
+        }
+        self.story.checkpoints.save(self.run_id, story_path(self.story), dumps(state))
+
+    def finish(self):
+        self.story.checkpoints.delete(self.run_id)
+
+
+# Stores.
+
+
+class SQLiteStore(object):
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.lock = Lock()
+        self.execute(create_table_sql)
+
+    def save(self, run_id, story, data):
+        self.execute(save_sql, (run_id, story, data))
+
+    def load(self, run_id):
+        rows = self.execute(load_sql, (run_id,))
+        return rows[0][0] if rows else None
+
+    def delete(self, run_id):
+        self.execute(delete_sql, (run_id,))
+
+    def pending(self, story):
+        return [row[0] for row in self.execute(pending_sql, (story,))]
+
+    def execute(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+
+class FileStore(object):
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def save(self, run_id, story, data):
+        # Write the whole checkpoint aside and move it in place, so the
+        # crash in the middle of the write does not corrupt it.
+        with NamedTemporaryFile(dir=self.directory, delete=False) as f:
+            f.write(dumps((story, data)))
+        replace(f.name, self.filename(run_id))
+
+    def load(self, run_id):
+        try:
+            with open(self.filename(run_id), "rb") as f:
+                return loads(f.read())[1]  # nosec: B301
+        except IOError:
+            return None
+
+    def delete(self, run_id):
+        try:
+            os.remove(self.filename(run_id))
+        except OSError:
+            pass
+
+    def pending(self, story):
+        result = []
+        for filename in sorted(os.listdir(self.directory)):
+            if filename.endswith(".checkpoint"):
+                run_id = filename[: -len(".checkpoint")]
+                with open(self.filename(run_id), "rb") as f:
+                    if loads(f.read())[0] == story:  # nosec: B301
+                        result.append(run_id)
+        return result
+
+    def filename(self, run_id):
+        return os.path.join(self.directory, run_id + ".checkpoint")
+
+
+# Queries.
+
+
+create_table_sql = """
+CREATE TABLE IF NOT EXISTS stories_checkpoints (
+    run_id TEXT PRIMARY KEY,
+    story TEXT NOT NULL,
+    data BLOB NOT NULL
+)
+""".strip()
+
+
+save_sql = """
+INSERT OR REPLACE INTO stories_checkpoints (run_id, story, data) VALUES (?, ?, ?)
+""".strip()
+
+
+load_sql = """
+SELECT data FROM stories_checkpoints WHERE run_id = ?
+""".strip()
+
+
+delete_sql = """
+DELETE FROM stories_checkpoints WHERE run_id = ?
+""".strip()
+
+
+pending_sql = """
+SELECT run_id FROM stories_checkpoints WHERE story = ? ORDER BY rowid
+""".strip()
+
+
+# Messages.
+
+
+no_store_template = """
+Story does not have the checkpoint store: {cls}.{method}
+
+Use `{cls}.{method}.checkpoint(store)` to define one.
+""".strip()
+
+
+unknown_run_template = """
+There is no checkpoint of the run: {run_id!r}
+
+Story method: {cls}.{method}
+""".strip()
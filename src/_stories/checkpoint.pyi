@@ -0,0 +1,98 @@
+from sqlite3 import Connection
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _stories.context import Context
+from _stories.contract import NullContract
+from _stories.contract import SpecContract
+from _stories.history import History
+from _stories.mounted import MountedStory
+
+Position = Tuple[int, Optional[int]]
+
+def make_checkpoint(
+    story: MountedStory, kwargs: Dict[str, Any], history: History
+) -> Union[Checkpoint, NullCheckpoint]: ...
+def restore_checkpoint(
+    story: MountedStory, run_id: str
+) -> Tuple[Context, History, Checkpoint]: ...
+def method_positions(
+    methods: List[Tuple[Any, Union[NullContract, SpecContract], Any]]
+) -> Dict[Position, Tuple[Callable, Union[NullContract, SpecContract]]]: ...
+
+_Effect = Tuple[Callable, Tuple[Any, ...]]
+_SavedEffect = Tuple[Union[str, Callable], Tuple[Any, ...]]
+
+def save_effect(obj: Any, effect: Callable, args: Tuple[Any, ...]) -> _SavedEffect: ...
+def restore_effect(
+    obj: Any, effect: Union[str, Callable], args: Tuple[Any, ...]
+) -> _Effect: ...
+
+class NullCheckpoint:
+    start: int
+    def record(self, method: Callable, kwargs: Dict[str, Any]) -> None: ...
+    def defer(self, effects: Iterable[_Effect]) -> None: ...
+    def save(self, index: int) -> None: ...
+    def finish(self) -> None: ...
+
+null_checkpoint: NullCheckpoint
+
+class Checkpoint:
+    story: MountedStory
+    run_id: str
+    kwargs: Dict[str, Any]
+    assigned: List[Tuple[Position, Dict[str, Any]]]
+    effects: List[_SavedEffect]
+    recorded: List[Tuple[Callable, Dict[str, Any]]]
+    positions: Optional[Dict[Callable, Position]]
+    history: History
+    start: int
+    def __init__(
+        self,
+        story: MountedStory,
+        run_id: str,
+        kwargs: Dict[str, Any],
+        assigned: List[Tuple[Position, Dict[str, Any]]],
+        effects: List[_SavedEffect],
+        history: History,
+        start: int,
+    ) -> None: ...
+    def record(self, method: Callable, kwargs: Dict[str, Any]) -> None: ...
+    def defer(self, effects: Iterable[_Effect]) -> None: ...
+    def save(self, index: int) -> None: ...
+    def finish(self) -> None: ...
+
+class SQLiteStore:
+    path: str
+    connection: Connection
+    lock: Lock
+    def __init__(self, path: str) -> None: ...
+    def save(self, run_id: str, story: str, data: bytes) -> None: ...
+    def load(self, run_id: str) -> Optional[bytes]: ...
+    def delete(self, run_id: str) -> None: ...
+    def pending(self, story: str) -> List[str]: ...
+    def execute(self, sql: str, parameters: Tuple[Any, ...] = ...) -> List[Any]: ...
+
+class FileStore:
+    directory: str
+    def __init__(self, directory: str) -> None: ...
+    def save(self, run_id: str, story: str, data: bytes) -> None: ...
+    def load(self, run_id: str) -> Optional[bytes]: ...
+    def delete(self, run_id: str) -> None: ...
+    def pending(self, story: str) -> List[str]: ...
+    def filename(self, run_id: str) -> str: ...
+
+create_table_sql: str
+save_sql: str
+load_sql: str
+delete_sql: str
+pending_sql: str
+no_store_template: str
+unknown_run_template: str
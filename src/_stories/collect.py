@@ -1,3 +1,6 @@
+from _stories.exceptions import StoryDefinitionError
+
+
 def collect_story(f):
 
     calls = []
@@ -5,7 +8,86 @@ def collect_story(f):
     class Collector(object):
         def __getattr__(self, name):
             calls.append(name)
+            return CollectedName(calls, name)
 
     f(Collector())
 
     return calls
+
+
+class CollectedName(object):
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+
+def parallel(*names):
+    if not names:
+        raise StoryDefinitionError(empty_parallel_message)
+
+    if any(type(name) is not CollectedName for name in names):
+        raise StoryDefinitionError(wrong_parallel_message)
+
+    calls = names[0].calls
+    group = tuple(name.name for name in names)
+    size = len(group)
+    if calls[-size:] != list(group):
+        raise StoryDefinitionError(wrong_parallel_message)
+
+    if len(set(group)) != size:
+        message = repeated_parallel_template.format(names=", ".join(group))
+        raise StoryDefinitionError(message)
+
+    del calls[-size:]
+    calls.append(group)
+
+
+def fan_out(name, over, item, into, limit=None):
+    if type(name) is not CollectedName or name.calls[-1:] != [name.name]:
+        raise StoryDefinitionError(wrong_fan_out_message)
+
+    if any(not isinstance(arg, str) for arg in (over, item, into)):
+        raise StoryDefinitionError(wrong_fan_out_message)
+
+    if limit is not None and (type(limit) is not int or limit < 1):
+        raise StoryDefinitionError(wrong_fan_out_limit_message)
+
+    name.calls[-1] = FanOutCall(name.name, over, item, into, limit)
+
+
+class FanOutCall(object):
+    def __init__(self, name, over, item, into, limit):
+        self.name = name
+        self.over = over
+        self.item = item
+        self.into = into
+        self.limit = limit
+
+
+# Messages.
+
+
+empty_parallel_message = "Parallel group can not be empty"
+
+
+wrong_parallel_message = """
+Parallel group can only contain story steps.
+
+Use 'parallel(I.foo, I.bar)' in the story definition.
+""".strip()
+
+
+repeated_parallel_template = """
+Parallel group can not contain the same step twice: {names}
+""".strip()
+
+
+wrong_fan_out_message = """
+Fan-out can only map the story step over the context variable.
+
+Use 'fan_out(I.foo, over="items", item="item", into="results")' in the
+story definition.
+""".strip()
+
+
+wrong_fan_out_limit_message = "Fan-out limit should be a positive integer"
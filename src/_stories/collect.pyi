@@ -1,5 +1,32 @@
 from typing import Any
 from typing import Callable
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
-def collect_story(f: Callable[[Any], None]) -> List[str]: ...
+def collect_story(f: Callable[[Any], None]) -> List[Union[str, Tuple[str, ...]]]: ...
+
+class CollectedName:
+    calls: List[Union[str, Tuple[str, ...]]]
+    name: str
+    def __init__(self, calls: List[Union[str, Tuple[str, ...]]], name: str) -> None: ...
+
+def parallel(*names: CollectedName) -> None: ...
+def fan_out(
+    name: CollectedName,
+    over: str,
+    item: str,
+    into: str,
+    limit: Optional[int] = ...,
+) -> None: ...
+
+class FanOutCall:
+    name: str
+    over: str
+    item: str
+    into: str
+    limit: Optional[int]
+    def __init__(
+        self, name: str, over: str, item: str, into: str, limit: Optional[int]
+    ) -> None: ...
@@ -66,3 +66,175 @@ try:
 except ImportError:
     # Prettyprinter package is not installed.
     from pprint import pformat  # noqa
+
+
+try:
+    from threading import get_ident
+except ImportError:
+    # We are on Python 2.7
+    from thread import get_ident  # type: ignore  # noqa
+
+
+try:
+    from time import perf_counter
+except ImportError:
+    # We are on Python 2.7
+    from time import time as perf_counter  # type: ignore  # noqa
+
+
+try:
+    from contextvars import ContextVar, copy_context
+except ImportError:
+    # We are on Python 3.6 or older.  Values of context variables are
+    # kept per thread, or per asyncio task while the task is running.
+    # New task gets the copy of values of the task which created it.
+    # Other threads get them through the copy of the context.  Task
+    # factory of the loop is wrapped, not replaced.
+    import threading
+    from weakref import WeakKeyDictionary
+
+    try:
+        from asyncio import _get_running_loop, Task
+    except ImportError:
+        # We are on Python 2.7
+        _get_running_loop = None
+
+    local = threading.local()
+    tasks = WeakKeyDictionary()  # type: ignore
+
+    class ContextVar(object):  # type: ignore
+        def __init__(self, name, default):
+            self.name = name
+            self.default = default
+
+        def get(self):
+            return current_values().get(self, self.default)
+
+        def set(self, value):
+            current_values()[self] = value
+
+    class Context(object):
+        def __init__(self, values):
+            self.values = values
+
+        def run(self, f, *args, **kwargs):
+            previous = getattr(local, "values", None)
+            local.values = self.values
+            try:
+                return f(*args, **kwargs)
+            finally:
+                local.values = previous
+
+    def copy_context():  # type: ignore
+        return Context(dict(current_values()))
+
+    def current_values():  # type: ignore
+        task = current_task()
+        if task is not None:
+            values = tasks.get(task)
+            if values is None:
+                values = tasks[task] = dict(thread_values())
+            return values
+        return thread_values()
+
+    def thread_values():  # type: ignore
+        values = getattr(local, "values", None)
+        if values is None:
+            values = local.values = {}
+        return values
+
+    def current_task():  # type: ignore
+        if _get_running_loop is None:
+            return None
+        loop = _get_running_loop()
+        if loop is None:
+            return None
+        factory = loop.get_task_factory()
+        if type(factory) is not TaskFactory:
+            loop.set_task_factory(TaskFactory(factory))
+        return Task.current_task(loop)
+
+    class TaskFactory(object):
+        def __init__(self, factory):
+            self.factory = factory
+
+        def __call__(self, loop, coro):
+            values = current_values()
+            if self.factory is None:
+                task = Task(coro, loop=loop)
+            else:
+                task = self.factory(loop, coro)
+            tasks[task] = dict(values)
+            return task
+
+
+try:
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+except ImportError:
+    # We are on Python 2.7 and futures package is not installed.  Calls
+    # will be done one after another in the current thread.
+    FIRST_COMPLETED = "FIRST_COMPLETED"
+
+    class ThreadPoolExecutor(object):  # type: ignore
+        def __init__(self, max_workers=None):
+            pass
+
+        def submit(self, f, *args):
+            return CompletedFuture(f(*args))
+
+        def shutdown(self, wait=True):
+            pass
+
+    class CompletedFuture(object):
+        def __init__(self, value):
+            self.value = value
+
+        def result(self):
+            return self.value
+
+        def cancel(self):
+            return False
+
+    def wait(fs, return_when):  # type: ignore
+        return set(fs), set()
+
+
+try:
+    from asyncio import ensure_future, get_event_loop, shield
+except ImportError:
+    # We are on Python 2.7
+    ensure_future = None
+    get_event_loop = None
+    shield = None
+
+
+try:
+    from os import replace
+except ImportError:
+    # We are on Python 2.7
+    from os import rename as replace  # noqa
+
+
+try:
+    from multiprocessing.resource_tracker import ensure_running
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    # We are on Python 3.7 or older.  Large buffers are pickled with
+    # the rest of the value.
+    ensure_running = None
+    SharedMemory = None
+
+
+try:
+    # Buffers are only passed out of band, nothing is unpickled here.
+    from pickle import PickleBuffer  # nosec: B403
+except ImportError:
+    # We are on Python 3.7 or older.
+    PickleBuffer = None
+
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:
+    # We are on Python 3.13 or older.
+    InterpreterPoolExecutor = None
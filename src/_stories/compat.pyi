@@ -0,0 +1,35 @@
+from asyncio import ensure_future as ensure_future
+from asyncio import get_event_loop as get_event_loop
+from asyncio import shield as shield
+from concurrent.futures import FIRST_COMPLETED as FIRST_COMPLETED
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor as ThreadPoolExecutor
+from concurrent.futures import wait as wait
+from contextvars import ContextVar as ContextVar
+from contextvars import copy_context as copy_context
+from enum import Enum as Enum
+from enum import EnumMeta as EnumMeta
+from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+from os import replace as replace
+from pickle import PickleBuffer as _PickleBuffer
+from pprint import pformat as pformat
+from textwrap import indent as indent
+from threading import get_ident as get_ident
+from time import perf_counter as perf_counter
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Type
+
+from cerberus import Validator as CerberusSpec
+from marshmallow.schema import SchemaMeta as MarshmallowSpec
+from pydantic.error_wrappers import ErrorWrapper as PydanticError
+from pydantic.fields import Shape as PydanticShape
+from pydantic.main import MetaModel as PydanticSpec
+
+def pydantic_display(v: Any) -> str: ...
+
+ensure_running: Optional[Callable[[], None]]
+SharedMemory: Optional[Type[_SharedMemory]]
+PickleBuffer: Optional[Type[_PickleBuffer]]
+InterpreterPoolExecutor: Optional[Type[Executor]]
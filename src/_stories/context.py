@@ -1,8 +1,12 @@
 import textwrap
 from collections import OrderedDict
 from decimal import Decimal
+from pickle import dumps  # nosec: B403
+from pickle import HIGHEST_PROTOCOL  # nosec: B403
+from pickle import loads  # nosec: B403
 
 from _stories.compat import indent
+from _stories.compat import PickleBuffer
 from _stories.exceptions import MutationError
 
 
@@ -23,10 +27,14 @@ def make_context(contract, kwargs, history):
         for arg in sorted(contract.argset)
         if arg in kwargs
     )
+    return restore_context(ns, ["Story argument"] * len(ns), history)
+
+
+def restore_context(ns, lines, history):
     ctx = Context()
     ctx.__dict__["_Context__ns"] = ns
     ctx.__dict__["_Context__history"] = history
-    ctx.__dict__["_Context__lines"] = ["Story argument"] * len(ns)
+    ctx.__dict__["_Context__lines"] = lines
     return ctx
 
 
@@ -55,6 +63,7 @@ class Context(object):
             "_Context__ns",
             "_Context__history",
             "_Context__lines",
+            "_Context__effects",
         }
         scope = set(self.__ns)
         attributes = sorted(parent | current | scope)
@@ -67,10 +76,90 @@ class Context(object):
     __nonzero__ = __bool__
 
 
-def assign_namespace(ctx, method, kwargs):
+# Detached context holds variables which could be pickled and the
+# representation of the original context.  It is used to pass the
+# context to the other process.  Each variable is pickled once when
+# the context is detached.  Its buffers are kept out of band, so the
+# pool could move them through shared memory without a copy.  The
+# variable is unpickled on first access.  Variables which could not be
+# pickled are dropped.  Pickled data never leaves the application: it
+# goes to its own worker processes, job queue, or the detached summary
+# itself.
+
+
+class DetachedContext(object):
+    def __init__(self, ns, representation):
+        self.__dict__["_DetachedContext__ns"] = ns
+        self.__dict__["_DetachedContext__repr"] = representation
+        self.__dict__["_DetachedContext__values"] = {}
+
+    def __getattr__(self, name):
+        try:
+            return self.__values[name]
+        except KeyError:
+            pass
+        try:
+            data, buffers = self.__ns[name]
+        except KeyError:
+            raise AttributeError(
+                ATTRIBUTE_ERROR_MSG.format(obj="DetachedContext", attr=name, ctx=self)
+            )
+        value = self.__values[name] = load(data, buffers)
+        return value
+
+    def __setattr__(self, name, value):
+        raise MutationError(assign_attribute_message)
+
+    def __delattr__(self, name):
+        raise MutationError(delete_attribute_message)
+
+    def __repr__(self):
+        return self.__repr
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(self.__ns))
+
+    def __reduce__(self):
+        return DetachedContext, (self.__ns, self.__repr)
+
+
+def detach_context(ctx):
+    ns = OrderedDict()
+    for key, value in ctx._Context__ns.items():
+        try:
+            ns[key] = dump(value)
+        except Exception:  # nosec: B112
+            continue
+    return DetachedContext(ns, repr(ctx))
+
+
+def dump(value):
+    if PickleBuffer is None:
+        return dumps(value, protocol=HIGHEST_PROTOCOL), []
+    buffers = []
+    data = dumps(value, protocol=5, buffer_callback=buffers.append)
+    return data, buffers
+
+
+def load(data, buffers):
+    if PickleBuffer is None:
+        return loads(data)  # nosec: B301
+    return loads(data, buffers=buffers)  # nosec: B301
+
+
+def get_namespace(ctx):
+    return ctx._Context__ns
+
+
+def get_history(ctx):
+    return ctx._Context__history
+
+
+def assign_namespace(ctx, method, kwargs, checkpoint):
     ctx._Context__ns.update((arg, kwargs[arg]) for arg in sorted(kwargs))
     line = "Set by %s.%s" % (method.__self__.__class__.__name__, method.__name__)
     ctx._Context__lines.extend([line] * len(kwargs))
+    checkpoint.record(method, kwargs)
 
 
 def history_representation(ctx):
@@ -1,10 +1,14 @@
+from pickle import PickleBuffer
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import NoReturn
+from typing import Tuple
 from typing import Union
 
+from _stories.checkpoint import Checkpoint
+from _stories.checkpoint import NullCheckpoint
 from _stories.contract import NullContract
 from _stories.contract import SpecContract
 from _stories.history import History
@@ -14,6 +18,9 @@ def make_context(
     kwargs: Dict[str, Any],
     history: History,
 ) -> Context: ...
+def restore_context(
+    ns: Dict[str, Any], lines: List[str], history: History
+) -> Context: ...
 
 class Context:
     def __getattr__(self, name: str) -> Any: ...
@@ -23,8 +30,29 @@ class Context:
     def __dir__(self) -> List[str]: ...
     def __bool__(self) -> NoReturn: ...
 
+class DetachedContext:
+    def __init__(
+        self, ns: Dict[str, Tuple[bytes, List[PickleBuffer]]], representation: str
+    ) -> None: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def __setattr__(self, name: str, value: Any) -> NoReturn: ...
+    def __delattr__(self, name: str) -> NoReturn: ...
+    def __repr__(self) -> str: ...
+    def __dir__(self) -> List[str]: ...
+    def __reduce__(
+        self,
+    ) -> Tuple[type, Tuple[Dict[str, Tuple[bytes, List[PickleBuffer]]], str]]: ...
+
+def detach_context(ctx: Context) -> DetachedContext: ...
+def dump(value: Any) -> Tuple[bytes, List[PickleBuffer]]: ...
+def load(data: bytes, buffers: List[PickleBuffer]) -> Any: ...
+def get_namespace(ctx: Context) -> Dict[str, Any]: ...
+def get_history(ctx: Context) -> History: ...
 def assign_namespace(
-    ctx: Context, method: Callable, kwargs: Dict[str, Any]
+    ctx: Context,
+    method: Callable,
+    kwargs: Dict[str, Any],
+    checkpoint: Union[Checkpoint, NullCheckpoint],
 ) -> None: ...
 def history_representation(ctx: Context) -> str: ...
 def context_representation(ctx: Context, repr_func: Callable = ...) -> str: ...
@@ -0,0 +1,340 @@
+# type: ignore
+from collections import OrderedDict
+
+import numpy
+
+from _stories.context import restore_context
+from _stories.contract import NullContract
+from _stories.exceptions import ContextContractError
+from _stories.exceptions import MutationError
+from _stories.history import History
+from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
+from _stories.marker import EndOfStory
+from _stories.marker import Parallel
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+
+# FIXME: Type me.
+
+
+# Markers.
+
+
+def columnar(f):
+    f.stories_columnar = True
+    return f
+
+
+class Where(object):
+    def __init__(self, mask, then, otherwise):
+        self.mask = numpy.asarray(mask, dtype=bool)
+        self.then = then
+        self.otherwise = otherwise
+
+
+def where(mask, then, otherwise):
+    return Where(mask, then, otherwise)
+
+
+# Run.
+
+
+def run_columns(story, **columns):
+    missing = set(story.arguments) - set(columns)
+    unknown = set(columns) - set(story.arguments)
+    if missing or unknown:
+        message = wrong_columns_template.format(
+            cls=story.cls_name,
+            method=story.name,
+            missing=", ".join(sorted(missing)),
+            unknown=", ".join(sorted(unknown)),
+        )
+        raise ContextContractError(message)
+    columns = OrderedDict(
+        (name, numpy.asarray(columns[name])) for name in sorted(columns)
+    )
+    sizes = {len(column) for column in columns.values()}
+    if len(sizes) > 1:
+        raise ContextContractError(wrong_size_message)
+    size = sizes.pop() if sizes else 0
+    columns = check_arguments(story.methods[0][1], columns, size)
+    rows = Rows(size, columns)
+    execute(rows, story.methods)
+    return ColumnSummary(rows)
+
+
+def execute(rows, methods):
+    for method, contract, protocol in methods:
+
+        method_type = type(method)
+
+        if method_type is BeginningOfStory:
+            rows.skipped[rows.skipped > 0] += 1
+            continue
+
+        if method_type is EndOfStory:
+            rows.skipped[rows.skipped > 0] -= 1
+            continue
+
+        if method_type is Parallel or method_type is Dataflow:
+            members = method.methods
+        else:
+            members = [method]
+
+        for member in members:
+            live = numpy.flatnonzero(rows.active & (rows.skipped == 0))
+            if not len(live):
+                break
+            if getattr(member, "stories_columnar", False):
+                outcome = member(ColumnContext(rows, live))
+                apply_columns(
+                    rows, member, contract, protocol, outcome, live, slice(None)
+                )
+            else:
+                contexts = [row_context(rows, row) for row in live]
+                outcomes = [member(ctx) for ctx in contexts]
+                apply_rows(rows, member, contract, protocol, outcomes, live, contexts)
+
+
+class Rows(object):
+    def __init__(self, size, columns):
+        self.size = size
+        self.columns = columns
+        self.present = {name: numpy.ones(size, dtype=bool) for name in columns}
+        self.active = numpy.ones(size, dtype=bool)
+        self.skipped = numpy.zeros(size, dtype=int)
+        self.failed_on = numpy.full(size, None, dtype=object)
+        self.reasons = numpy.full(size, None, dtype=object)
+        self.values = numpy.full(size, None, dtype=object)
+
+    def assign(self, name, rows, values):
+        values = numpy.asarray(values)
+        column = self.columns.get(name)
+        if column is None:
+            if values.dtype.kind in "biufc":
+                column = numpy.zeros(self.size, dtype=values.dtype)
+            else:
+                column = numpy.full(self.size, None, dtype=object)
+            self.columns[name] = column
+            self.present[name] = numpy.zeros(self.size, dtype=bool)
+        else:
+            dtype = widen(column.dtype, values.dtype)
+            if dtype != column.dtype:
+                column = self.columns[name] = column.astype(dtype)
+        column[rows] = values
+        self.present[name][rows] = True
+
+    def finish(self, rows, values):
+        self.values[rows] = values
+        self.active[rows] = False
+
+    def fail(self, rows, method, protocol, reason):
+        protocol.check_return_statement(method, reason)
+        self.failed_on[rows] = method.__name__
+        self.reasons[rows] = reason
+        self.active[rows] = False
+
+
+# Columns keep their type while assigned values fit into it.  Numbers
+# are widened to the common type.  Other mixes become object columns.
+
+
+def widen(current, assigned):
+    if current.kind in "biufc" and assigned.kind in "biufc":
+        return numpy.result_type(current, assigned)
+    return numpy.dtype(object)
+
+
+def apply_columns(rows, method, contract, protocol, outcome, live, positions):
+    kind = type(outcome)
+    selected = live[positions]
+    if kind is Where:
+        mask = outcome.mask[positions]
+        indices = numpy.arange(len(live))[positions]
+        apply_columns(
+            rows, method, contract, protocol, outcome.then, live, indices[mask]
+        )
+        apply_columns(
+            rows, method, contract, protocol, outcome.otherwise, live, indices[~mask]
+        )
+    elif kind is Success:
+        columns = OrderedDict(
+            (name, select(value, positions))
+            for name, value in sorted(outcome.kwargs.items())
+        )
+        columns = check_columns(rows, method, contract, selected, columns)
+        for name, values in columns.items():
+            rows.assign(name, selected, values)
+    elif kind is Result:
+        rows.finish(selected, select(outcome.value, positions))
+    elif kind is Failure:
+        rows.fail(selected, method, protocol, outcome.reason)
+    elif kind is Skip:
+        rows.skipped[selected] = 1
+    else:
+        raise AssertionError
+
+
+def select(value, positions):
+    value = numpy.asarray(value)
+    if value.ndim == 0:
+        return value
+    return value[positions]
+
+
+# Variables set by the columnar step are checked by the story contract.
+# Without the contract spec, only the override of the variable is
+# checked and it is checked for the whole column at once.  Otherwise,
+# values are validated row by row and replaced with the normalized
+# ones.
+
+
+def check_columns(rows, method, contract, selected, columns):
+    if type(contract) is NullContract:
+        for name, values in columns.items():
+            present = rows.present.get(name)
+            if present is not None and present[selected].any():
+                position = numpy.flatnonzero(present[selected])[0]
+                ns = {name: row_value(values, position)}
+                ctx = row_context(rows, selected[position])
+                contract.check_success_statement(method, ctx, ns)
+        return columns
+    checked = OrderedDict((name, []) for name in columns)
+    for position, row in enumerate(selected):
+        ns = OrderedDict(
+            (name, row_value(values, position)) for name, values in columns.items()
+        )
+        kwargs = contract.check_success_statement(method, row_context(rows, row), ns)
+        for name in columns:
+            checked[name].append(kwargs[name])
+    return checked
+
+
+def check_arguments(contract, columns, size):
+    if type(contract) is NullContract or not size:
+        return columns
+    checked = OrderedDict((name, []) for name in columns)
+    for row in range(size):
+        kwargs = contract.check_story_call(
+            OrderedDict(
+                (name, row_value(values, row)) for name, values in columns.items()
+            )
+        )
+        for name in columns:
+            checked[name].append(kwargs[name])
+    return OrderedDict(
+        (name, numpy.asarray(values)) for name, values in checked.items()
+    )
+
+
+def row_value(values, position):
+    value = values[()] if values.ndim == 0 else values[position]
+    return value.item() if isinstance(value, numpy.generic) else value
+
+
+def apply_rows(rows, method, contract, protocol, outcomes, live, contexts):
+    assigned = OrderedDict()
+    for row, outcome, ctx in zip(live, outcomes, contexts):
+        kind = type(outcome)
+        if kind is Success:
+            kwargs = contract.check_success_statement(method, ctx, outcome.kwargs)
+            for name, value in kwargs.items():
+                assigned.setdefault(name, ([], []))
+                assigned[name][0].append(row)
+                assigned[name][1].append(value)
+        elif kind is Result:
+            rows.finish(row, outcome.value)
+        elif kind is Failure:
+            rows.fail(row, method, protocol, outcome.reason)
+        elif kind is Skip:
+            rows.skipped[row] = 1
+        else:
+            raise AssertionError
+    for name, (selected, values) in assigned.items():
+        rows.assign(name, selected, values)
+
+
+# Context.
+
+
+class ColumnContext(object):
+    def __init__(self, rows, live):
+        self.__dict__["_ColumnContext__rows"] = rows
+        self.__dict__["_ColumnContext__live"] = live
+
+    def __getattr__(self, name):
+        rows = self.__rows
+        if name not in rows.columns or not rows.present[name][self.__live].all():
+            raise AttributeError(name)
+        return rows.columns[name][self.__live]
+
+    def __setattr__(self, name, value):
+        raise MutationError(assign_attribute_message)
+
+    def __delattr__(self, name):
+        raise MutationError(assign_attribute_message)
+
+    def __len__(self):
+        return len(self.__live)
+
+
+def row_context(rows, row):
+    ns = OrderedDict(
+        (name, column[row].item() if column.dtype != object else column[row])
+        for name, column in rows.columns.items()
+        if rows.present[name][row]
+    )
+    return restore_context(ns, ["Column"] * len(ns), History())
+
+
+# Summary.
+
+
+class ColumnSummary(object):
+    def __init__(self, rows):
+        self.columns = rows.columns
+        self.is_failure = rows.failed_on.astype(bool)
+        self.is_success = ~self.is_failure
+        self.value = rows.values
+        self.__failed_on = rows.failed_on
+        self.__reasons = rows.reasons
+
+    def failed_on(self, method_name):
+        return self.__failed_on == method_name
+
+    def failed_because(self, reason):
+        return numpy.array([found == reason for found in self.__reasons], dtype=bool)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return "ColumnSummary(rows=%d, failed=%d)" % (
+            len(self),
+            self.is_failure.sum(),
+        )
+
+
+# Messages.
+
+
+wrong_columns_template = """
+Columns should match story arguments: {cls}.{method}
+
+Missing: {missing}
+Unknown: {unknown}
+""".strip()
+
+
+wrong_size_message = "Columns should have the same length"
+
+
+assign_attribute_message = """
+Column context object is immutable.
+
+Use Success() keyword arguments to set columns.
+""".strip()
@@ -3,7 +3,11 @@ from debug_toolbar.panels import Panel
 from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import ungettext_lazy as __
 
-import _stories.context
+from _stories.contrib.debug_toolbars.stats import make_stats
+from _stories.contrib.queries import QueryTracker
+from _stories.instrument import add_instruments
+from _stories.instrument import Collector
+from _stories.instrument import remove_instruments
 
 
 # FIXME: Test me.
@@ -11,17 +15,6 @@ import _stories.context
 # FIXME: Type me.
 
 
-origin_context_init = _stories.context.Context.__init__
-
-
-def track_context(storage):
-    def wrapper(ctx):
-        origin_context_init(ctx)
-        storage.append(ctx)
-
-    return wrapper
-
-
 class StoriesPanel(Panel):
 
     # Implement the Panel API
@@ -32,12 +25,12 @@ class StoriesPanel(Panel):
 
     @property
     def nav_subtitle(self):
-        count = len(self.storage)
+        count = len(self.collector.runs)
         return __("%(count)d call", "%(count)d calls", count) % {"count": count}
 
     @property
     def title(self):
-        count = len(self.storage)
+        count = len(self.collector.runs)
         return __(
             "Context and execution path of %(count)d story",
             "Context and execution path of %(count)d stories",
@@ -48,13 +41,16 @@ class StoriesPanel(Panel):
 
     def __init__(self, *args, **kwargs):
         super(StoriesPanel, self).__init__(*args, **kwargs)
-        self.storage = []
+        self.collector = Collector()
+        self.tracker = QueryTracker(())
 
     def enable_instrumentation(self):
-        _stories.context.Context.__init__ = track_context(self.storage)
+        add_instruments(self.collector)
+        self.tracker.enable()
 
     def disable_instrumentation(self):
-        _stories.context.Context.__init__ = origin_context_init
+        self.tracker.disable()
+        remove_instruments(self.collector)
 
     def generate_stats(self, request, response):
-        self.record_stats({"stories": self.storage})
+        self.record_stats({"stories": make_stats(self.collector.runs)})
@@ -1,26 +1,19 @@
 # type: ignore
+from flask import current_app
+from flask import g
 from flask import render_template
+from flask import request_tearing_down
 from flask_debugtoolbar.panels import DebugPanel
 
-import _stories.context
+from _stories.contrib.debug_toolbars.stats import make_stats
+from _stories.instrument import add_instruments
+from _stories.instrument import Collector
+from _stories.instrument import remove_instruments
 
 
-# FIXME: Test me.
-#
 # FIXME: Type me.
 
 
-original_context_init = _stories.context.Context.__init__
-
-
-def track_context(storage):
-    def wrapper(ctx):
-        original_context_init(ctx)
-        storage.append(ctx)
-
-    return wrapper
-
-
 def pluralize(number, singular, plural=None):
     if plural is None:
         plural = singular + "s"
@@ -30,24 +23,30 @@ def pluralize(number, singular, plural=None):
         return "%d %s" % (number, plural)
 
 
+def disable_instrumentation(sender, **extra):
+    panel = g.pop("stories_panel", None)
+    if panel is not None:
+        panel.disable_instrumentation()
+
+
 class StoriesPanel(DebugPanel):
     name = "Stories"
     has_content = True
 
     def __init__(self, *args, **kwargs):
         super(StoriesPanel, self).__init__(*args, **kwargs)
-        self.storage = []
+        self.collector = Collector()
         self.enable_instrumentation()
 
     def nav_title(self):
         return "Stories"
 
     def nav_subtitle(self):
-        count = len(self.storage)
+        count = len(self.collector.runs)
         return pluralize(count, "call")
 
     def title(self):
-        count = len(self.storage)
+        count = len(self.collector.runs)
         return "Context and execution path of %s" % pluralize(count, "story", "stories")
 
     def url(self):
@@ -55,11 +54,19 @@ class StoriesPanel(DebugPanel):
 
     def content(self):
         return render_template(
-            "stories/debug_toolbar/stories_panel.html", stories=self.storage
+            "stories/debug_toolbar/stories_panel.html",
+            stories=make_stats(self.collector.runs),
         )
 
     def enable_instrumentation(self):
-        _stories.context.Context.__init__ = track_context(self.storage)
+        # Older toolbar versions do not call init_app of panels, and
+        # teardown functions can not be added after the first request.
+        # Connecting the same receiver again does nothing.
+        request_tearing_down.connect(
+            disable_instrumentation, current_app._get_current_object()
+        )
+        g.stories_panel = self
+        add_instruments(self.collector)
 
     def disable_instrumentation(self):
-        _stories.context.Context.__init__ = original_context_init
+        remove_instruments(self.collector)
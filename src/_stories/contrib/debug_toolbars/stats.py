@@ -0,0 +1,35 @@
+# type: ignore
+# FIXME: Type me.
+
+
+def make_stats(runs):
+    return [
+        {
+            "context": repr(run.ctx),
+            "duration": sum(step.duration for step in run.steps) * 1000,
+            "queries": sum(
+                step.data["queries"].count
+                for step in run.steps
+                if "queries" in step.data
+            ),
+            "steps": [make_step_stats(step) for step in run.steps],
+        }
+        for run in runs
+    ]
+
+
+def make_step_stats(step):
+    stats = {
+        "name": step.qualname,
+        "story": " > ".join(step.path),
+        "duration": step.duration * 1000,
+    }
+    queries = step.data.get("queries")
+    if queries is not None:
+        stats["queries"] = {
+            "count": queries.count,
+            "duration": queries.duration * 1000,
+            "duplicates": sorted(queries.duplicates.items()),
+            "similar": sorted(queries.similar.items()),
+        }
+    return stats
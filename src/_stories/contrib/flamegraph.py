@@ -0,0 +1,113 @@
+# type: ignore
+import json
+import os
+from collections import Counter
+from collections import deque
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from _stories.compat import get_ident
+from _stories.instrument import Instrument
+from _stories.instrument import instrumented
+
+
+# FIXME: Type me.
+
+
+# Collapsed stacks are aggregated, so their size does not grow with the
+# number of recorded runs.  Trace events are recorded only on request
+# and only the last `limit` of them are kept.
+
+
+class Recorder(Instrument):
+    def __init__(self, trace, limit):
+        self.trace = trace
+        self.stacks = Counter()
+        self.events = deque(maxlen=limit)
+        self.nested = {}
+
+    def step_finished(self, step):
+        nested = self.nested.pop(step, 0)
+        if step.parent is not None:
+            self.nested[step.parent] = self.nested.get(step.parent, 0) + step.duration
+        self.stacks[step_frames(step)] += to_microseconds(step.duration - nested)
+        if self.trace:
+            self.events.append(
+                (
+                    get_ident(),
+                    step.run_id,
+                    step.path,
+                    step.qualname,
+                    step.started + (step.waited or 0.0),
+                    step.duration,
+                    step_outcome(step),
+                )
+            )
+
+    def collapsed(self):
+        return "".join(
+            "%s %d\n" % (";".join(frames), weight)
+            for frames, weight in sorted(self.stacks.items())
+        )
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        stories = OrderedDict()
+        for tid, run_id, path, qualname, started, duration, outcome in self.events:
+            events.append(
+                {
+                    "name": qualname,
+                    "cat": "step",
+                    "ph": "X",
+                    "ts": to_microseconds(started),
+                    "dur": to_microseconds(duration),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"story": " > ".join(path), "outcome": outcome},
+                }
+            )
+            for depth in range(1, len(path) + 1):
+                key = (tid, run_id, path[:depth])
+                start, end = stories.get(key, (started, started + duration))
+                stories[key] = (min(start, started), max(end, started + duration))
+        for (tid, _run_id, path), (start, end) in stories.items():
+            events.append(
+                {
+                    "name": path[-1],
+                    "cat": "story",
+                    "ph": "X",
+                    "ts": to_microseconds(start),
+                    "dur": to_microseconds(end - start),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"story": " > ".join(path)},
+                }
+            )
+        events.sort(key=lambda event: (event["tid"], event["ts"], -event["dur"]))
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def step_frames(step):
+    frames = ()
+    while step is not None:
+        frames = step.path + (step.name,) + frames
+        step = step.parent
+    return frames
+
+
+def step_outcome(step):
+    if step.error is not None:
+        return step.error.__class__.__name__
+    return step.result.__class__.__name__
+
+
+def to_microseconds(seconds):
+    return int(round(seconds * 1000000))
+
+
+@contextmanager
+def record(trace=False, limit=100000):
+    recorder = Recorder(trace, limit)
+    with instrumented(recorder):
+        yield recorder
@@ -0,0 +1,148 @@
+# type: ignore
+import tracemalloc
+from contextlib import contextmanager
+
+from _stories.compat import get_ident
+from _stories.exceptions import StoryError
+from _stories.instrument import Instrument
+from _stories.instrument import instrumented
+
+
+# FIXME: Type me.
+
+
+# Peak allocation of the step is measured by the reset of the
+# tracemalloc peak when the step starts.  The peak is global to the
+# process, so it is measured only on request, and concurrent stories
+# reset peaks of each other.
+
+
+reset_peak = getattr(tracemalloc, "reset_peak", None)
+
+
+class StepAllocation(object):
+    def __init__(self, net, peak, sites):
+        self.net = net
+        self.peak = peak
+        self.sites = sites
+
+    def __repr__(self):
+        return "StepAllocation(net=%d, peak=%r, sites=%r)" % (
+            self.net,
+            self.peak,
+            self.sites,
+        )
+
+
+class AllocationSite(object):
+    def __init__(self, filename, lineno, size, count):
+        self.filename = filename
+        self.lineno = lineno
+        self.size = size
+        self.count = count
+
+    def __repr__(self):
+        return "AllocationSite(%s:%d, size=%d, count=%d)" % (
+            self.filename,
+            self.lineno,
+            self.size,
+            self.count,
+        )
+
+
+class AllocationTracker(Instrument):
+    def __init__(self, top, peak):
+        self.top = top
+        self.peak = peak
+        self.steps = []
+        self.running = {}
+
+    def step_started(self, step):
+        stack = self.running.setdefault(get_ident(), [])
+        before, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        snapshot = take_snapshot() if self.top else None
+        current = tracemalloc.get_traced_memory()[0]
+        stack.append(RunningStep(current, current - before, snapshot))
+        if self.peak:
+            reset_peak()
+
+    def step_finished(self, step):
+        stack = self.running[get_ident()]
+        running = stack.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(running.peak, peak)
+        if stack:
+            # Snapshot of the nested step is not a part of the parent step.
+            stack[-1].peak = max(stack[-1].peak, peak - running.overhead)
+        if self.top:
+            sites = compare_snapshots(take_snapshot(), running.snapshot, self.top)
+        else:
+            sites = []
+        allocation = StepAllocation(
+            current - running.current,
+            peak - running.current if self.peak else None,
+            sites,
+        )
+        step.data["memory"] = allocation
+        self.steps.append((step.qualname, allocation))
+        del running
+        if stack and self.peak:
+            reset_peak()
+
+
+class RunningStep(object):
+    def __init__(self, current, overhead, snapshot):
+        self.current = current
+        self.peak = current
+        self.overhead = overhead
+        self.snapshot = snapshot
+
+
+def take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+
+
+def compare_snapshots(after, before, top):
+    statistics = [
+        statistic
+        for statistic in after.compare_to(before, "lineno")
+        if statistic.size_diff > 0
+    ]
+    return [
+        AllocationSite(
+            statistic.traceback[0].filename,
+            statistic.traceback[0].lineno,
+            statistic.size_diff,
+            statistic.count_diff,
+        )
+        for statistic in statistics[:top]
+    ]
+
+
+@contextmanager
+def track_allocations(top=10, peak=False):
+    if peak and reset_peak is None:
+        raise StoryError(peak_unavailable_message)
+    tracker = AllocationTracker(top, peak)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        with instrumented(tracker):
+            yield tracker
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+# Messages.
+
+
+peak_unavailable_message = "Peak allocation of the step requires Python 3.9 or newer"
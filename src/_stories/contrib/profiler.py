@@ -0,0 +1,133 @@
+# type: ignore
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from _stories.compat import get_ident
+from _stories.instrument import current_steps
+from _stories.instrument import Instrument
+from _stories.instrument import instrumented
+
+
+# FIXME: Type me.
+
+
+def step_selected(selected, step):
+    if not selected:
+        return True
+    return (
+        step.name in selected
+        or step.qualname in selected
+        or any(story in selected for story in step.path)
+    )
+
+
+# Deterministic profiler.
+
+
+class Profiler(Instrument):
+    def __init__(self, selected):
+        self.selected = selected
+        self.profiles = {}
+        self.running = {}
+
+    def step_started(self, step):
+        thread_id = get_ident()
+        if thread_id in self.running or not step_selected(self.selected, step):
+            return
+        profile = self.profiles.get(step.qualname)
+        if profile is None:
+            profile = self.profiles[step.qualname] = cProfile.Profile()
+        self.running[thread_id] = (step, profile)
+        profile.enable()
+
+    def step_finished(self, step):
+        thread_id = get_ident()
+        running = self.running.get(thread_id)
+        if running is None or running[0] is not step:
+            return
+        running[1].disable()
+        del self.running[thread_id]
+
+    @property
+    def stats(self):
+        return {
+            qualname: pstats.Stats(profile)
+            for qualname, profile in self.profiles.items()
+        }
+
+
+@contextmanager
+def profile(*steps):
+    profiler = Profiler(set(steps))
+    with instrumented(profiler):
+        yield profiler
+
+
+# Statistical profiler.
+
+
+class Sampler(Instrument):
+    def __init__(self, selected, interval):
+        self.selected = selected
+        self.interval = interval
+        self.samples = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.loop, name="stories-sampler")
+        self.thread.daemon = True
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def loop(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        frames = sys._current_frames()
+        for thread_id, step in list(current_steps.items()):
+            frame = frames.get(thread_id)
+            if frame is None or not step_selected(self.selected, step):
+                continue
+            stack = collect_stack(frame, step)
+            counter = self.samples.setdefault(step.qualname, Counter())
+            counter[stack] += 1
+
+    @property
+    def counts(self):
+        return {
+            qualname: sum(counter.values())
+            for qualname, counter in self.samples.items()
+        }
+
+
+def collect_stack(frame, step):
+    code = getattr(step.method, "__code__", None)
+    stack = []
+    while frame is not None:
+        stack.append(
+            "%s (%s:%d)"
+            % (frame.f_code.co_name, frame.f_code.co_filename, frame.f_lineno)
+        )
+        if frame.f_code is code:
+            break
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+@contextmanager
+def sample(*steps, **kwargs):
+    sampler = Sampler(set(steps), kwargs.pop("interval", 0.005))
+    with instrumented(sampler):
+        sampler.start()
+        try:
+            yield sampler
+        finally:
+            sampler.stop()
@@ -7,6 +7,8 @@ from _pytest.config import hookimpl
 
 import _stories.compat
 import _stories.context
+from _stories.instrument import Instrument
+from _stories.instrument import instrumented
 
 
 # FIXME: Test me.
@@ -14,15 +16,16 @@ import _stories.context
 # FIXME: Type me.
 
 
-origin_context_init = _stories.context.Context.__init__
+class ContextTracker(Instrument):
+    observe_steps = False
 
+    def __init__(self):
+        self.storage = []
 
-def track_context(storage):
-    def wrapper(ctx):
-        origin_context_init(ctx)
-        storage.append((get_test_source(*get_test_call()), ctx))
-
-    return wrapper
+    def story_started(self, run):
+        call = get_test_call()
+        src = None if call is None else get_test_source(*call)
+        self.storage.append((src, run.ctx))
 
 
 def get_test_call():
@@ -36,7 +39,8 @@ def get_test_call():
         ):
             return f.f_code.co_filename, f.f_lineno
         elif not f.f_back:
-            raise Exception("Can not find running test")
+            # Stories running in the threads started by the test.
+            return None
         else:
             f = f.f_back
 
@@ -62,17 +66,15 @@ def get_test_source(filename, lineno):
 
 @hookimpl(hookwrapper=True)
 def pytest_runtest_call(item):
-    storage = []
-    _stories.context.Context.__init__ = track_context(storage)
-    yield
-    _stories.context.Context.__init__ = origin_context_init
-    for i, (src, ctx) in enumerate(storage, 1):
-        output = "\n\n".join(
-            [
-                src,
-                _stories.context.history_representation(ctx)
-                + "\n\n"
-                + _stories.context.context_representation(ctx, _stories.compat.pformat),
-            ]
+    tracker = ContextTracker()
+    with instrumented(tracker):
+        yield
+    for i, (src, ctx) in enumerate(tracker.storage, 1):
+        output = (
+            _stories.context.history_representation(ctx)
+            + "\n\n"
+            + _stories.context.context_representation(ctx, _stories.compat.pformat)
         )
+        if src is not None:
+            output = src + "\n\n" + output
         item.add_report_section("call", "story #%d" % (i,), output)
@@ -0,0 +1,114 @@
+# type: ignore
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connections
+
+from _stories.compat import perf_counter
+from _stories.instrument import add_instruments
+from _stories.instrument import current_step
+from _stories.instrument import Instrument
+from _stories.instrument import remove_instruments
+
+
+# FIXME: Type me.
+
+
+class Query(object):
+    def __init__(self, alias, sql, params, many, duration):
+        self.alias = alias
+        self.sql = sql
+        self.params = params
+        self.many = many
+        self.duration = duration
+
+    def __repr__(self):
+        return "Query(%r, %r)" % (self.sql, self.params)
+
+
+class StepQueries(object):
+    def __init__(self):
+        self.queries = []
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(query.duration for query in self.queries)
+
+    @property
+    def duplicates(self):
+        counter = Counter(
+            (query.alias, query.sql, repr(query.params)) for query in self.queries
+        )
+        return {key[1]: number for key, number in counter.items() if number > 1}
+
+    @property
+    def similar(self):
+        counter = Counter((query.alias, query.sql) for query in self.queries)
+        return {key[1]: number for key, number in counter.items() if number > 1}
+
+    def __repr__(self):
+        return "StepQueries(count=%d, duplicates=%d)" % (
+            self.count,
+            sum(self.duplicates.values()),
+        )
+
+
+class QueryTracker(Instrument):
+    def __init__(self, using):
+        self.using = using
+        self.steps = []
+        self.wrappers = None
+
+    def step_started(self, step):
+        step.data["queries"] = StepQueries()
+
+    def step_finished(self, step):
+        self.steps.append((step.qualname, step.data["queries"]))
+
+    def enable(self):
+        self.wrappers = []
+        for alias in self.using or connections:
+            connection = connections[alias]
+            if not hasattr(connection, "execute_wrapper"):
+                # We are on Django 1.11 or older.  Queries are not tracked.
+                continue
+            wrapper = connection.execute_wrapper(QueryWrapper(alias))
+            wrapper.__enter__()
+            self.wrappers.append(wrapper)
+        add_instruments(self)
+
+    def disable(self):
+        remove_instruments(self)
+        for wrapper in reversed(self.wrappers):
+            wrapper.__exit__(None, None, None)
+        self.wrappers = None
+
+
+class QueryWrapper(object):
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - started
+            step = current_step()
+            if step is not None and "queries" in step.data:
+                query = Query(self.alias, sql, params, many, duration)
+                step.data["queries"].queries.append(query)
+
+
+@contextmanager
+def track_queries(*using):
+    tracker = QueryTracker(using)
+    tracker.enable()
+    try:
+        yield tracker
+    finally:
+        tracker.disable()
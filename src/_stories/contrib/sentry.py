@@ -2,7 +2,8 @@
 from raven.breadcrumbs import libraryhook
 from raven.breadcrumbs import record
 
-import _stories.context
+from _stories.instrument import install_instruments
+from _stories.instrument import Instrument
 
 
 # FIXME: Test me.
@@ -10,17 +11,18 @@ import _stories.context
 # FIXME: Type me.
 
 
-origin_context_init = _stories.context.Context.__init__
+class BreadcrumbTracker(Instrument):
+    observe_steps = False
 
-
-@libraryhook("stories")
-def track_context():
-    def wrapper(ctx):
-        origin_context_init(ctx)
+    def story_started(self, run):
+        ctx = run.ctx
         record(
             processor=lambda data: data.update(
                 {"category": "story", "message": repr(ctx)}
             )
         )
 
-    _stories.context.Context.__init__ = wrapper
+
+@libraryhook("stories")
+def track_context():
+    install_instruments(BreadcrumbTracker())
@@ -0,0 +1,246 @@
+from _stories.context import assign_namespace
+from _stories.context import get_namespace
+from _stories.contract import SpecContract
+from _stories.effects import defer_effects
+from _stories.exceptions import StoryDefinitionError
+from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
+from _stories.marker import EndOfStory
+from _stories.marker import Parallel
+from _stories.returned import Success
+
+
+try:
+    from dis import get_instructions
+except ImportError:
+    # We are on Python 2.7
+    get_instructions = None
+
+
+# Markers.
+
+
+class Infer(object):
+    pass
+
+
+def reads(*names):
+    if len(names) == 1 and callable(names[0]):
+        names[0].stories_reads = Infer
+        return names[0]
+
+    if any(not isinstance(name, str) for name in names):
+        message = "Step reads can only be defined with string type"
+        raise StoryDefinitionError(message)
+
+    def decorator(f):
+        f.stories_reads = names
+        return f
+
+    return decorator
+
+
+def get_reads(method, contract):
+    default = getattr(getattr(method, "__self__", None), "stories_reads", None)
+    names = getattr(method, "stories_reads", default)
+    if names is Infer:
+        return infer_reads(method, contract)
+    return names
+
+
+# Inference.
+
+
+ctx_loads = {"LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_BORROW"}
+
+
+attribute_loads = {"LOAD_ATTR", "LOAD_METHOD"}
+
+
+def infer_reads(method, contract):
+    code = getattr(getattr(method, "__func__", None), "__code__", None)
+    if get_instructions is None or code is None or code.co_argcount != 2:
+        return None
+    ctx_name = code.co_varnames[1]
+    if ctx_name in code.co_cellvars:
+        return None
+    names = []
+    instructions = list(get_instructions(code))
+    for instruction, following in zip(instructions, instructions[1:] + [None]):
+        argval = instruction.argval
+        if argval != ctx_name and not (type(argval) is tuple and ctx_name in argval):
+            continue
+        if instruction.opname not in ctx_loads:
+            return None
+        if following is None or following.opname not in attribute_loads:
+            return None
+        if following.argval not in names:
+            names.append(following.argval)
+    if type(contract) is SpecContract:
+        known = set(contract.argset) | set(contract.declared)
+        if not known.issuperset(names):
+            return None
+    return tuple(names)
+
+
+# Plan.
+
+
+def make_dataflow(methods, contract):
+    result = []
+    group = []
+    for entry in methods:
+        method, entry_contract, _protocol = entry
+        if entry_contract is contract and type(method) not in plan_markers:
+            names = get_reads(method, contract)
+            if names is not None:
+                group.append((entry, names))
+                continue
+        flush_dataflow(result, group, contract)
+        group = []
+        result.append(entry)
+    flush_dataflow(result, group, contract)
+    return result
+
+
+def flush_dataflow(result, group, contract):
+    if len(group) < 2:
+        result.extend(entry for entry, _names in group)
+        return
+    methods = [entry[0] for entry, _names in group]
+    names = [names for _entry, names in group]
+    protocol = group[0][0][2]
+    result.append((Dataflow(methods, names), contract, protocol))
+
+
+plan_markers = (BeginningOfStory, EndOfStory, Parallel, Dataflow)
+
+
+# Schedule.
+
+
+# Steps of the group are started as soon as the variables they read are
+# set.  Their results are committed to the context in the declaration
+# order, so the context and the history are the same as if steps were
+# called one after another.  Results of steps declared after the first
+# step which did not succeed are thrown away.
+
+
+class Schedule(object):
+    def __init__(self, group, ctx, contract, history, checkpoint):
+        self.methods = group.methods
+        self.reads = group.reads
+        self.ctx = ctx
+        self.contract = contract
+        self.history = history
+        self.checkpoint = checkpoint
+        self.initial = set(get_namespace(ctx))
+        self.produced = set()
+        self.pending = list(range(len(self.methods)))
+        self.running = 0
+        self.committed = 0
+        self.cutoff = len(self.methods)
+        self.finished = {}
+        self.stopped = (None, None, None)
+
+    def start(self):
+        waiting = [index for index in self.pending if index < self.cutoff]
+        ready = [index for index in waiting if self.is_ready(index)]
+        if not ready and not self.running:
+            ready = waiting[:1]
+        for index in ready:
+            self.pending.remove(index)
+        self.running += len(ready)
+        return ready
+
+    def is_ready(self, index):
+        for name in self.reads[index]:
+            if name not in self.initial and name not in self.produced:
+                return False
+        return True
+
+    def finish(self, index, result, error):
+        __tracebackhide__ = True
+        self.running -= 1
+        self.finished[index] = (result, error)
+        while self.committed < self.cutoff and self.committed in self.finished:
+            self.commit(self.committed, *self.finished.pop(self.committed))
+
+    def commit(self, index, result, error):
+        __tracebackhide__ = True
+        method = self.methods[index]
+        if error is None and type(result) is Success:
+            try:
+                kwargs = self.contract.check_success_statement(
+                    method, self.ctx, result.kwargs
+                )
+            except Exception as contract_error:
+                error = contract_error
+            else:
+                self.history.before_call(method.__name__)
+                assign_namespace(self.ctx, method, kwargs, self.checkpoint)
+                defer_effects(self.ctx, result, self.checkpoint)
+                self.produced.update(kwargs)
+                self.committed += 1
+                return
+        self.stopped = (method, result, error)
+        self.cutoff = index
+
+    def outcome(self):
+        return self.stopped
+
+
+# Verification.
+
+
+def verify(story):
+    problems = []
+    for method, _contract, _protocol in story.methods:
+        if type(method) is Dataflow:
+            steps = zip(method.methods, method.reads)
+        elif type(method) in plan_markers:
+            continue
+        else:
+            steps = [(method, get_reads(method, None))]
+        for step, names in steps:
+            declared = hasattr(step, "stories_reads") or hasattr(
+                getattr(step, "__self__", None), "stories_reads"
+            )
+            if not declared:
+                continue
+            problem = verify_reads(step, names)
+            if problem:
+                problems.append(problem)
+    if problems:
+        raise StoryDefinitionError("\n\n".join(problems))
+
+
+def verify_reads(method, names):
+    inferred = infer_reads(method, None)
+    cls_name = method.__self__.__class__.__name__
+    if inferred is None or names is None:
+        return unknown_reads_template.format(cls=cls_name, method=method.__name__)
+    undeclared = [name for name in inferred if name not in names]
+    if undeclared:
+        return undeclared_reads_template.format(
+            cls=cls_name,
+            method=method.__name__,
+            variables=", ".join(map(repr, undeclared)),
+        )
+
+
+# Messages.
+
+
+unknown_reads_template = """
+Context usage can not be verified: {cls}.{method}
+
+Use context variables as 'ctx.foo' attribute access only.
+""".strip()
+
+
+undeclared_reads_template = """
+Step reads variables which are not declared: {variables}
+
+Story method: {cls}.{method}
+""".strip()
@@ -0,0 +1,87 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import overload
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from _stories.checkpoint import Checkpoint
+from _stories.checkpoint import NullCheckpoint
+from _stories.context import Context
+from _stories.contract import NullContract
+from _stories.contract import SpecContract
+from _stories.history import History
+from _stories.marker import Dataflow
+from _stories.mounted import MountedStory
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+_T = TypeVar("_T")
+
+class Infer: ...
+
+@overload
+def reads(f: _T) -> _T: ...
+@overload
+def reads(*names: str) -> Callable[[_T], _T]: ...
+def get_reads(
+    method: Callable, contract: Union[None, NullContract, SpecContract]
+) -> Optional[Tuple[str, ...]]: ...
+def infer_reads(
+    method: Callable, contract: Union[None, NullContract, SpecContract]
+) -> Optional[Tuple[str, ...]]: ...
+
+ctx_loads: Set[str]
+attribute_loads: Set[str]
+
+def make_dataflow(
+    methods: List[Tuple[Any, Any, Any]], contract: Union[NullContract, SpecContract]
+) -> List[Tuple[Any, Any, Any]]: ...
+def flush_dataflow(
+    result: List[Tuple[Any, Any, Any]],
+    group: List[Tuple[Tuple[Any, Any, Any], Tuple[str, ...]]],
+    contract: Union[NullContract, SpecContract],
+) -> None: ...
+
+plan_markers: Tuple[type, ...]
+
+class Schedule:
+    def __init__(
+        self,
+        group: Dataflow,
+        ctx: Context,
+        contract: Union[NullContract, SpecContract],
+        history: History,
+        checkpoint: Union[Checkpoint, NullCheckpoint],
+    ) -> None: ...
+    def start(self) -> List[int]: ...
+    def is_ready(self, index: int) -> bool: ...
+    def finish(
+        self,
+        index: int,
+        result: Union[None, Result, Success, Failure, Skip],
+        error: Optional[Exception],
+    ) -> None: ...
+    def commit(
+        self,
+        index: int,
+        result: Union[None, Result, Success, Failure, Skip],
+        error: Optional[Exception],
+    ) -> None: ...
+    def outcome(
+        self,
+    ) -> Tuple[
+        Optional[Callable],
+        Union[None, Result, Success, Failure, Skip],
+        Optional[Exception],
+    ]: ...
+
+def verify(story: MountedStory) -> None: ...
+def verify_reads(
+    method: Callable, names: Optional[Tuple[str, ...]]
+) -> Optional[str]: ...
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+
+from _stories.compat import ContextVar
+from _stories.compat import perf_counter
+from _stories.exceptions import DeadlineExceeded
+
+
+# Deadline is an absolute point in time stored in the current context.
+# Substories, parallel groups and fan-out runs share the deadline of the
+# story which called them.
+
+
+deadline_at = ContextVar("stories_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds):
+    previous = deadline_at.get()
+    at = perf_counter() + seconds
+    if previous is not None and previous < at:
+        at = previous
+    deadline_at.set(at)
+    try:
+        yield
+    finally:
+        deadline_at.set(previous)
+
+
+def remaining():
+    at = deadline_at.get()
+    if at is None:
+        return None
+    return max(at - perf_counter(), 0.0)
+
+
+def expired():
+    at = deadline_at.get()
+    return at is not None and perf_counter() >= at
+
+
+def check_deadline(history, method):
+    __tracebackhide__ = True
+    if expired():
+        history.before_call(method.__name__)
+        history.on_error(DeadlineExceeded.__name__)
+        raise DeadlineExceeded(deadline_exceeded_template.format(method=method))
+
+
+# Messages.
+
+
+deadline_exceeded_template = """
+Deadline exceeded on the story step: {method.__name__}
+""".strip()
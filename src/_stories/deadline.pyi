@@ -0,0 +1,15 @@
+from typing import Callable
+from typing import ContextManager
+from typing import Optional
+
+from _stories.compat import ContextVar
+from _stories.history import History
+
+deadline_at: ContextVar[Optional[float]]
+
+def deadline(seconds: float) -> ContextManager[None]: ...
+def remaining() -> Optional[float]: ...
+def expired() -> bool: ...
+def check_deadline(history: History, method: Callable) -> None: ...
+
+deadline_exceeded_template: str
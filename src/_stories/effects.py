@@ -0,0 +1,45 @@
+from _stories.batch import get_batch
+
+
+# Effects deferred by steps next to their success are kept in the
+# context until the story returns.  They are made only if the story did
+# not fail.  Calls of the same effect are made together with its batch
+# variant if it has one.  The checkpoint keeps deferred effects too, so
+# the resumed story makes effects of steps done before the crash.
+
+
+def defer_effects(ctx, result, checkpoint):
+    if result.effects:
+        ctx.__dict__.setdefault("_Context__effects", []).extend(result.effects)
+        checkpoint.defer(result.effects)
+
+
+def restore_effects(ctx, effects):
+    if effects:
+        ctx.__dict__["_Context__effects"] = list(effects)
+
+
+def take_effects(ctx):
+    return ctx.__dict__.pop("_Context__effects", ())
+
+
+def group_effects(effects):
+    groups = []
+    for effect, args in effects:
+        for known, calls in groups:
+            if known == effect:
+                calls.append(args)
+                break
+        else:
+            groups.append((effect, [args]))
+    return groups
+
+
+def flush_effects(effects):
+    for effect, calls in group_effects(effects):
+        bulk = get_batch(effect)
+        if bulk is not None:
+            bulk(calls)
+            continue
+        for args in calls:
+            effect(*args)
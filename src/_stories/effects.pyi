@@ -0,0 +1,23 @@
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from _stories.checkpoint import Checkpoint
+from _stories.checkpoint import NullCheckpoint
+from _stories.context import Context
+from _stories.returned import Success
+
+_Effect = Tuple[Callable, Tuple[Any, ...]]
+
+def defer_effects(
+    ctx: Context, result: Success, checkpoint: Union[Checkpoint, NullCheckpoint]
+) -> None: ...
+def restore_effects(ctx: Context, effects: List[_Effect]) -> None: ...
+def take_effects(ctx: Context) -> Iterable[_Effect]: ...
+def group_effects(
+    effects: Iterable[_Effect],
+) -> List[Tuple[Callable, List[Tuple[Any, ...]]]]: ...
+def flush_effects(effects: Iterable[_Effect]) -> None: ...
@@ -26,3 +26,11 @@ class ContextContractError(StoryError):
 
 class MutationError(StoryError):
     pass
+
+
+class DeadlineExceeded(StoryError):
+    pass
+
+
+class BulkheadFull(StoryError):
+    pass
@@ -12,3 +12,5 @@ class FailureError:
 class FailureProtocolError: ...
 class ContextContractError: ...
 class MutationError: ...
+class DeadlineExceeded: ...
+class BulkheadFull: ...
@@ -0,0 +1,417 @@
+from asyncio import CancelledError
+from asyncio import ensure_future
+from asyncio import FIRST_COMPLETED
+from asyncio import gather
+from asyncio import get_event_loop
+from asyncio import Semaphore
+from asyncio import shield
+from asyncio import wait
+from inspect import isawaitable
+from inspect import iscoroutinefunction
+
+from _stories.batch import get_batch
+from _stories.bulkhead import Limited
+from _stories.bulkhead import report_wait
+from _stories.bulkhead import Slots
+from _stories.checkpoint import null_checkpoint
+from _stories.compat import copy_context
+from _stories.compat import perf_counter
+from _stories.context import assign_namespace
+from _stories.dataflow import Schedule
+from _stories.deadline import check_deadline
+from _stories.deadline import deadline_exceeded_template
+from _stories.deadline import remaining
+from _stories.effects import defer_effects
+from _stories.effects import group_effects
+from _stories.effects import take_effects
+from _stories.exceptions import DeadlineExceeded
+from _stories.execute.function import errored
+from _stories.executors import get_executor
+from _stories.executors import get_group
+from _stories.executors import Inline
+from _stories.fanout import FanOut
+from _stories.hedge import get_hedge
+from _stories.loader import run_scope
+from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
+from _stories.marker import EndOfStory
+from _stories.marker import Parallel
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+
+async def execute(runner, ctx, history, probe, methods, checkpoint=null_checkpoint):
+    __tracebackhide__ = True
+
+    slots = Slots()
+    try:
+        with run_scope():
+            return await execute_steps(
+                runner, ctx, history, probe, methods, checkpoint, slots
+            )
+    finally:
+        slots.close()
+
+
+async def execute_steps(runner, ctx, history, probe, methods, checkpoint, slots):
+    __tracebackhide__ = True
+
+    skipped = 0
+
+    for index, (method, contract, protocol) in enumerate(methods):
+
+        method_type = type(method)
+
+        if index < checkpoint.start:
+            if method_type is BeginningOfStory:
+                slots.hold(None)
+            elif method_type is EndOfStory:
+                slots.exit()
+            continue
+
+        if skipped > 0:
+            if method_type is EndOfStory:
+                skipped -= 1
+                if skipped == 0:
+                    slots.exit()
+            elif method_type is BeginningOfStory:
+                skipped += 1
+            continue
+
+        if method_type is not EndOfStory:
+            check_deadline(history, method)
+
+        if method_type is BeginningOfStory:
+            bulkhead = method.bulkhead
+            if bulkhead is not None:
+                await acquire_async(bulkhead)
+            slots.hold(bulkhead)
+
+        if method_type is Dataflow:
+            outcome = await call_dataflow(
+                probe, method, ctx, contract, history, checkpoint
+            )
+            method, result, error = outcome
+            if method is None:
+                checkpoint.save(index)
+                continue
+            history.before_call(method.__name__)
+            if error is not None:
+                history.on_error(error.__class__.__name__)
+                raise error
+            method_type = type(method)
+        elif method_type is Parallel:
+            outcomes = await call_parallel(probe, method.methods, ctx)
+            for method, result, error in outcomes:
+                history.before_call(method.__name__)
+                if error is not None:
+                    history.on_error(error.__class__.__name__)
+                    raise error
+                if type(result) is not Success:
+                    break
+                try:
+                    kwargs = contract.check_success_statement(
+                        method, ctx, result.kwargs
+                    )
+                except Exception as error:
+                    history.on_error(error.__class__.__name__)
+                    raise
+                assign_namespace(ctx, method, kwargs, checkpoint)
+                defer_effects(ctx, result, checkpoint)
+            else:
+                checkpoint.save(index)
+                continue
+            method_type = type(method)
+        else:
+            history.before_call(method.__name__)
+            step = probe.before_call(method, method_type)
+
+            try:
+                if method_type is BeginningOfStory or method_type is EndOfStory:
+                    result = method(ctx)
+                else:
+                    result = schedule(method, ctx)
+                if isawaitable(result):
+                    result = await until_deadline(method, result)
+            except Exception as error:
+                probe.after_call(step, None, error)
+                history.on_error(error.__class__.__name__)
+                raise
+
+            probe.after_call(step, result, None)
+
+        restype = type(result)
+        if restype not in (Result, Success, Failure, Skip):
+            raise AssertionError
+
+        if restype is Failure:
+            try:
+                protocol.check_return_statement(method, result.reason)
+            except Exception as error:
+                history.on_error(error.__class__.__name__)
+                raise
+            history.on_failure(result.reason)
+            take_effects(ctx)
+            checkpoint.finish()
+            return runner.got_failure(ctx, method.__name__, result.reason)
+
+        if restype is Result:
+            history.on_result(result.value)
+            if not runner.nested:
+                await flush_async(take_effects(ctx))
+            checkpoint.finish()
+            return runner.got_result(result.value)
+
+        if restype is Skip:
+            history.on_skip()
+            skipped = 1
+            continue
+
+        if method_type is BeginningOfStory:
+            try:
+                contract.check_substory_call(ctx)
+            except Exception as error:
+                history.on_error(error.__class__.__name__)
+                raise
+            history.on_substory_start()
+            continue
+
+        if method_type is EndOfStory:
+            history.on_substory_end()
+            slots.exit()
+            continue
+
+        try:
+            kwargs = contract.check_success_statement(method, ctx, result.kwargs)
+        except Exception as error:
+            history.on_error(error.__class__.__name__)
+            raise
+
+        assign_namespace(ctx, method, kwargs, checkpoint)
+        defer_effects(ctx, result, checkpoint)
+
+        checkpoint.save(index)
+
+    if not runner.nested:
+        await flush_async(take_effects(ctx))
+    checkpoint.finish()
+    return runner.finished()
+
+
+async def flush_async(effects):
+    for effect, calls in group_effects(effects):
+        bulk = get_batch(effect)
+        if bulk is not None:
+            returned = bulk(calls)
+            if isawaitable(returned):
+                await returned
+            continue
+        for args in calls:
+            returned = effect(*args)
+            if isawaitable(returned):
+                await returned
+
+
+async def call_parallel(probe, methods, ctx):
+    outcomes = await gather(*[call(probe, method, ctx) for method in methods])
+    return errored(outcomes)
+
+
+async def call(probe, method, ctx):
+    step = probe.before_call(method, type(method))
+    try:
+        result = schedule(method, ctx)
+        if isawaitable(result):
+            result = await until_deadline(method, result)
+    except Exception as error:
+        probe.after_call(step, None, error)
+        return method, None, error
+    probe.after_call(step, result, None)
+    return method, result, None
+
+
+async def until_deadline(method, awaitable):
+    timeout = remaining()
+    if timeout is None:
+        return await awaitable
+    task = ensure_future(awaitable)
+    try:
+        done, _ = await wait([task], timeout=timeout)
+    finally:
+        # The step should not outlive the story cancelled while waiting.
+        task.cancel()
+    if not done:
+        raise DeadlineExceeded(deadline_exceeded_template.format(method=method))
+    return task.result()
+
+
+def schedule(method, ctx):
+    if type(method) is FanOut:
+        return call_fan_out(method, ctx)
+    if type(method) is Limited:
+        return call_limited(method, ctx)
+    hedge = get_hedge(method)
+    if hedge is not None:
+        return call_hedged(hedge, method, ctx)
+    return dispatch(method, ctx)
+
+
+def dispatch(method, ctx):
+    if iscoroutinefunction(method):
+        return method(ctx)
+    group = get_group(method)
+    if group is Inline:
+        return method(ctx)
+    loop = get_event_loop()
+    executor = get_executor(group)
+    context = copy_context()
+    return loop.run_in_executor(executor, context.run, method, ctx)
+
+
+async def call_dataflow(probe, group, ctx, contract, history, checkpoint):
+    schedule = Schedule(group, ctx, contract, history, checkpoint)
+    running = {}
+    try:
+        while True:
+            ready = schedule.start()
+            for index in ready:
+                method = group.methods[index]
+                running[ensure_future(call(probe, method, ctx))] = index
+            if running:
+                done, _ = await wait(running, return_when=FIRST_COMPLETED)
+                for index, task in sorted((running.pop(t), t) for t in done):
+                    schedule.finish(index, *task.result()[1:])
+            elif not ready:
+                return schedule.outcome()
+    finally:
+        # Steps should not outlive the story cancelled while waiting.
+        for task in running:
+            task.cancel()
+        if running:
+            await wait(running)
+
+
+async def call_fan_out(fan_out, ctx):
+    runs = fan_out.prepare(ctx)
+    semaphore = Semaphore(fan_out.limit or len(runs) or 1)
+
+    async def bounded(run):
+        async with semaphore:
+            return await execute(*run)
+
+    results = await gather(*[bounded(run) for run in runs], return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return fan_out.finish(ctx, runs, results)
+
+
+async def call_limited(limited, ctx):
+    bulkhead = limited.bulkhead
+    report_wait(await acquire_async(bulkhead))
+    try:
+        result = schedule(limited.method, ctx)
+        if isawaitable(result):
+            result = await result
+        return result
+    finally:
+        bulkhead.release()
+
+
+async def acquire_async(bulkhead):
+    loop = get_event_loop()
+    future = loop.create_future()
+
+    def wake():
+        loop.call_soon_threadsafe(hand_over, future)
+
+    if bulkhead.enter(wake):
+        return 0.0
+    started = perf_counter()
+    try:
+        await future
+    except CancelledError:
+        bulkhead.cancel(wake)
+        raise
+    return perf_counter() - started
+
+
+def hand_over(future):
+    if not future.done():
+        future.set_result(None)
+
+
+async def call_hedged(hedge, method, ctx):
+    started = perf_counter()
+    attempts = [ensure_future(attempt(method, ctx))]
+    try:
+        done, _ = await wait(attempts, timeout=hedge.get_delay())
+        if not done:
+            hedge.issue()
+            attempts.append(ensure_future(attempt(method, ctx)))
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+            for task in attempts:
+                if task not in done:
+                    continue
+                if task.exception() is None:
+                    if task is attempts[0]:
+                        hedge.observe(perf_counter() - started)
+                    else:
+                        if not attempts[0].done():
+                            hedge.outrun()
+                        hedge.win()
+                    return task.result()
+                if error is None:
+                    error = task.exception()
+        raise error
+    finally:
+        for task in attempts:
+            task.cancel()
+
+
+async def attempt(method, ctx):
+    result = dispatch(method, ctx)
+    if isawaitable(result):
+        result = await result
+    return result
+
+
+async def join_flight(flights, f, story, kwargs):
+    key = flights.make_key(f, story, kwargs)
+    if key is None:
+        return await f(story, kwargs)
+    loop = get_event_loop()
+    key += (loop,)
+    while True:
+        future = flights.running.get(key)
+        if future is None:
+            break
+        flights.count()
+        try:
+            return await shield(future)
+        except CancelledError:
+            if not future.cancelled():
+                raise
+        # The first caller was cancelled.  Run the story again.
+        flights.count(-1)
+    future = flights.running[key] = loop.create_future()
+    try:
+        result = await f(story, kwargs)
+    except CancelledError:
+        raise
+    except Exception as error:
+        future.set_exception(error)
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        del flights.running[key]
+        if not future.done():
+            future.cancel()
+    return result
@@ -1,38 +1,117 @@
+from _stories.bulkhead import Slots
+from _stories.checkpoint import null_checkpoint
+from _stories.compat import copy_context
 from _stories.context import assign_namespace
+from _stories.dataflow import Schedule
+from _stories.deadline import check_deadline
+from _stories.effects import defer_effects
+from _stories.effects import flush_effects
+from _stories.effects import take_effects
+from _stories.executors import get_executor
+from _stories.executors import get_group
+from _stories.executors import Inline
+from _stories.executors import submit
+from _stories.executors import wait_first
 from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
 from _stories.marker import EndOfStory
+from _stories.marker import Parallel
 from _stories.returned import Failure
 from _stories.returned import Result
 from _stories.returned import Skip
 from _stories.returned import Success
 
 
-def execute(runner, ctx, history, methods):
+def execute(runner, ctx, history, probe, methods, checkpoint=null_checkpoint):
+    __tracebackhide__ = True
+
+    slots = Slots()
+    try:
+        return execute_steps(runner, ctx, history, probe, methods, checkpoint, slots)
+    finally:
+        slots.close()
+
+
+def execute_steps(runner, ctx, history, probe, methods, checkpoint, slots):
     __tracebackhide__ = True
 
     skipped = 0
 
-    for method, contract, protocol in methods:
+    for index, (method, contract, protocol) in enumerate(methods):
 
         method_type = type(method)
 
+        if index < checkpoint.start:
+            if method_type is BeginningOfStory:
+                slots.hold(None)
+            elif method_type is EndOfStory:
+                slots.exit()
+            continue
+
         if skipped > 0:
             if method_type is EndOfStory:
                 skipped -= 1
+                if skipped == 0:
+                    slots.exit()
             elif method_type is BeginningOfStory:
                 skipped += 1
             continue
 
-        history.before_call(method.__name__)
+        if method_type is not EndOfStory:
+            check_deadline(history, method)
 
-        try:
-            result = method(ctx)
-        except Exception as error:
-            history.on_error(error.__class__.__name__)
-            raise
+        if method_type is BeginningOfStory:
+            slots.enter(method.bulkhead)
+
+        if method_type is Dataflow:
+            outcome = call_dataflow(probe, method, ctx, contract, history, checkpoint)
+            method, result, error = outcome
+            if method is None:
+                checkpoint.save(index)
+                continue
+            history.before_call(method.__name__)
+            if error is not None:
+                history.on_error(error.__class__.__name__)
+                raise error
+            method_type = type(method)
+        elif method_type is Parallel:
+            outcomes = call_parallel(probe, method.methods, ctx)
+            for method, result, error in outcomes:
+                history.before_call(method.__name__)
+                if error is not None:
+                    history.on_error(error.__class__.__name__)
+                    raise error
+                if type(result) is not Success:
+                    break
+                try:
+                    kwargs = contract.check_success_statement(
+                        method, ctx, result.kwargs
+                    )
+                except Exception as error:
+                    history.on_error(error.__class__.__name__)
+                    raise
+                assign_namespace(ctx, method, kwargs, checkpoint)
+                defer_effects(ctx, result, checkpoint)
+            else:
+                checkpoint.save(index)
+                continue
+            method_type = type(method)
+        else:
+            history.before_call(method.__name__)
+            step = probe.before_call(method, method_type)
+
+            try:
+                result = method(ctx)
+            except Exception as error:
+                probe.after_call(step, None, error)
+                history.on_error(error.__class__.__name__)
+                raise
+
+            probe.after_call(step, result, None)
 
         restype = type(result)
         if restype not in (Result, Success, Failure, Skip):
+            check_awaitable(method, result)
             raise AssertionError
 
         if restype is Failure:
@@ -42,10 +121,15 @@ def execute(runner, ctx, history, methods):
                 history.on_error(error.__class__.__name__)
                 raise
             history.on_failure(result.reason)
+            take_effects(ctx)
+            checkpoint.finish()
             return runner.got_failure(ctx, method.__name__, result.reason)
 
         if restype is Result:
             history.on_result(result.value)
+            if not runner.nested:
+                flush_effects(take_effects(ctx))
+            checkpoint.finish()
             return runner.got_result(result.value)
 
         if restype is Skip:
@@ -64,6 +148,7 @@ def execute(runner, ctx, history, methods):
 
         if method_type is EndOfStory:
             history.on_substory_end()
+            slots.exit()
             continue
 
         try:
@@ -72,6 +157,90 @@ def execute(runner, ctx, history, methods):
             history.on_error(error.__class__.__name__)
             raise
 
-        assign_namespace(ctx, method, kwargs)
+        assign_namespace(ctx, method, kwargs, checkpoint)
+        defer_effects(ctx, result, checkpoint)
+
+        checkpoint.save(index)
 
+    if not runner.nested:
+        flush_effects(take_effects(ctx))
+    checkpoint.finish()
     return runner.finished()
+
+
+def call_parallel(probe, methods, ctx):
+    futures = {}
+    for method in methods:
+        group = get_group(method)
+        if group is not Inline:
+            executor = get_executor(group)
+            context = copy_context()
+            futures[method] = submit(executor, context.run, call, probe, method, ctx)
+    inline = {
+        method: call(probe, method, ctx) for method in methods if method not in futures
+    }
+    outcomes = [
+        futures[method].result() if method in futures else inline[method]
+        for method in methods
+    ]
+    return errored(outcomes)
+
+
+def errored(outcomes):
+    for outcome in outcomes:
+        if outcome[2] is not None:
+            return [outcome]
+    return outcomes
+
+
+def call(probe, method, ctx):
+    step = probe.before_call(method, type(method))
+    try:
+        result = method(ctx)
+    except Exception as error:
+        probe.after_call(step, None, error)
+        return method, None, error
+    probe.after_call(step, result, None)
+    return method, result, None
+
+
+def call_dataflow(probe, group, ctx, contract, history, checkpoint):
+    schedule = Schedule(group, ctx, contract, history, checkpoint)
+    running = {}
+    while True:
+        ready = schedule.start()
+        for index in ready:
+            method = group.methods[index]
+            name = get_group(method)
+            if name is Inline:
+                schedule.finish(index, *call(probe, method, ctx)[1:])
+            else:
+                executor = get_executor(name)
+                context = copy_context()
+                work = submit(executor, context.run, call, probe, method, ctx)
+                running[index] = work
+        if running:
+            done = wait_first(list(running.values()))
+            for index in sorted(running):
+                if running[index] in done:
+                    schedule.finish(index, *running.pop(index).result()[1:])
+        elif not ready:
+            return schedule.outcome()
+
+
+def check_awaitable(method, result):
+    if hasattr(result, "__await__"):
+        close = getattr(result, "close", None)
+        if close is not None:
+            close()
+        raise AssertionError(coroutine_step_template.format(method=method))
+
+
+# Messages.
+
+
+coroutine_step_template = """
+Coroutine step could not be called by the synchronous story: {method.__name__}
+
+Use `acall` or `run_async` method of the story to await it.
+""".strip()
@@ -5,6 +5,8 @@ from typing import overload
 from typing import Tuple
 from typing import Union
 
+from _stories.checkpoint import Checkpoint
+from _stories.checkpoint import NullCheckpoint
 from _stories.context import Context
 from _stories.contract import NullContract
 from _stories.contract import SpecContract
@@ -12,6 +14,8 @@ from _stories.failures import DisabledNullExecProtocol
 from _stories.failures import NotNullExecProtocol
 from _stories.failures import NullExecProtocol
 from _stories.history import History
+from _stories.instrument import NullProbe
+from _stories.instrument import Probe
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
 from _stories.returned import Failure
@@ -22,11 +26,13 @@ from _stories.run import Call
 from _stories.run import Run
 from _stories.summary import FailureSummary
 from _stories.summary import SuccessSummary
+
 @overload
 def execute(
     runner: Call,
     ctx: Context,
     history: History,
+    probe: Union[Probe, NullProbe],
     methods: List[
         Tuple[
             Union[
@@ -38,12 +44,14 @@ def execute(
             Union[NullExecProtocol, DisabledNullExecProtocol, NotNullExecProtocol],
         ],
     ],
+    checkpoint: Union[Checkpoint, NullCheckpoint] = ...,
 ) -> Any: ...
 @overload
 def execute(
     runner: Run,
     ctx: Context,
     history: History,
+    probe: Union[Probe, NullProbe],
     methods: List[
         Tuple[
             Union[
@@ -55,4 +63,8 @@ def execute(
             Union[NullExecProtocol, DisabledNullExecProtocol, NotNullExecProtocol],
         ],
     ],
+    checkpoint: Union[Checkpoint, NullCheckpoint] = ...,
 ) -> Union[SuccessSummary, FailureSummary]: ...
+def check_awaitable(method: Callable, result: Any) -> None: ...
+
+coroutine_step_template: str
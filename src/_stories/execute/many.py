@@ -0,0 +1,242 @@
+from _stories.batch import get_batch
+from _stories.bulkhead import Slots
+from _stories.checkpoint import null_checkpoint
+from _stories.context import assign_namespace
+from _stories.deadline import check_deadline
+from _stories.effects import defer_effects
+from _stories.effects import flush_effects
+from _stories.effects import take_effects
+from _stories.execute.function import call_dataflow
+from _stories.execute.function import call_parallel
+from _stories.execute.function import check_awaitable
+from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
+from _stories.marker import EndOfStory
+from _stories.marker import Parallel
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+
+
+# Story runs of the batch are executed together step by step.  Steps
+# with the batch variant are called once with contexts of all runs which
+# reached them.
+
+
+class Item(object):
+    def __init__(self, runner, ctx, history, probe):
+        self.runner = runner
+        self.ctx = ctx
+        self.history = history
+        self.probe = probe
+        self.skipped = 0
+        self.summary = None
+
+
+def execute(items, methods):
+    __tracebackhide__ = True
+
+    slots = Slots()
+    try:
+        return execute_steps(items, methods, slots)
+    finally:
+        slots.close()
+
+
+# The batch runs in one thread and holds one slot of the limited
+# substory for all its runs.
+
+
+def execute_steps(items, methods, slots):
+    __tracebackhide__ = True
+
+    running = list(items)
+
+    for method, contract, protocol in methods:
+
+        method_type = type(method)
+
+        if method_type is BeginningOfStory:
+            slots.enter(method.bulkhead if running else None)
+        elif method_type is EndOfStory:
+            slots.exit()
+
+        live = []
+
+        for item in running:
+            if item.skipped > 0:
+                if method_type is EndOfStory:
+                    item.skipped -= 1
+                elif method_type is BeginningOfStory:
+                    item.skipped += 1
+                continue
+            if method_type is not EndOfStory:
+                check_deadline(item.history, method)
+            live.append(item)
+
+        if not live:
+            continue
+
+        if method_type is Dataflow or method_type is Parallel:
+            outcomes = [call_group(item, method, contract) for item in live]
+        elif get_batch(method) is not None:
+            outcomes = call_batch(live, method, method_type)
+        else:
+            outcomes = [call(item, method, method_type) for item in live]
+
+        for item, (method, result) in zip(live, outcomes):
+            if method is None:
+                continue
+            finish(item, method, result, contract, protocol)
+
+        running = [item for item in running if item.summary is None]
+
+    summaries = [
+        item.runner.finished() if item.summary is None else item.summary
+        for item in items
+    ]
+
+    effects = []
+    for item, summary in zip(items, summaries):
+        deferred = take_effects(item.ctx)
+        if summary.is_success:
+            effects.extend(deferred)
+    flush_effects(effects)
+
+    return summaries
+
+
+def call(item, method, method_type):
+    __tracebackhide__ = True
+    item.history.before_call(method.__name__)
+    step = item.probe.before_call(method, method_type)
+    try:
+        result = method(item.ctx)
+    except Exception as error:
+        item.probe.after_call(step, None, error)
+        item.history.on_error(error.__class__.__name__)
+        raise
+    item.probe.after_call(step, result, None)
+    return method, result
+
+
+def call_batch(items, method, method_type):
+    __tracebackhide__ = True
+    steps = []
+    for item in items:
+        item.history.before_call(method.__name__)
+        steps.append(item.probe.before_call(method, method_type))
+    try:
+        results = list(get_batch(method)([item.ctx for item in items]))
+        if len(results) != len(items):
+            raise AssertionError(
+                wrong_results_template.format(
+                    method=method, items=len(items), results=len(results)
+                )
+            )
+    except Exception as error:
+        for item, step in reversed(list(zip(items, steps))):
+            item.probe.after_call(step, None, error)
+            item.history.on_error(error.__class__.__name__)
+        raise
+    for item, step, result in reversed(list(zip(items, steps, results))):
+        item.probe.after_call(step, result, None)
+    return [(method, result) for result in results]
+
+
+def call_group(item, group, contract):
+    __tracebackhide__ = True
+    ctx = item.ctx
+    history = item.history
+    if type(group) is Dataflow:
+        method, result, error = call_dataflow(
+            item.probe, group, ctx, contract, history, null_checkpoint
+        )
+        if method is None:
+            return None, None
+        history.before_call(method.__name__)
+        if error is not None:
+            history.on_error(error.__class__.__name__)
+            raise error
+        return method, result
+    for method, result, error in call_parallel(item.probe, group.methods, ctx):
+        history.before_call(method.__name__)
+        if error is not None:
+            history.on_error(error.__class__.__name__)
+            raise error
+        if type(result) is not Success:
+            return method, result
+        try:
+            kwargs = contract.check_success_statement(method, ctx, result.kwargs)
+        except Exception as error:
+            history.on_error(error.__class__.__name__)
+            raise
+        assign_namespace(ctx, method, kwargs, null_checkpoint)
+        defer_effects(ctx, result, null_checkpoint)
+    return None, None
+
+
+def finish(item, method, result, contract, protocol):
+    __tracebackhide__ = True
+
+    method_type = type(method)
+    ctx = item.ctx
+    history = item.history
+
+    restype = type(result)
+    if restype not in (Result, Success, Failure, Skip):
+        check_awaitable(method, result)
+        raise AssertionError
+
+    if restype is Failure:
+        try:
+            protocol.check_return_statement(method, result.reason)
+        except Exception as error:
+            history.on_error(error.__class__.__name__)
+            raise
+        history.on_failure(result.reason)
+        item.summary = item.runner.got_failure(ctx, method.__name__, result.reason)
+        return
+
+    if restype is Result:
+        history.on_result(result.value)
+        item.summary = item.runner.got_result(result.value)
+        return
+
+    if restype is Skip:
+        history.on_skip()
+        item.skipped = 1
+        return
+
+    if method_type is BeginningOfStory:
+        try:
+            contract.check_substory_call(ctx)
+        except Exception as error:
+            history.on_error(error.__class__.__name__)
+            raise
+        history.on_substory_start()
+        return
+
+    if method_type is EndOfStory:
+        history.on_substory_end()
+        return
+
+    try:
+        kwargs = contract.check_success_statement(method, ctx, result.kwargs)
+    except Exception as error:
+        history.on_error(error.__class__.__name__)
+        raise
+
+    assign_namespace(ctx, method, kwargs, null_checkpoint)
+    defer_effects(ctx, result, null_checkpoint)
+
+
+# Messages.
+
+
+wrong_results_template = """
+Batch variant of the step should return one result for each context.
+
+Got {results} results for {items} contexts: {method.__name__}
+""".strip()
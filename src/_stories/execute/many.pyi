@@ -0,0 +1,73 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _stories.context import Context
+from _stories.contract import NullContract
+from _stories.contract import SpecContract
+from _stories.failures import DisabledNullExecProtocol
+from _stories.failures import NotNullExecProtocol
+from _stories.failures import NullExecProtocol
+from _stories.history import History
+from _stories.instrument import NullProbe
+from _stories.instrument import Probe
+from _stories.marker import Dataflow
+from _stories.marker import Parallel
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
+from _stories.returned import Success
+from _stories.run import Run
+from _stories.summary import FailureSummary
+from _stories.summary import SuccessSummary
+
+class Item:
+    runner: Run
+    ctx: Context
+    history: History
+    probe: Union[Probe, NullProbe]
+    skipped: int
+    summary: Optional[Union[SuccessSummary, FailureSummary]]
+    def __init__(
+        self,
+        runner: Run,
+        ctx: Context,
+        history: History,
+        probe: Union[Probe, NullProbe],
+    ) -> None: ...
+
+def execute(
+    items: List[Item],
+    methods: List[
+        Tuple[
+            Any,
+            Union[NullContract, SpecContract],
+            Union[NullExecProtocol, DisabledNullExecProtocol, NotNullExecProtocol],
+        ],
+    ],
+) -> List[Union[SuccessSummary, FailureSummary]]: ...
+def call(
+    item: Item, method: Callable, method_type: type
+) -> Tuple[Callable, Union[Result, Success, Failure, Skip]]: ...
+def call_batch(
+    items: List[Item], method: Callable, method_type: type
+) -> List[Tuple[Callable, Union[Result, Success, Failure, Skip]]]: ...
+def call_group(
+    item: Item,
+    group: Union[Parallel, Dataflow],
+    contract: Union[NullContract, SpecContract],
+) -> Tuple[
+    Optional[Callable], Union[None, Result, Success, Failure, Skip]
+]: ...
+def finish(
+    item: Item,
+    method: Callable,
+    result: Union[Result, Success, Failure, Skip],
+    contract: Union[NullContract, SpecContract],
+    protocol: Union[NullExecProtocol, DisabledNullExecProtocol, NotNullExecProtocol],
+) -> None: ...
+
+wrong_results_template: str
@@ -0,0 +1,122 @@
+from threading import Event
+from threading import Lock
+
+from _stories.compat import FIRST_COMPLETED
+from _stories.compat import ThreadPoolExecutor
+from _stories.compat import wait
+
+
+# Markers.
+
+
+class Inline(object):
+    pass
+
+
+def inline(f):
+    f.stories_executor = Inline
+    return f
+
+
+def offload(group):
+    def decorator(f):
+        f.stories_executor = group
+        return f
+
+    return decorator
+
+
+def get_group(method):
+    default = getattr(getattr(method, "__self__", None), "stories_executor", None)
+    return getattr(method, "stories_executor", default)
+
+
+# Registry.
+
+
+executors = {}
+
+
+executors_lock = Lock()
+
+
+def set_executor(group, executor):
+    with executors_lock:
+        if executor is None:
+            executors.pop(group, None)
+        else:
+            executors[group] = executor
+
+
+def get_executor(group):
+    executor = executors.get(group)
+    if executor is not None:
+        return executor
+    with executors_lock:
+        if group not in executors:
+            executors[group] = ThreadPoolExecutor()
+        return executors[group]
+
+
+# Submission.
+
+
+# The thread waiting for the submitted work runs it itself if no
+# executor thread took it yet.  Fan-out items and parallel groups nested
+# in the executor threads would wait forever for the work queued behind
+# them otherwise.
+
+
+class Work(object):
+    def __init__(self, f, args):
+        self.f = f
+        self.args = args
+        self.lock = Lock()
+        self.claimed = False
+        self.done = Event()
+        self.value = None
+        self.error = None
+        self.future = None
+
+    def claim(self):
+        with self.lock:
+            if self.claimed:
+                return False
+            self.claimed = True
+            return True
+
+    def call(self):
+        try:
+            self.value = self.f(*self.args)
+        except BaseException as error:  # noqa: B036
+            self.error = error
+        self.done.set()
+
+    def run(self):
+        if self.claim():
+            self.call()
+
+    def result(self):
+        self.run()
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def submit(executor, f, *args):
+    work = Work(f, args)
+    work.future = executor.submit(work.run)
+    return work
+
+
+def wait_first(works):
+    done = [work for work in works if work.done.is_set()]
+    if done:
+        return done
+    for work in works:
+        if work.claim():
+            work.call()
+            return [work]
+    wait([work.future for work in works], return_when=FIRST_COMPLETED)
+    return [work for work in works if work.done.is_set()]
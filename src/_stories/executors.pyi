@@ -0,0 +1,45 @@
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from threading import Event
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+_T = TypeVar("_T")
+
+class Inline: ...
+
+def inline(f: _T) -> _T: ...
+def offload(group: str) -> Callable[[_T], _T]: ...
+def get_group(method: Callable) -> Union[None, str, Type[Inline]]: ...
+
+executors: Dict[Optional[str], Executor]
+executors_lock: Lock
+
+def set_executor(group: Optional[str], executor: Optional[Executor]) -> None: ...
+def get_executor(group: Optional[str]) -> Optional[Executor]: ...
+
+class Work:
+    f: Callable
+    args: Tuple[Any, ...]
+    lock: Lock
+    claimed: bool
+    done: Event
+    value: Any
+    error: Optional[BaseException]
+    future: Optional[Future]
+    def __init__(self, f: Callable, args: Tuple[Any, ...]) -> None: ...
+    def claim(self) -> bool: ...
+    def call(self) -> None: ...
+    def run(self) -> None: ...
+    def result(self) -> Any: ...
+
+def submit(executor: Executor, f: Callable, *args: Any) -> Work: ...
+def wait_first(works: List[Work]) -> List[Work]: ...
@@ -28,6 +28,12 @@ def failures_representation(failures):
         return "None"
 
 
+def failures_names(failures):
+    if isinstance(failures, EnumMeta):
+        return list(failures.__members__)
+    return list(failures)
+
+
 def collection_contains(reason, failures):
     return reason in failures
 
@@ -44,6 +50,12 @@ def enumeration_compare(a, b):
     return a.name == b.name
 
 
+def reason_name(reason):
+    if isinstance(reason, Enum):
+        return reason.name
+    return reason
+
+
 # Execute.
 
 
@@ -129,6 +141,9 @@ class NullRunProtocol(object):
         )
         raise FailureProtocolError(message)
 
+    def detach(self):
+        return self
+
 
 class NotNullRunProtocol(object):
     def __init__(self, cls_name, method_name, failures, contains_func, compare_func):
@@ -151,6 +166,44 @@ class NotNullRunProtocol(object):
     def compare_failed_because_argument(self, argument, failure_reason):
         return self.compare_func(argument, failure_reason)
 
+    def detach(self):
+        return DetachedRunProtocol(
+            self.cls_name,
+            self.method_name,
+            isinstance(self.failures, EnumMeta),
+            failures_names(self.failures),
+            failures_representation(self.failures),
+        )
+
+
+# Detached summaries are sent to other processes.  The failure protocol
+# keeps reasons by their names, so it does not refer to the enumeration
+# of the story which could be defined in the local scope.
+
+
+class DetachedRunProtocol(object):
+    def __init__(self, cls_name, method_name, enumeration, failures, available):
+        self.cls_name = cls_name
+        self.method_name = method_name
+        self.enumeration = enumeration
+        self.failures = failures
+        self.available = available
+
+    def check_failed_because_argument(self, reason):
+        if self.enumeration != isinstance(reason, Enum) or (
+            reason_name(reason) not in self.failures
+        ):
+            message = wrong_summary_template.format(
+                reason=reason,
+                available=self.available,
+                cls=self.cls_name,
+                method=self.method_name,
+            )
+            raise FailureProtocolError(message)
+
+    def compare_failed_because_argument(self, argument, failure_reason):
+        return reason_name(argument) == failure_reason
+
 
 # Wrap.
 
@@ -16,10 +16,12 @@ from _stories.marker import EndOfStory
 
 def check_data_type(failures: Any) -> None: ...
 def failures_representation(failures: Union[List[str], Type[Enum]]) -> str: ...
+def failures_names(failures: Union[List[str], Type[Enum]]) -> List[str]: ...
 def collection_contains(reason: str, failures: List[str]) -> bool: ...
 def collection_compare(a: str, b: str) -> bool: ...
 def enumeration_contains(reason: Enum, failures: Type[Enum]) -> bool: ...
 def enumeration_compare(a: Enum, b: Enum) -> bool: ...
+def reason_name(reason: Optional[Union[str, Enum]]) -> Optional[str]: ...
 @overload
 def make_exec_protocol(failures: None) -> NullExecProtocol: ...
 @overload
@@ -63,6 +65,7 @@ def make_run_protocol(
 class NullRunProtocol:
     def __init__(self, cls_name: str, method_name: str) -> None: ...
     def check_failed_because_argument(self, reason: str) -> NoReturn: ...
+    def detach(self) -> NullRunProtocol: ...
 
 class NotNullRunProtocol:  # FIXME: Generic.
     def __init__(
@@ -77,6 +80,21 @@ class NotNullRunProtocol:  # FIXME: Generic.
     def compare_failed_because_argument(
         self, argument: Union[str, Enum], failure_reason: Union[str, Enum]
     ) -> bool: ...
+    def detach(self) -> DetachedRunProtocol: ...
+
+class DetachedRunProtocol:
+    def __init__(
+        self,
+        cls_name: str,
+        method_name: str,
+        enumeration: bool,
+        failures: List[str],
+        available: str,
+    ) -> None: ...
+    def check_failed_because_argument(self, reason: Union[str, Enum]) -> None: ...
+    def compare_failed_because_argument(
+        self, argument: Union[str, Enum], failure_reason: Optional[str]
+    ) -> bool: ...
 
 def combine_failures(
     first_failures: Optional[Union[List[str], Type[Enum]]],
@@ -0,0 +1,89 @@
+from _stories.compat import copy_context
+from _stories.context import get_history
+from _stories.context import get_namespace
+from _stories.context import make_context
+from _stories.effects import take_effects
+from _stories.execute import function
+from _stories.executors import get_executor
+from _stories.executors import submit
+from _stories.executors import wait_first
+from _stories.failures import make_run_protocol
+from _stories.history import History
+from _stories.instrument import make_probe
+from _stories.returned import Success
+from _stories.run import Run
+
+
+class FanOut(object):
+    def __init__(self, obj, name, story, over, item, into, limit):
+        self.__self__ = obj
+        self.__name__ = name
+        self.story = story
+        self.over = over
+        self.item = item
+        self.into = into
+        self.limit = limit
+        self.run_protocol = make_run_protocol(
+            story.failures, story.cls_name, story.name
+        )
+
+    def __call__(self, ctx):
+        runs = self.prepare(ctx)
+        if self.limit == 1 or len(runs) < 2:
+            results = [function.execute(*run) for run in runs]
+        else:
+            results = call_bounded(get_executor(None), runs, self.limit)
+        return self.finish(ctx, runs, results)
+
+    def prepare(self, ctx):
+        __tracebackhide__ = True
+        parent = get_namespace(ctx)
+        arguments = {
+            arg: parent[arg]
+            for arg in self.story.arguments
+            if arg != self.item and arg in parent
+        }
+        contract = self.story.methods[0][1]
+        runs = []
+        for element in getattr(ctx, self.over):
+            kwargs = dict(arguments)
+            kwargs[self.item] = element
+            history = History()
+            item_ctx = make_context(contract, kwargs, history)
+            probe = make_probe(item_ctx)
+            runner = Run(self.run_protocol, probe, nested=True)
+            runs.append((runner, item_ctx, history, probe, self.story.methods))
+        return runs
+
+    def finish(self, ctx, runs, results):
+        history = get_history(ctx)
+        prefix = "  " * (history.indent + 1)
+        for index, (_runner, _ctx, item_history, _probe, _methods) in enumerate(runs):
+            lines = item_history.lines
+            history.lines.append(prefix + lines[0] + " (item " + str(index) + ")")
+            history.lines.extend(prefix + line for line in lines[1:])
+        # Effects of successful items are deferred by the fan-out step, so
+        # they are made only if the parent story does not fail.
+        success = Success(**{self.into: results})
+        for (_runner, item_ctx, _history, _probe, _methods), result in zip(
+            runs, results
+        ):
+            deferred = take_effects(item_ctx)
+            if result.is_success:
+                for effect, args in deferred:
+                    success.defer(effect, *args)
+        return success
+
+
+def call_bounded(executor, runs, limit):
+    works = []
+    running = []
+    for run in runs:
+        if limit is not None and len(running) >= limit:
+            done = wait_first(running)
+            running = [work for work in running if work not in done]
+        context = copy_context()
+        work = submit(executor, context.run, function.execute, *run)
+        works.append(work)
+        running.append(work)
+    return [work.result() for work in works]
@@ -0,0 +1,46 @@
+from concurrent.futures import Executor
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _stories.context import Context
+from _stories.failures import NotNullRunProtocol
+from _stories.failures import NullRunProtocol
+from _stories.mounted import MountedStory
+from _stories.returned import Success
+from _stories.summary import FailureSummary
+from _stories.summary import SuccessSummary
+
+class FanOut:
+    __self__: Any
+    __name__: str
+    story: MountedStory
+    over: str
+    item: str
+    into: str
+    limit: Optional[int]
+    run_protocol: Union[NullRunProtocol, NotNullRunProtocol]
+    def __init__(
+        self,
+        obj: Any,
+        name: str,
+        story: MountedStory,
+        over: str,
+        item: str,
+        into: str,
+        limit: Optional[int],
+    ) -> None: ...
+    def __call__(self, ctx: Context) -> Success: ...
+    def prepare(self, ctx: Context) -> List[Tuple[Any, ...]]: ...
+    def finish(
+        self,
+        ctx: Context,
+        runs: List[Tuple[Any, ...]],
+        results: List[Union[SuccessSummary, FailureSummary]],
+    ) -> Success: ...
+
+def call_bounded(
+    executor: Executor, runs: List[Tuple[Any, ...]], limit: Optional[int]
+) -> List[Union[SuccessSummary, FailureSummary]]: ...
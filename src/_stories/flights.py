@@ -0,0 +1,74 @@
+from threading import Event
+from threading import Lock
+
+
+# Concurrent calls of the story with equal arguments on the same object
+# share the single execution.  The first caller runs the story.  Others
+# wait for its result or exception.  If the first caller was interrupted
+# by `BaseException`, others run the story again.
+
+
+class Flights(object):
+    def __init__(self):
+        self.lock = Lock()
+        self.running = {}
+        self.coalesced = 0
+
+    def make_key(self, f, story, kwargs):
+        # Object identity is stable while the story runs.  Value types
+        # keep `1` and `True` arguments apart.
+        try:
+            arguments = frozenset(
+                (name, type(value), value) for name, value in kwargs.items()
+            )
+            return f, id(story.obj), arguments
+        except TypeError:
+            return None
+
+    def join(self, f, story, kwargs):
+        __tracebackhide__ = True
+        key = self.make_key(f, story, kwargs)
+        if key is None:
+            return f(story, kwargs)
+        while True:
+            with self.lock:
+                flight = self.running.get(key)
+                if flight is None:
+                    flight = self.running[key] = Flight()
+                    break
+                self.coalesced += 1
+            flight.done.wait()
+            if not flight.aborted:
+                return flight.outcome()
+            self.count(-1)
+        try:
+            flight.result = f(story, kwargs)
+        except Exception as error:
+            flight.error = error
+            raise
+        except BaseException:
+            flight.aborted = True
+            raise
+        finally:
+            with self.lock:
+                del self.running[key]
+            flight.done.set()
+        return flight.result
+
+    def count(self, number=1):
+        with self.lock:
+            self.coalesced += number
+
+
+class Flight(object):
+    def __init__(self):
+        self.done = Event()
+        self.aborted = False
+        self.result = None
+        self.error = None
+
+    def outcome(self):
+        __tracebackhide__ = True
+        if self.error is not None:
+            raise self.error
+        return self.result
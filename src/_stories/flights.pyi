@@ -0,0 +1,34 @@
+from threading import Event
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Optional
+from typing import Tuple
+
+from _stories.mounted import MountedStory
+
+class Flights:
+    lock: Lock
+    running: Dict[Tuple[Any, ...], Any]
+    coalesced: int
+    def __init__(self) -> None: ...
+    def make_key(
+        self, f: Callable, story: MountedStory, kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[Callable, int, FrozenSet[Tuple[str, type, Any]]]]: ...
+    def join(
+        self,
+        f: Callable[[MountedStory, Dict[str, Any]], Any],
+        story: MountedStory,
+        kwargs: Dict[str, Any],
+    ) -> Any: ...
+    def count(self, number: int = ...) -> None: ...
+
+class Flight:
+    done: Event
+    aborted: bool
+    result: Any
+    error: Optional[Exception]
+    def __init__(self) -> None: ...
+    def outcome(self) -> Any: ...
@@ -0,0 +1,95 @@
+from collections import deque
+from threading import Lock
+
+from _stories.exceptions import StoryDefinitionError
+
+
+# Markers.
+
+
+def hedge(delay=None, percentile=None, window=100):
+    if delay is None and percentile is None:
+        raise StoryDefinitionError(wrong_hedge_message)
+
+    if delay is not None and (not isinstance(delay, (int, float)) or delay < 0):
+        raise StoryDefinitionError(wrong_delay_message)
+
+    if percentile is not None and not 0 < percentile < 100:
+        raise StoryDefinitionError(wrong_percentile_message)
+
+    def decorator(f):
+        f.stories_hedge = Hedge(delay, percentile, window)
+        return f
+
+    return decorator
+
+
+def get_hedge(method):
+    default = getattr(getattr(method, "__self__", None), "stories_hedge", None)
+    return getattr(method, "stories_hedge", default)
+
+
+# Counters.
+
+
+# Percentile delay is taken from the latency of the recent primary
+# calls.  Primary call outrun by the hedged call is cancelled, so it is
+# counted as slower than any call observed.  The latency of the hedged
+# call is never used, otherwise the delay would shrink with each call
+# won by the hedge.  The fixed delay is used until there are enough
+# calls observed.
+
+
+min_samples = 10
+
+
+outrun = float("inf")
+
+
+class Hedge(object):
+    def __init__(self, delay, percentile, window):
+        self.delay = delay
+        self.percentile = percentile
+        self.samples = deque(maxlen=window)
+        self.lock = Lock()
+        self.issued = 0
+        self.won = 0
+
+    def get_delay(self):
+        if self.percentile is None or len(self.samples) < min_samples:
+            return self.delay
+        with self.lock:
+            samples = sorted(self.samples)
+        index = min(int(len(samples) * self.percentile / 100.0), len(samples) - 1)
+        while index >= 0 and samples[index] == outrun:
+            index -= 1
+        if index < 0:
+            return self.delay
+        return samples[index]
+
+    def observe(self, duration):
+        with self.lock:
+            self.samples.append(duration)
+
+    def outrun(self):
+        self.observe(outrun)
+
+    def issue(self):
+        with self.lock:
+            self.issued += 1
+
+    def win(self):
+        with self.lock:
+            self.won += 1
+
+
+# Messages.
+
+
+wrong_hedge_message = "Hedge should be defined with delay or percentile"
+
+
+wrong_delay_message = "Hedge delay should be a non-negative number"
+
+
+wrong_percentile_message = "Hedge percentile should be between 0 and 100"
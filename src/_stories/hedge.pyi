@@ -0,0 +1,37 @@
+from threading import Lock
+from typing import Callable
+from typing import Deque
+from typing import Optional
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+def hedge(
+    delay: Optional[float] = ...,
+    percentile: Optional[float] = ...,
+    window: int = ...,
+) -> Callable[[_T], _T]: ...
+def get_hedge(method: Callable) -> Optional[Hedge]: ...
+
+min_samples: int
+outrun: float
+
+class Hedge:
+    delay: Optional[float]
+    percentile: Optional[float]
+    samples: Deque[float]
+    lock: Lock
+    issued: int
+    won: int
+    def __init__(
+        self, delay: Optional[float], percentile: Optional[float], window: int
+    ) -> None: ...
+    def get_delay(self) -> Optional[float]: ...
+    def observe(self, duration: float) -> None: ...
+    def outrun(self) -> None: ...
+    def issue(self) -> None: ...
+    def win(self) -> None: ...
+
+wrong_hedge_message: str
+wrong_delay_message: str
+wrong_percentile_message: str
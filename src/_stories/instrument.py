@@ -0,0 +1,221 @@
+from contextlib import contextmanager
+from itertools import count
+from threading import Lock
+
+from _stories.compat import ContextVar
+from _stories.compat import get_ident
+from _stories.compat import perf_counter
+from _stories.marker import BeginningOfStory
+from _stories.marker import EndOfStory
+from _stories.returned import Skip
+
+
+# FIXME: Instruments are registered in the current context.  Story
+# running in the thread pool will not notice instruments of the thread
+# which submitted it unless the context was copied.
+
+
+# Registry.
+
+
+registry = ContextVar("stories_instruments", default=())
+
+
+# Instruments installed for the whole process are seen by stories
+# running in any thread.  The tuple is replaced, never changed in
+# place, so readers do not need a lock.
+
+
+installed = ()
+
+
+installed_lock = Lock()
+
+
+def get_instruments():
+    return installed + registry.get()
+
+
+def install_instruments(*instruments):
+    global installed
+    with installed_lock:
+        installed = installed + instruments
+
+
+def uninstall_instruments(*instruments):
+    global installed
+    with installed_lock:
+        installed = tuple(
+            instrument
+            for instrument in installed
+            if all(instrument is not removed for removed in instruments)
+        )
+
+
+def add_instruments(*instruments):
+    registry.set(registry.get() + instruments)
+
+
+def remove_instruments(*instruments):
+    registry.set(
+        tuple(
+            instrument
+            for instrument in registry.get()
+            if all(instrument is not removed for removed in instruments)
+        )
+    )
+
+
+@contextmanager
+def instrumented(*instruments):
+    add_instruments(*instruments)
+    try:
+        yield
+    finally:
+        remove_instruments(*instruments)
+
+
+# Current step.
+
+
+# Active step is tracked in the current context, so concurrent stories
+# running in the same thread by the event loop do not interfere.  Steps
+# are also tracked per thread to be visible to the sampling profiler
+# from the outside of the thread.
+
+
+active_step = ContextVar("stories_active_step", default=None)
+
+
+current_steps = {}
+
+
+def current_step(thread_id=None):
+    if thread_id is None:
+        return active_step.get()
+    return current_steps.get(thread_id)
+
+
+# Instrument.
+
+
+class Instrument(object):
+    # Instruments which only look at the story runs do not make stories
+    # pay for the steps tracking.  Summaries of such runs have no steps.
+
+    observe_steps = True
+
+    def story_started(self, run):
+        pass
+
+    def step_started(self, step):
+        pass
+
+    def step_finished(self, step):
+        pass
+
+
+class Collector(Instrument):
+    def __init__(self):
+        self.runs = []
+
+    def story_started(self, run):
+        self.runs.append(run)
+
+
+class Step(object):
+    def __init__(self, run_id, path, method, parent):
+        self.run_id = run_id
+        self.path = path
+        self.cls_name = method.__self__.__class__.__name__
+        self.name = method.__name__
+        self.method = method
+        self.parent = parent
+        self.started = None
+        self.duration = None
+        self.waited = None
+        self.result = None
+        self.error = None
+        self.data = {}
+
+    @property
+    def qualname(self):
+        return self.cls_name + "." + self.name
+
+    def __repr__(self):
+        return "Step(" + " -> ".join(self.path + (self.qualname,)) + ")"
+
+
+# Probe.
+
+
+run_ids = count(1)
+
+
+def make_probe(ctx):
+    instruments = get_instruments()
+    if not instruments:
+        return null_probe
+    probe = Probe(
+        tuple(instrument for instrument in instruments if instrument.observe_steps), ctx
+    )
+    for instrument in instruments:
+        instrument.story_started(probe)
+    if not probe.instruments:
+        return null_probe
+    return probe
+
+
+class NullProbe(object):
+    steps = ()
+
+    def before_call(self, method, method_type):
+        pass
+
+    def after_call(self, step, result, error):
+        pass
+
+
+null_probe = NullProbe()
+
+
+class Probe(object):
+    def __init__(self, instruments, ctx):
+        self.instruments = instruments
+        self.run_id = next(run_ids)
+        self.ctx = ctx
+        self.path = ()
+        self.steps = []
+
+    def before_call(self, method, method_type):
+        if method_type is BeginningOfStory:
+            self.path += (method.cls_name + "." + method.name,)
+            return
+        if method_type is EndOfStory:
+            self.path = self.path[:-1]
+            return
+        step = Step(self.run_id, self.path, method, active_step.get())
+        active_step.set(step)
+        current_steps[get_ident()] = step
+        for instrument in self.instruments:
+            instrument.step_started(step)
+        step.started = perf_counter()
+        return step
+
+    def after_call(self, step, result, error):
+        if step is None:
+            return
+        step.duration = perf_counter() - step.started - (step.waited or 0.0)
+        step.result = result
+        step.error = error
+        self.steps.append(step)
+        if type(result) is Skip:
+            self.path = step.path[:-1]
+        active_step.set(step.parent)
+        thread_id = get_ident()
+        if step.parent is None:
+            current_steps.pop(thread_id, None)
+        else:
+            current_steps[thread_id] = step.parent
+        for instrument in reversed(self.instruments):
+            instrument.step_finished(step)
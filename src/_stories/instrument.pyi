@@ -0,0 +1,102 @@
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from _stories.compat import ContextVar
+from _stories.context import Context
+from _stories.marker import BeginningOfStory
+from _stories.marker import EndOfStory
+
+registry: ContextVar[Tuple[Instrument, ...]]
+
+
+installed: Tuple[Instrument, ...]
+installed_lock: Lock
+
+def get_instruments() -> Tuple[Instrument, ...]: ...
+def install_instruments(*instruments: Instrument) -> None: ...
+def uninstall_instruments(*instruments: Instrument) -> None: ...
+def add_instruments(*instruments: Instrument) -> None: ...
+def remove_instruments(*instruments: Instrument) -> None: ...
+def instrumented(*instruments: Instrument) -> ContextManager[None]: ...
+
+active_step: ContextVar[Optional[Step]]
+current_steps: Dict[int, Step]
+
+def current_step(thread_id: Optional[int] = ...) -> Optional[Step]: ...
+
+class Instrument:
+    observe_steps: bool
+    def story_started(self, run: Probe) -> None: ...
+    def step_started(self, step: Step) -> None: ...
+    def step_finished(self, step: Step) -> None: ...
+
+class Collector(Instrument):
+    runs: List[Probe]
+    def __init__(self) -> None: ...
+    def story_started(self, run: Probe) -> None: ...
+
+class Step:
+    run_id: int
+    path: Tuple[str, ...]
+    cls_name: str
+    name: str
+    method: Callable
+    parent: Optional[Step]
+    started: Optional[float]
+    duration: Optional[float]
+    waited: Optional[float]
+    result: Any
+    error: Optional[Exception]
+    data: Dict[str, Any]
+    def __init__(
+        self,
+        run_id: int,
+        path: Tuple[str, ...],
+        method: Callable,
+        parent: Optional[Step],
+    ) -> None: ...
+    @property
+    def qualname(self) -> str: ...
+    def __repr__(self) -> str: ...
+
+run_ids: Iterator[int]
+
+def make_probe(ctx: Context) -> Union[Probe, NullProbe]: ...
+
+class NullProbe:
+    steps: Tuple[()]
+    def before_call(
+        self,
+        method: Union[BeginningOfStory, Callable, EndOfStory],
+        method_type: Type,
+    ) -> None: ...
+    def after_call(
+        self, step: Optional[Step], result: Any, error: Optional[Exception]
+    ) -> None: ...
+
+null_probe: NullProbe
+
+class Probe:
+    instruments: Tuple[Instrument, ...]
+    run_id: int
+    ctx: Context
+    path: Tuple[str, ...]
+    steps: List[Step]
+    def __init__(self, instruments: Tuple[Instrument, ...], ctx: Context) -> None: ...
+    def before_call(
+        self,
+        method: Union[BeginningOfStory, Callable, EndOfStory],
+        method_type: Type,
+    ) -> Optional[Step]: ...
+    def after_call(
+        self, step: Optional[Step], result: Any, error: Optional[Exception]
+    ) -> None: ...
@@ -0,0 +1,229 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from pickle import dumps  # nosec: B403
+from pickle import loads  # nosec: B403
+from threading import local
+from time import time
+
+
+# Jobs are claimed for the visibility timeout.  The worker extends it
+# when the job starts, so jobs waiting behind others in the same batch
+# do not run out of time.  If the worker died before it finished the
+# job, other worker will claim it again once the timeout expires.  Each
+# claim counts as an attempt.  The worker which lost the job to other
+# claim can neither start nor finish it.
+#
+# Arguments and summaries are pickled.  The queue is a local file
+# written by the application itself.  Do not point the worker to the
+# database other users could write to.
+
+
+def enqueue(story, kwargs):
+    return get_queue(default_path()).put(story_path(story), kwargs)
+
+
+def story_path(story):
+    return type(story.obj).__module__ + ":" + story.cls_name + "." + story.name
+
+
+def default_path():
+    return os.environ.get("STORIES_QUEUE", "stories.sqlite3")
+
+
+# SQLite connection can not be used by other threads.
+
+
+connections = local()
+
+
+def get_queue(path):
+    queues = connections.__dict__.setdefault("queues", {})
+    if path not in queues:
+        queues[path] = Queue(path)
+    return queues[path]
+
+
+class Queue(object):
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(create_table_sql)
+
+    def put(self, story, kwargs):
+        cursor = self.connection.execute(insert_job_sql, (story, dumps(kwargs), time()))
+        return cursor.lastrowid
+
+    def claim(self, story, limit, timeout, retries):
+        now = time()
+        with self.transaction():
+            self.connection.execute(
+                exhaust_jobs_sql, (exhausted_message, story, now, retries + 1)
+            )
+            rows = self.connection.execute(
+                select_jobs_sql, (story, now, limit)
+            ).fetchall()
+            self.connection.executemany(
+                claim_job_sql, [(now + timeout, row[0]) for row in rows]
+            )
+        return [
+            Job(
+                job_id,
+                story,
+                loads(kwargs),  # nosec: B301
+                "queued",
+                attempts + 1,
+                None,
+                None,
+            )
+            for job_id, kwargs, attempts in rows
+        ]
+
+    def extend(self, job, timeout):
+        cursor = self.connection.execute(
+            extend_job_sql, (time() + timeout, job.id, job.attempts)
+        )
+        return cursor.rowcount == 1
+
+    def finish(self, jobs, backoff=0):
+        now = time()
+        with self.transaction():
+            self.connection.executemany(
+                finish_job_sql,
+                [
+                    (
+                        job.state,
+                        None if job.summary is None else dumps(job.summary),
+                        job.error,
+                        now + retry_delay(job, backoff),
+                        job.id,
+                        job.attempts,
+                    )
+                    for job in jobs
+                ],
+            )
+
+    def get(self, job_id):
+        row = self.connection.execute(get_job_sql, (job_id,)).fetchone()
+        if row is None:
+            return None
+        job_id, story, kwargs, state, attempts, summary, error = row
+        return Job(
+            job_id,
+            story,
+            loads(kwargs),  # nosec: B301
+            state,
+            attempts,
+            None if summary is None else loads(summary),  # nosec: B301
+            error,
+        )
+
+    def count(self, state):
+        return self.connection.execute(count_jobs_sql, (state,)).fetchone()[0]
+
+    @contextmanager
+    def transaction(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def close(self):
+        self.connection.close()
+
+
+# Failed job waits before the next attempt.  The delay doubles with
+# each attempt.
+
+
+def retry_delay(job, backoff):
+    if job.state != "queued":
+        return 0
+    return backoff * 2 ** (job.attempts - 1)
+
+
+class Job(object):
+    def __init__(self, job_id, story, kwargs, state, attempts, summary, error):
+        self.id = job_id
+        self.story = story
+        self.kwargs = kwargs
+        self.state = state
+        self.attempts = attempts
+        self.summary = summary
+        self.error = error
+
+    def __repr__(self):
+        return "Job(%d, %r, %s)" % (self.id, self.story, self.state)
+
+
+# Queries.
+
+
+create_table_sql = """
+CREATE TABLE IF NOT EXISTS stories_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    story TEXT NOT NULL,
+    kwargs BLOB NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    visible_at REAL NOT NULL,
+    summary BLOB,
+    error TEXT
+)
+""".strip()
+
+
+insert_job_sql = """
+INSERT INTO stories_jobs (story, kwargs, visible_at) VALUES (?, ?, ?)
+""".strip()
+
+
+exhaust_jobs_sql = """
+UPDATE stories_jobs SET state = 'error', error = ?
+WHERE story = ? AND state = 'queued' AND visible_at <= ? AND attempts >= ?
+""".strip()
+
+
+select_jobs_sql = """
+SELECT id, kwargs, attempts FROM stories_jobs
+WHERE story = ? AND state = 'queued' AND visible_at <= ?
+ORDER BY id LIMIT ?
+""".strip()
+
+
+claim_job_sql = """
+UPDATE stories_jobs SET attempts = attempts + 1, visible_at = ? WHERE id = ?
+""".strip()
+
+
+extend_job_sql = """
+UPDATE stories_jobs SET visible_at = ?
+WHERE id = ? AND attempts = ? AND state = 'queued'
+""".strip()
+
+
+finish_job_sql = """
+UPDATE stories_jobs SET state = ?, summary = ?, error = ?, visible_at = ?
+WHERE id = ? AND attempts = ? AND state = 'queued'
+""".strip()
+
+
+get_job_sql = """
+SELECT id, story, kwargs, state, attempts, summary, error FROM stories_jobs
+WHERE id = ?
+""".strip()
+
+
+count_jobs_sql = """
+SELECT count(*) FROM stories_jobs WHERE state = ?
+""".strip()
+
+
+# Messages.
+
+
+exhausted_message = "Visibility timeout expired on the last attempt"
@@ -0,0 +1,68 @@
+from sqlite3 import Connection
+from threading import local
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from _stories.mounted import MountedStory
+from _stories.summary import FailureSummary
+from _stories.summary import SuccessSummary
+
+def enqueue(story: MountedStory, kwargs: Dict[str, Any]) -> int: ...
+def story_path(story: MountedStory) -> str: ...
+def default_path() -> str: ...
+
+connections: local
+
+def get_queue(path: str) -> Queue: ...
+
+class Queue:
+    path: str
+    connection: Connection
+    def __init__(self, path: str) -> None: ...
+    def put(self, story: str, kwargs: Dict[str, Any]) -> int: ...
+    def claim(
+        self, story: str, limit: int, timeout: float, retries: int
+    ) -> List[Job]: ...
+    def extend(self, job: Job, timeout: float) -> bool: ...
+    def finish(self, jobs: List[Job], backoff: float = ...) -> None: ...
+    def get(self, job_id: int) -> Optional[Job]: ...
+    def count(self, state: str) -> int: ...
+    def transaction(self) -> ContextManager[None]: ...
+    def close(self) -> None: ...
+
+def retry_delay(job: Job, backoff: float) -> float: ...
+
+class Job:
+    id: int
+    story: str
+    kwargs: Dict[str, Any]
+    state: str
+    attempts: int
+    summary: Optional[Union[SuccessSummary, FailureSummary]]
+    error: Optional[str]
+    def __init__(
+        self,
+        job_id: int,
+        story: str,
+        kwargs: Dict[str, Any],
+        state: str,
+        attempts: int,
+        summary: Optional[Union[SuccessSummary, FailureSummary]],
+        error: Optional[str],
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+
+create_table_sql: str
+insert_job_sql: str
+exhaust_jobs_sql: str
+select_jobs_sql: str
+claim_job_sql: str
+extend_job_sql: str
+finish_job_sql: str
+get_job_sql: str
+count_jobs_sql: str
+exhausted_message: str
@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+from inspect import iscoroutinefunction
+
+from _stories.compat import ContextVar
+from _stories.compat import copy_context
+from _stories.compat import ensure_future
+from _stories.compat import get_event_loop
+from _stories.compat import shield
+from _stories.executors import get_executor
+from _stories.executors import get_group
+
+
+# Keys loaded in the same tick of the event loop are fetched together.
+# Loaded values are cached for the scope, so concurrent stories of the
+# same request share them.  Without the scope, values are cached for
+# the story run.  Failed and cancelled loads are not cached.
+#
+# Every caller awaits its own waiter, so the caller cancelled by its
+# deadline does not cancel the load for others.
+
+
+cache = ContextVar("stories_loader_cache", default=None)
+
+
+@contextmanager
+def scope():
+    previous = cache.get()
+    cache.set({})
+    try:
+        yield
+    finally:
+        cache.set(previous)
+
+
+@contextmanager
+def run_scope():
+    if cache.get() is not None:
+        yield
+        return
+    with scope():
+        yield
+
+
+class Loader(object):
+    def __init__(self, batch):
+        self.batch = batch
+        self.pending = {}
+
+    def load(self, key):
+        loaded = cache.get()
+        if loaded is not None and (self, key) in loaded:
+            return shield(loaded[self, key])
+        loop = get_event_loop()
+        pending = self.pending.get(loop)
+        if pending is None:
+            pending = self.pending[loop] = {}
+            loop.call_soon(self.dispatch, loop)
+        future = pending.get(key)
+        if future is None:
+            future = pending[key] = loop.create_future()
+        if loaded is not None:
+            loaded[self, key] = future
+            future.add_done_callback(lambda future: forget(loaded, self, key, future))
+        return shield(future)
+
+    def dispatch(self, loop):
+        pending = self.pending.pop(loop)
+        keys = list(pending)
+        if iscoroutinefunction(self.batch):
+            task = ensure_future(self.batch(keys))
+        else:
+            executor = get_executor(get_group(self.batch))
+            context = copy_context()
+            task = loop.run_in_executor(executor, context.run, self.batch, keys)
+        task.add_done_callback(lambda task: resolve(pending, task))
+
+
+def forget(loaded, loader, key, future):
+    if future.cancelled() or future.exception() is not None:
+        if loaded.get((loader, key)) is future:
+            del loaded[loader, key]
+
+
+def resolve(pending, task):
+    if task.cancelled():
+        for future in pending.values():
+            future.cancel()
+        return
+    error = task.exception()
+    if error is None:
+        values = list(task.result())
+        if len(values) != len(pending):
+            error = AssertionError(
+                wrong_batch_template.format(keys=len(pending), values=len(values))
+            )
+    for index, future in enumerate(pending.values()):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(values[index])
+
+
+# Messages.
+
+
+wrong_batch_template = """
+Loader batch function should return one value for each key.
+
+Got {values} values for {keys} keys.
+""".strip()
@@ -0,0 +1,44 @@
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from _stories.compat import ContextVar
+
+cache: ContextVar[Optional[Dict[Tuple[Loader, Hashable], Future]]]
+
+def scope() -> ContextManager[None]: ...
+def run_scope() -> ContextManager[None]: ...
+
+class Loader:
+    batch: Callable[
+        [List[Hashable]], Union[Sequence[Any], Awaitable[Sequence[Any]]]
+    ]
+    pending: Dict[AbstractEventLoop, Dict[Hashable, Future]]
+    def __init__(
+        self,
+        batch: Callable[
+            [List[Hashable]], Union[Sequence[Any], Awaitable[Sequence[Any]]]
+        ],
+    ) -> None: ...
+    def load(self, key: Hashable) -> Future: ...
+    def dispatch(self, loop: AbstractEventLoop) -> None: ...
+
+def forget(
+    loaded: Dict[Tuple[Loader, Hashable], Future],
+    loader: Loader,
+    key: Hashable,
+    future: Future,
+) -> None: ...
+def resolve(pending: Dict[Hashable, Future], task: Future) -> None: ...
+
+wrong_batch_template: str
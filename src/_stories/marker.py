@@ -2,11 +2,14 @@ from _stories.returned import Success
 
 
 class BeginningOfStory(object):
-    def __init__(self, cls_name, name):
+    def __init__(
+        self, cls_name, name, parent_name=None, same_object=None, bulkhead=None
+    ):
         self.cls_name = cls_name
         self.name = name
-        self.parent_name = None
-        self.same_object = None
+        self.parent_name = parent_name
+        self.same_object = same_object
+        self.bulkhead = bulkhead
 
     def __call__(self, ctx):
         return Success()
@@ -20,9 +23,10 @@ class BeginningOfStory(object):
         else:
             return self.parent_name + " (" + self.cls_name + "." + self.name + ")"
 
-    def set_parent(self, parent_name, same_object):
-        self.parent_name = parent_name
-        self.same_object = same_object
+    def with_parent(self, parent_name, same_object):
+        return BeginningOfStory(
+            self.cls_name, self.name, parent_name, same_object, self.bulkhead
+        )
 
 
 class EndOfStory(object):
@@ -33,3 +37,18 @@ class EndOfStory(object):
         return Success()
 
     __name__ = "end_of_story"
+
+
+class Parallel(object):
+    def __init__(self, methods):
+        self.methods = methods
+
+    __name__ = "parallel"
+
+
+class Dataflow(object):
+    def __init__(self, methods, reads):
+        self.methods = methods
+        self.reads = reads
+
+    __name__ = "dataflow"
@@ -1,11 +1,48 @@
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _stories.bulkhead import Bulkhead
 from _stories.context import Context
+from _stories.returned import Failure
+from _stories.returned import Result
+from _stories.returned import Skip
 from _stories.returned import Success
 
 class BeginningOfStory:
-    def __init__(self, cls_name: str, name: str) -> None: ...
+    cls_name: str
+    name: str
+    parent_name: Optional[str]
+    same_object: Optional[bool]
+    bulkhead: Optional[Bulkhead]
+    def __init__(
+        self,
+        cls_name: str,
+        name: str,
+        parent_name: Optional[str] = ...,
+        same_object: Optional[bool] = ...,
+        bulkhead: Optional[Bulkhead] = ...,
+    ) -> None: ...
     def __call__(self, ctx: Context) -> Success: ...
-    def set_parent(self, parent_name: str, same_object: bool) -> None: ...
+    def with_parent(self, parent_name: str, same_object: bool) -> BeginningOfStory: ...
 
 class EndOfStory:
     def __init__(self, is_empty: bool) -> None: ...
     def __call__(self, ctx: Context) -> Success: ...
+
+class Parallel:
+    methods: List[Callable[[Context], Union[Result, Success, Failure, Skip]]]
+    def __init__(
+        self, methods: List[Callable[[Context], Union[Result, Success, Failure, Skip]]]
+    ) -> None: ...
+
+class Dataflow:
+    methods: List[Callable[[Context], Union[Result, Success, Failure, Skip]]]
+    reads: List[Tuple[str, ...]]
+    def __init__(
+        self,
+        methods: List[Callable[[Context], Union[Result, Success, Failure, Skip]]],
+        reads: List[Tuple[str, ...]],
+    ) -> None: ...
@@ -1,25 +1,62 @@
+from _stories.checkpoint import make_checkpoint
+from _stories.checkpoint import restore_checkpoint
+from _stories.collect import FanOutCall
 from _stories.context import make_context
+from _stories.exceptions import StoryError
 from _stories.execute import function
+from _stories.execute import many
 from _stories.failures import make_run_protocol
+from _stories.fanout import FanOut
 from _stories.history import History
+from _stories.instrument import make_probe
+from _stories.jobs import enqueue
+from _stories.jobs import story_path
 from _stories.marker import BeginningOfStory
+from _stories.marker import Dataflow
 from _stories.marker import EndOfStory
+from _stories.marker import Parallel
 from _stories.run import Call
 from _stories.run import Run
+from _stories.stream import imap
+
+
+try:
+    from _stories.execute import coroutine
+except SyntaxError:
+    # We are on Python 2.7
+    coroutine = None
 
 
 class ClassMountedStory(object):
-    def __init__(self, cls, name, collected, contract, failures):
+    def __init__(self, cls, name, collected, contract, failures, coalesce, checkpoint):
         self.cls = cls
         self.name = name
         self.collected = collected
         self.contract = contract
         self.failures = failures
+        self.coalesce = coalesce
+        self.checkpoint = checkpoint
 
     def __repr__(self):
         result = [self.cls.__name__ + "." + self.name]
         if self.collected:
             for name in self.collected:
+                if type(name) is FanOutCall:
+                    attr = getattr(self.cls, name.name, None)
+                    if type(attr) is ClassMountedStory:
+                        result.append("  " + name.name + " (fan-out)")
+                        result.extend(
+                            ["  " + line for line in repr(attr).splitlines()[1:]]
+                        )
+                    else:
+                        result.append("  " + name.name + " (fan-out) ??")
+                    continue
+                if type(name) is tuple:
+                    result.append("  parallel")
+                    for member in name:
+                        defined = "" if getattr(self.cls, member, None) else " ??"
+                        result.append("    " + member + defined)
+                    continue
                 attr = getattr(self.cls, name, None)
                 if type(attr) is ClassMountedStory:
                     result.append("  " + attr.name)
@@ -33,7 +70,18 @@ class ClassMountedStory(object):
 
 
 class MountedStory(object):
-    def __init__(self, obj, cls_name, name, arguments, methods, contract, failures):
+    def __init__(
+        self,
+        obj,
+        cls_name,
+        name,
+        arguments,
+        methods,
+        contract,
+        failures,
+        flights,
+        checkpoints,
+    ):
         self.obj = obj
         self.cls_name = cls_name
         self.name = name
@@ -41,21 +89,75 @@ class MountedStory(object):
         self.methods = methods
         self.contract = contract
         self.failures = failures
+        self.flights = flights
+        self.checkpoints = checkpoints
 
     def __call__(self, **kwargs):
         __tracebackhide__ = True
-        history = History()
-        ctx = make_context(self.methods[0][1], kwargs, history)
-        runner = Call()
-        return function.execute(runner, ctx, history, self.methods)
+        if self.flights is not None:
+            return self.flights.join(call_story, self, kwargs)
+        return call_story(self, kwargs)
 
     def run(self, **kwargs):
         __tracebackhide__ = True
-        history = History()
-        ctx = make_context(self.methods[0][1], kwargs, history)
+        if self.flights is not None:
+            return self.flights.join(run_story, self, kwargs)
+        return run_story(self, kwargs)
+
+    def run_many(self, kwargs_list):
+        __tracebackhide__ = True
+        contract = self.methods[0][1]
+        run_protocol = make_run_protocol(self.failures, self.cls_name, self.name)
+        items = []
+        for kwargs in kwargs_list:
+            history = History()
+            ctx = make_context(contract, kwargs, history)
+            probe = make_probe(ctx)
+            runner = Run(run_protocol, probe)
+            items.append(many.Item(runner, ctx, history, probe))
+        return many.execute(items, self.methods)
+
+    def imap(self, kwargs_iterable, workers=4, ordered=True):
+        return imap(self, kwargs_iterable, workers, ordered)
+
+    def enqueue(self, **kwargs):
+        return enqueue(self, kwargs)
+
+    def resume(self, run_id):
+        __tracebackhide__ = True
+        ctx, history, checkpoint = restore_checkpoint(self, run_id)
+        probe = make_probe(ctx)
+        run_protocol = make_run_protocol(self.failures, self.cls_name, self.name)
+        runner = Run(run_protocol, probe)
+        return function.execute(runner, ctx, history, probe, self.methods, checkpoint)
+
+    def resume_async(self, run_id):
+        __tracebackhide__ = True
+        check_coroutines()
+        ctx, history, checkpoint = restore_checkpoint(self, run_id)
+        probe = make_probe(ctx)
         run_protocol = make_run_protocol(self.failures, self.cls_name, self.name)
-        runner = Run(run_protocol)
-        return function.execute(runner, ctx, history, self.methods)
+        runner = Run(run_protocol, probe)
+        return coroutine.execute(runner, ctx, history, probe, self.methods, checkpoint)
+
+    def pending(self):
+        if self.checkpoints is None:
+            return []
+        return self.checkpoints.pending(story_path(self))
+
+    def acall(self, **kwargs):
+        __tracebackhide__ = True
+        check_coroutines()
+        if self.flights is not None:
+            return coroutine.join_flight(self.flights, acall_story, self, kwargs)
+        return acall_story(self, kwargs)
+
+    def run_async(self, **kwargs):
+        __tracebackhide__ = True
+        check_coroutines()
+        if self.flights is not None:
+            return coroutine.join_flight(self.flights, run_story_async, self, kwargs)
+        return run_story_async(self, kwargs)
 
     def __repr__(self):
         result = []
@@ -66,8 +168,72 @@ class MountedStory(object):
                 if method.is_empty:
                     result.append("  " * indent + "<empty>")
                 indent -= 1
+            elif method_type is FanOut:
+                result.append("  " * indent + method.__name__ + " (fan-out)")
+                result.extend(
+                    "  " * indent + line for line in repr(method.story).splitlines()[1:]
+                )
+            elif method_type is Dataflow:
+                for member in method.methods:
+                    result.append("  " * indent + member.__name__)
             else:
                 result.append("  " * indent + method.__name__)
                 if method_type is BeginningOfStory:
                     indent += 1
+                elif method_type is Parallel:
+                    for member in method.methods:
+                        result.append("  " * (indent + 1) + member.__name__)
         return "\n".join(result)
+
+
+def check_coroutines():
+    if coroutine is None:
+        raise StoryError(no_coroutines_message)
+
+
+def call_story(story, kwargs):
+    __tracebackhide__ = True
+    history = History()
+    ctx = make_context(story.methods[0][1], kwargs, history)
+    checkpoint = make_checkpoint(story, kwargs, history)
+    probe = make_probe(ctx)
+    runner = Call()
+    return function.execute(runner, ctx, history, probe, story.methods, checkpoint)
+
+
+def run_story(story, kwargs):
+    __tracebackhide__ = True
+    history = History()
+    ctx = make_context(story.methods[0][1], kwargs, history)
+    checkpoint = make_checkpoint(story, kwargs, history)
+    probe = make_probe(ctx)
+    run_protocol = make_run_protocol(story.failures, story.cls_name, story.name)
+    runner = Run(run_protocol, probe)
+    return function.execute(runner, ctx, history, probe, story.methods, checkpoint)
+
+
+def acall_story(story, kwargs):
+    __tracebackhide__ = True
+    history = History()
+    ctx = make_context(story.methods[0][1], kwargs, history)
+    checkpoint = make_checkpoint(story, kwargs, history)
+    probe = make_probe(ctx)
+    runner = Call()
+    return coroutine.execute(runner, ctx, history, probe, story.methods, checkpoint)
+
+
+def run_story_async(story, kwargs):
+    __tracebackhide__ = True
+    history = History()
+    ctx = make_context(story.methods[0][1], kwargs, history)
+    checkpoint = make_checkpoint(story, kwargs, history)
+    probe = make_probe(ctx)
+    run_protocol = make_run_protocol(story.failures, story.cls_name, story.name)
+    runner = Run(run_protocol, probe)
+    return coroutine.execute(runner, ctx, history, probe, story.methods, checkpoint)
+
+
+# Messages.
+
+
+no_coroutines_message = "Stories could be awaited on Python 3.5 and newer only"
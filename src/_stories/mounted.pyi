@@ -1,7 +1,10 @@
 from enum import Enum
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -12,6 +15,7 @@ from _stories.contract import NullContract
 from _stories.contract import SpecContract
 from _stories.failures import NotNullExecProtocol
 from _stories.failures import NullExecProtocol
+from _stories.flights import Flights
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
 from _stories.summary import FailureSummary
@@ -22,9 +26,11 @@ class ClassMountedStory:
         self,
         cls: Any,
         name: str,
-        collected: List[str],
+        collected: List[Union[str, Tuple[str, ...]]],
         contract: Callable[[Any], Any],
         failures: Callable[[Any], Optional[Union[List[str], Type[Enum]]]],
+        coalesce: Callable[[], Flights],
+        checkpoint: Callable[[Any], Any],
     ) -> None: ...
     def __repr__(self) -> str: ...
 
@@ -44,9 +50,48 @@ class MountedStory:
         ],
         contract: NullContract,
         failures: Optional[Union[List[str], Type[Enum]]],
+        flights: Optional[Flights],
+        checkpoints: Any,
     ) -> None: ...
     def __call__(self, **kwargs: Dict[str, Any]) -> Optional[Union[List[str], int]]: ...
     def run(
         self, **kwargs: Dict[str, Any]
     ) -> Union[SuccessSummary, FailureSummary]: ...
+    def enqueue(self, **kwargs: Any) -> int: ...
+    def resume(self, run_id: str) -> Union[SuccessSummary, FailureSummary]: ...
+    def resume_async(
+        self, run_id: str
+    ) -> Awaitable[Union[SuccessSummary, FailureSummary]]: ...
+    def pending(self) -> List[str]: ...
+    def run_many(
+        self, kwargs_list: Iterable[Dict[str, Any]]
+    ) -> List[Union[SuccessSummary, FailureSummary]]: ...
+    def imap(
+        self,
+        kwargs_iterable: Iterable[Dict[str, Any]],
+        workers: int = ...,
+        ordered: bool = ...,
+    ) -> Iterator[Union[SuccessSummary, FailureSummary]]: ...
+    def acall(
+        self, **kwargs: Dict[str, Any]
+    ) -> Awaitable[Optional[Union[List[str], int]]]: ...
+    def run_async(
+        self, **kwargs: Dict[str, Any]
+    ) -> Awaitable[Union[SuccessSummary, FailureSummary]]: ...
     def __repr__(self) -> str: ...
+
+def check_coroutines() -> None: ...
+def call_story(
+    story: MountedStory, kwargs: Dict[str, Any]
+) -> Optional[Union[List[str], int]]: ...
+def run_story(
+    story: MountedStory, kwargs: Dict[str, Any]
+) -> Union[SuccessSummary, FailureSummary]: ...
+def acall_story(
+    story: MountedStory, kwargs: Dict[str, Any]
+) -> Awaitable[Optional[Union[List[str], int]]]: ...
+def run_story_async(
+    story: MountedStory, kwargs: Dict[str, Any]
+) -> Awaitable[Union[SuccessSummary, FailureSummary]]: ...
+
+no_coroutines_message: str
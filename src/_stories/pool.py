@@ -0,0 +1,145 @@
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from _stories.compat import ensure_running
+from _stories.compat import InterpreterPoolExecutor
+from _stories.compat import SharedMemory
+from _stories.shared import discard
+from _stories.shared import pack
+from _stories.shared import Packed
+from _stories.shared import unlink
+from _stories.shared import unpack
+from _stories.stream import stream
+
+
+# Each worker process builds the service object on its first task and
+# reuses the story bound to it.  Initializer of the process pool is
+# not used, since it is not available before Python 3.7.  Summaries
+# are detached from the context and steps before they are sent back to
+# the parent process.  Large buffers go both ways through shared memory
+# instead of the pickle.
+#
+# Interpreter pool does the same with subinterpreters of the current
+# process on Python 3.14 and newer.  Values are pickled between
+# interpreters, shared memory blocks are not used.  It falls back to
+# worker processes on older versions.
+
+
+class ProcessPool(object):
+    engine = "processes"
+
+    def __init__(self, factory, story_name, workers=None, shared=1024 * 1024):
+        if SharedMemory is None:
+            shared = None
+        if shared is not None:
+            # Workers should register blocks in the resource tracker of
+            # the parent process which unlinks them.
+            ensure_running()
+        self.workers = workers or 1
+        self.shared = shared
+        self.initargs = (factory, story_name, shared)
+        self.executor = self.make_executor(workers)
+
+    def make_executor(self, workers):
+        return ProcessPoolExecutor(workers)
+
+    def run_many(self, kwargs_list, chunksize=100):
+        kwargs_list = list(kwargs_list)
+        futures = [
+            self.submit(run_chunk, kwargs_list[start : start + chunksize])  # noqa
+            for start in range(0, len(kwargs_list), chunksize)
+        ]
+        return [summary for future in futures for summary in future.result()]
+
+    def imap(self, kwargs_iterable, ordered=True):
+        submit = partial(self.submit, run_detached)
+        return stream(submit, kwargs_iterable, self.workers * 2, ordered)
+
+    def submit(self, f, value):
+        if self.shared is None:
+            return self.executor.submit(f, self.initargs, value)
+        packed, segments = pack(value, self.shared)
+        received = Future()
+
+        def done(future):
+            unlink(segments)
+            try:
+                received.set_result(receive(future.result()))
+            except Exception as error:
+                received.set_exception(error)
+
+        try:
+            future = self.executor.submit(f, self.initargs, packed)
+        except BaseException:  # noqa: B036
+            discard(segments)
+            raise
+        future.add_done_callback(done)
+        return received
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+class InterpreterPool(ProcessPool):
+    engine = "processes" if InterpreterPoolExecutor is None else "interpreters"
+
+    def __init__(self, factory, story_name, workers=None, shared=1024 * 1024):
+        if InterpreterPoolExecutor is not None:
+            shared = None
+        super(InterpreterPool, self).__init__(factory, story_name, workers, shared)
+
+    def make_executor(self, workers):
+        if InterpreterPoolExecutor is None:
+            return super(InterpreterPool, self).make_executor(workers)
+        return InterpreterPoolExecutor(workers)
+
+
+def receive(packed):
+    value, segments = unpack(packed)
+    unlink(segments)
+    return value
+
+
+# Worker.
+
+
+worker = {}
+
+
+def init_worker(factory, story_name, shared):
+    if "story" not in worker:
+        worker["story"] = getattr(factory(), story_name)
+        worker["shared"] = shared
+
+
+def run_chunk(initargs, kwargs_list):
+    init_worker(*initargs)
+    return transfer(run_summaries, kwargs_list)
+
+
+def run_detached(initargs, kwargs):
+    init_worker(*initargs)
+    return transfer(run_summary, kwargs)
+
+
+def transfer(f, value):
+    if not isinstance(value, Packed):
+        return f(value)
+    value, _ = unpack(value)
+    packed, _ = pack(f(value), worker["shared"])
+    return packed
+
+
+def run_summaries(kwargs_list):
+    return [summary.detach() for summary in worker["story"].run_many(kwargs_list)]
+
+
+def run_summary(kwargs):
+    return worker["story"].run(**kwargs).detach()
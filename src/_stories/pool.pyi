@@ -0,0 +1,73 @@
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from _stories.shared import Packed
+from _stories.summary import FailureSummary
+from _stories.summary import SuccessSummary
+
+class ProcessPool:
+    engine: str
+    workers: int
+    shared: Optional[int]
+    initargs: Tuple[Callable[[], Any], str, Optional[int]]
+    executor: ProcessPoolExecutor
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        story_name: str,
+        workers: Optional[int] = ...,
+        shared: Optional[int] = ...,
+    ) -> None: ...
+    def make_executor(self, workers: int) -> Executor: ...
+    def run_many(
+        self, kwargs_list: Iterable[Dict[str, Any]], chunksize: int = ...
+    ) -> List[Union[SuccessSummary, FailureSummary]]: ...
+    def imap(
+        self, kwargs_iterable: Iterable[Dict[str, Any]], ordered: bool = ...
+    ) -> Iterator[Union[SuccessSummary, FailureSummary]]: ...
+    def submit(
+        self, f: Callable[[Tuple[Any, ...], Any], Any], value: Any
+    ) -> Future: ...
+    def shutdown(self) -> None: ...
+    def __enter__(self) -> ProcessPool: ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+
+class InterpreterPool(ProcessPool): ...
+
+def receive(packed: Packed) -> Any: ...
+
+worker: Dict[str, Any]
+
+def init_worker(
+    factory: Callable[[], Any], story_name: str, shared: Optional[int]
+) -> None: ...
+def run_chunk(
+    initargs: Tuple[Callable[[], Any], str, Optional[int]],
+    kwargs_list: Union[Packed, List[Dict[str, Any]]],
+) -> Any: ...
+def run_detached(
+    initargs: Tuple[Callable[[], Any], str, Optional[int]],
+    kwargs: Union[Packed, Dict[str, Any]],
+) -> Any: ...
+def transfer(f: Callable[[Any], Any], value: Union[Packed, Any]) -> Any: ...
+def run_summaries(
+    kwargs_list: List[Dict[str, Any]]
+) -> List[Union[SuccessSummary, FailureSummary]]: ...
+def run_summary(kwargs: Dict[str, Any]) -> Union[SuccessSummary, FailureSummary]: ...
@@ -9,6 +9,11 @@ class Result(object):
 class Success(object):
     def __init__(self, **kwargs):
         self.kwargs = kwargs
+        self.effects = ()
+
+    def defer(self, effect, *args):
+        self.effects += ((effect, args),)
+        return self
 
     def __repr__(self):
         return (
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Union
@@ -10,6 +11,7 @@ class Result:
 
 class Success:
     def __init__(self, **kwargs: Dict[str, Any]) -> None: ...
+    def defer(self, effect: Callable, *args: Any) -> Success: ...
     def __repr__(self) -> str: ...
 
 class Failure:
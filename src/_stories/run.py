@@ -4,6 +4,8 @@ from _stories.summary import SuccessSummary
 
 
 class Call(object):
+    nested = False
+
     def got_failure(self, ctx, method_name, reason):
         raise FailureError(reason)
 
@@ -15,14 +17,18 @@ class Call(object):
 
 
 class Run(object):
-    def __init__(self, protocol):
+    def __init__(self, protocol, probe, nested=False):
         self.protocol = protocol
+        self.probe = probe
+        # Nested runs leave deferred effects in the context.  The parent
+        # story makes them together with its own.
+        self.nested = nested
 
     def got_failure(self, ctx, method_name, reason):
-        return FailureSummary(self.protocol, ctx, method_name, reason)
+        return FailureSummary(self.protocol, ctx, method_name, reason, self.probe.steps)
 
     def got_result(self, value):
-        return SuccessSummary(self.protocol, value)
+        return SuccessSummary(self.protocol, value, self.probe.steps)
 
     def finished(self):
-        return SuccessSummary(self.protocol, None)
+        return SuccessSummary(self.protocol, None, self.probe.steps)
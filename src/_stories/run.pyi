@@ -7,10 +7,13 @@ from typing import Union
 from _stories.context import Context
 from _stories.failures import NotNullRunProtocol
 from _stories.failures import NullRunProtocol
+from _stories.instrument import NullProbe
+from _stories.instrument import Probe
 from _stories.summary import FailureSummary
 from _stories.summary import SuccessSummary
 
 class Call:
+    nested: bool
     def got_failure(
         self, ctx: Context, method_name: str, reason: Optional[Union[str, Enum]]
     ) -> NoReturn: ...
@@ -18,8 +21,12 @@ class Call:
     def finished(self) -> None: ...
 
 class Run:
+    nested: bool
     def __init__(
-        self, protocol: Union[NotNullRunProtocol, NullRunProtocol]
+        self,
+        protocol: Union[NotNullRunProtocol, NullRunProtocol],
+        probe: Union[Probe, NullProbe],
+        nested: bool = ...,
     ) -> None: ...
     def got_failure(
         self, ctx: Context, method_name: str, reason: Optional[Union[str, Enum]]
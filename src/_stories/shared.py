@@ -0,0 +1,80 @@
+from pickle import dumps  # nosec: B403
+from pickle import loads  # nosec: B403
+
+from _stories.compat import SharedMemory
+
+
+# Buffers larger than the threshold are moved out of the pickle into
+# shared memory blocks.  The receiving side maps the same blocks and
+# gets values backed by them without a copy.  The parent process
+# unlinks blocks going both ways once the other side mapped them.  The
+# mapping is owned by the values using it and is closed with the last
+# of them.  Both sides are processes of the same pool, so the pickle is
+# as trusted as the arguments passed to the pool.
+
+
+class Packed(object):
+    def __init__(self, data, blocks):
+        self.data = data
+        self.blocks = blocks
+
+
+def pack(value, threshold):
+    segments = []
+
+    def out_of_band(buffer):
+        try:
+            view = buffer.raw()
+        except BufferError:
+            # Non-contiguous buffer.
+            return True
+        if view.nbytes < threshold:
+            return True
+        segment = SharedMemory(create=True, size=max(view.nbytes, 1))
+        segments.append((segment, view.nbytes))
+        segment.buf[: view.nbytes] = view
+        segment.close()
+        return False
+
+    try:
+        data = dumps(value, protocol=5, buffer_callback=out_of_band)
+    except BaseException:  # noqa: B036
+        # Blocks already created would never be received.
+        discard([segment for segment, _ in segments])
+        raise
+    blocks = [(segment.name, size) for segment, size in segments]
+    return Packed(data, blocks), [segment for segment, _ in segments]
+
+
+def unpack(packed):
+    segments = []
+    buffers = []
+    try:
+        for name, size in packed.blocks:
+            segment = SharedMemory(name)
+            segments.append(segment)
+            buffers.append(own(segment, size))
+        return loads(packed.data, buffers=buffers), segments  # nosec: B301
+    finally:
+        for segment in segments:
+            segment.close()
+
+
+def own(segment, size):
+    # Hand the mapping over to the view.  Closing the segment closes its
+    # file descriptor, but keeps the memory mapped until the view and
+    # all values backed by it are gone.
+    view = segment.buf[:size]
+    segment._mmap = None
+    return view
+
+
+def unlink(segments):
+    for segment in segments:
+        segment.unlink()
+
+
+def discard(segments):
+    for segment in segments:
+        segment.close()
+        segment.unlink()
@@ -0,0 +1,15 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+from typing import List
+from typing import Tuple
+
+class Packed:
+    data: bytes
+    blocks: List[Tuple[str, int]]
+    def __init__(self, data: bytes, blocks: List[Tuple[str, int]]) -> None: ...
+
+def pack(value: Any, threshold: int) -> Tuple[Packed, List[SharedMemory]]: ...
+def unpack(packed: Packed) -> Tuple[Any, List[SharedMemory]]: ...
+def own(segment: SharedMemory, size: int) -> memoryview: ...
+def unlink(segments: List[SharedMemory]) -> None: ...
+def discard(segments: List[SharedMemory]) -> None: ...
@@ -1,6 +1,8 @@
 from _stories.argument import get_arguments
+from _stories.bulkhead import get_bulkhead
 from _stories.collect import collect_story
 from _stories.failures import check_data_type
+from _stories.flights import Flights
 from _stories.mounted import ClassMountedStory
 from _stories.mounted import MountedStory
 from _stories.wrap import wrap_story
@@ -13,12 +15,20 @@ class Story(object):
         self.collected = collect_story(f)
         self.contract(None)
         self.failures(None)
+        self.checkpoint(None)
+        self.__flights = None
 
     def __get__(self, obj, cls):
         __tracebackhide__ = True
         if obj is None:
             return ClassMountedStory(
-                cls, self.name, self.collected, self.contract, self.failures
+                cls,
+                self.name,
+                self.collected,
+                self.contract,
+                self.failures,
+                self.coalesce,
+                self.checkpoint,
             )
         else:
             methods, contract, failures = wrap_story(
@@ -29,6 +39,7 @@ class Story(object):
                 obj,
                 self.__contract,
                 self.__failures,
+                get_bulkhead(self),
             )
             return MountedStory(
                 obj,
@@ -38,6 +49,8 @@ class Story(object):
                 methods,
                 contract,
                 failures,
+                self.__flights,
+                self.__checkpoints,
             )
 
     def contract(self, contract):
@@ -49,3 +62,12 @@ class Story(object):
         check_data_type(failures)
         self.__failures = failures
         return failures
+
+    def checkpoint(self, store):
+        self.__checkpoints = store
+        return store
+
+    def coalesce(self):
+        if self.__flights is None:
+            self.__flights = Flights()
+        return self.__flights
@@ -6,6 +6,7 @@ from typing import Optional
 from typing import Type
 from typing import Union
 
+from _stories.flights import Flights
 from _stories.mounted import ClassMountedStory
 from _stories.mounted import MountedStory
 
@@ -14,3 +15,5 @@ class Story:
     def __get__(self, obj: Any, cls: Any) -> Union[MountedStory, ClassMountedStory]: ...
     def contract(self, contract: Any) -> Any: ...
     def failures(self, failures: Any) -> Optional[Union[List[str], Type[Enum]]]: ...
+    def checkpoint(self, store: Any) -> Any: ...
+    def coalesce(self) -> Flights: ...
@@ -0,0 +1,58 @@
+from collections import deque
+
+from _stories.compat import copy_context
+from _stories.compat import FIRST_COMPLETED
+from _stories.compat import ThreadPoolExecutor
+from _stories.compat import wait
+
+
+# Argument sets are taken from the iterable only when there is a free
+# worker.  At most `workers` stories are running at the same time.
+
+
+def imap(story, iterable, workers, ordered):
+    __tracebackhide__ = True
+    executor = ThreadPoolExecutor(workers)
+
+    def submit(kwargs):
+        context = copy_context()
+        return executor.submit(context.run, run, story, kwargs)
+
+    try:
+        for summary in stream(submit, iterable, workers, ordered):
+            yield summary
+    finally:
+        executor.shutdown()
+
+
+def stream(submit, iterable, limit, ordered):
+    __tracebackhide__ = True
+    running = deque()
+    try:
+        for kwargs in iterable:
+            if len(running) >= limit:
+                for summary in collect(running, ordered):
+                    yield summary
+            running.append(submit(kwargs))
+        while running:
+            for summary in collect(running, ordered):
+                yield summary
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def collect(running, ordered):
+    __tracebackhide__ = True
+    if ordered:
+        return [running.popleft().result()]
+    done, _ = wait(running, return_when=FIRST_COMPLETED)
+    finished = [future for future in running if future in done]
+    for future in finished:
+        running.remove(future)
+    return [future.result() for future in finished]
+
+
+def run(story, kwargs):
+    __tracebackhide__ = True
+    return story.run(**kwargs)
@@ -0,0 +1,32 @@
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Union
+
+from _stories.mounted import MountedStory
+from _stories.summary import FailureSummary
+from _stories.summary import SuccessSummary
+
+def imap(
+    story: MountedStory,
+    iterable: Iterable[Dict[str, Any]],
+    workers: int,
+    ordered: bool,
+) -> Iterator[Union[SuccessSummary, FailureSummary]]: ...
+def stream(
+    submit: Callable[[Dict[str, Any]], Future],
+    iterable: Iterable[Dict[str, Any]],
+    limit: int,
+    ordered: bool,
+) -> Iterator[Any]: ...
+def collect(
+    running: Deque[Future], ordered: bool
+) -> List[Union[SuccessSummary, FailureSummary]]: ...
+def run(
+    story: MountedStory, kwargs: Dict[str, Any]
+) -> Union[SuccessSummary, FailureSummary]: ...
@@ -1,9 +1,14 @@
+from _stories.context import detach_context
+from _stories.failures import reason_name
+
+
 class FailureSummary(object):
-    def __init__(self, protocol, ctx, failed_method, reason):
+    def __init__(self, protocol, ctx, failed_method, reason, steps):
         self.__protocol = protocol
         self.is_success = False
         self.is_failure = True
         self.ctx = ctx
+        self.steps = steps
         self.__failed_method = failed_method
         self.__failure_reason = reason
 
@@ -20,16 +25,26 @@ class FailureSummary(object):
     def value(self):
         raise AssertionError
 
+    def detach(self):
+        return FailureSummary(
+            self.__protocol.detach(),
+            detach_context(self.ctx),
+            self.__failed_method,
+            reason_name(self.__failure_reason),
+            (),
+        )
+
     def __repr__(self):
         return "Failure()"
 
 
 class SuccessSummary(object):
-    def __init__(self, protocol, value):
+    def __init__(self, protocol, value, steps):
         self.__protocol = protocol
         self.is_success = True
         self.is_failure = False
         self.value = value
+        self.steps = steps
 
     def failed_on(self, method_name):
         return False
@@ -38,5 +53,8 @@ class SuccessSummary(object):
         self.__protocol.check_failed_because_argument(reason)
         return False
 
+    def detach(self):
+        return SuccessSummary(self.__protocol.detach(), self.value, ())
+
     def __repr__(self):
         return "Success()"
@@ -2,30 +2,40 @@ from enum import Enum
 from typing import Any
 from typing import NoReturn
 from typing import Optional
+from typing import Sequence
 from typing import Union
 
 from _stories.context import Context
+from _stories.context import DetachedContext
+from _stories.failures import DetachedRunProtocol
 from _stories.failures import NotNullRunProtocol
 from _stories.failures import NullRunProtocol
+from _stories.instrument import Step
 
 class FailureSummary:
     def __init__(
         self,
-        protocol: Union[NullRunProtocol, NotNullRunProtocol],
-        ctx: Context,
+        protocol: Union[NullRunProtocol, NotNullRunProtocol, DetachedRunProtocol],
+        ctx: Union[Context, DetachedContext],
         failed_method: str,
         reason: Optional[Union[str, Enum]],
+        steps: Sequence[Step],
     ) -> None: ...
     def failed_on(self, method_name: str) -> bool: ...
     def failed_because(self, reason: Union[str, Enum]) -> bool: ...
     @property
     def value(self) -> NoReturn: ...
+    def detach(self) -> FailureSummary: ...
     def __repr__(self) -> str: ...
 
 class SuccessSummary:
     def __init__(
-        self, protocol: Union[NullRunProtocol, NotNullRunProtocol], value: Any
+        self,
+        protocol: Union[NullRunProtocol, NotNullRunProtocol, DetachedRunProtocol],
+        value: Any,
+        steps: Sequence[Step],
     ) -> None: ...
     def failed_on(self, method_name: str) -> bool: ...
     def failed_because(self, reason: str) -> bool: ...
+    def detach(self) -> SuccessSummary: ...
     def __repr__(self) -> str: ...
@@ -0,0 +1,131 @@
+import argparse
+from importlib import import_module
+from time import sleep
+from traceback import format_exc
+
+from _stories.compat import FIRST_COMPLETED
+from _stories.compat import ThreadPoolExecutor
+from _stories.compat import wait
+from _stories.jobs import default_path
+from _stories.jobs import Queue
+from _stories.jobs import story_path
+from _stories.mounted import MountedStory
+
+
+# Worker claims a batch of jobs, runs them in the thread pool and
+# stores outcomes of the whole batch in a single transaction.  Job is
+# submitted only when one of the threads is free.  Its visibility
+# timeout is extended right before that, so it covers the job alone.
+
+
+def drain(
+    queue,
+    story,
+    workers=1,
+    batch=100,
+    timeout=60,
+    retries=3,
+    once=False,
+    backoff=1,
+):
+    name = story_path(story)
+    executor = ThreadPoolExecutor(workers)
+    done = 0
+    try:
+        while True:
+            jobs = queue.claim(name, batch, timeout, retries)
+            if not jobs:
+                if once:
+                    return done
+                sleep(poll_interval)
+                continue
+            finished = run_jobs(queue, executor, workers, story, jobs, timeout, retries)
+            queue.finish(finished, backoff)
+            done += len(finished)
+    finally:
+        executor.shutdown()
+
+
+def run_jobs(queue, executor, workers, story, jobs, timeout, retries):
+    running = set()
+    finished = []
+    for job in jobs:
+        if len(running) >= workers:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            finished.extend(future.result() for future in done)
+        if queue.extend(job, timeout):
+            running.add(executor.submit(run_job, story, retries, job))
+    finished.extend(future.result() for future in running)
+    return finished
+
+
+def run_job(story, retries, job):
+    try:
+        summary = story.run(**job.kwargs)
+    except Exception:
+        job.state = "queued" if job.attempts <= retries else "error"
+        job.error = format_exc()
+        return job
+    job.state = "success" if summary.is_success else "failure"
+    job.summary = summary.detach()
+    job.error = None
+    return job
+
+
+poll_interval = 1
+
+
+# Command line.
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m stories.worker",
+        description="Run stories from the local job queue.",
+    )
+    parser.add_argument("story", help="story to run as module:Class.story")
+    parser.add_argument("--database", default=default_path())
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=1)
+    parser.add_argument("--once", action="store_true", help="exit on empty queue")
+    args = parser.parse_args(argv)
+
+    story = load_story(parser, args.story)
+    queue = Queue(args.database)
+    try:
+        drain(
+            queue,
+            story,
+            args.workers,
+            args.batch,
+            args.timeout,
+            args.retries,
+            args.once,
+            args.backoff,
+        )
+    finally:
+        queue.close()
+
+
+def load_story(parser, path):
+    module_name, _, attribute = path.partition(":")
+    cls_name, _, story_name = attribute.rpartition(".")
+    try:
+        cls = import_module(module_name)
+        for name in cls_name.split("."):
+            cls = getattr(cls, name)
+        story = getattr(cls(), story_name)
+    except (ImportError, AttributeError, ValueError):
+        story = None
+    if type(story) is not MountedStory:
+        parser.error(wrong_story_template.format(path=path))
+    return story
+
+
+# Messages.
+
+
+wrong_story_template = "{path!r} is not a story of the class (module:Class.story)"
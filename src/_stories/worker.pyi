@@ -0,0 +1,36 @@
+from argparse import ArgumentParser
+from concurrent.futures import Executor
+from typing import List
+from typing import Optional
+
+from _stories.mounted import MountedStory
+from _stories.jobs import Job
+from _stories.jobs import Queue
+
+def drain(
+    queue: Queue,
+    story: MountedStory,
+    workers: int = ...,
+    batch: int = ...,
+    timeout: float = ...,
+    retries: int = ...,
+    once: bool = ...,
+    backoff: float = ...,
+) -> int: ...
+def run_jobs(
+    queue: Queue,
+    executor: Executor,
+    workers: int,
+    story: MountedStory,
+    jobs: List[Job],
+    timeout: float,
+    retries: int,
+) -> List[Job]: ...
+def run_job(story: MountedStory, retries: int, job: Job) -> Job: ...
+
+poll_interval: float
+
+def main(argv: Optional[List[str]] = ...) -> None: ...
+def load_story(parser: ArgumentParser, path: str) -> MountedStory: ...
+
+wrong_story_template: str
@@ -1,28 +1,49 @@
+from _stories.bulkhead import limit_step
+from _stories.collect import FanOutCall
 from _stories.contract import combine_contract
 from _stories.contract import make_contract
 from _stories.contract import maybe_extend_downstream_argsets
+from _stories.dataflow import make_dataflow
+from _stories.exceptions import StoryDefinitionError
 from _stories.failures import combine_failures
 from _stories.failures import make_exec_protocol
 from _stories.failures import maybe_disable_null_protocol
+from _stories.fanout import FanOut
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
+from _stories.marker import Parallel
 from _stories.mounted import MountedStory
 
 
-def wrap_story(arguments, collected, cls_name, story_name, obj, spec, failures):
+def wrap_story(
+    arguments, collected, cls_name, story_name, obj, spec, failures, bulkhead
+):
     __tracebackhide__ = True
 
     contract = make_contract(cls_name, story_name, arguments, spec)
     protocol = make_exec_protocol(failures)
 
-    methods = [(BeginningOfStory(cls_name, story_name), contract, protocol)]
+    beginning = BeginningOfStory(cls_name, story_name, bulkhead=bulkhead)
+    methods = [(beginning, contract, protocol)]
 
     for name in collected:
 
+        if type(name) is FanOutCall:
+            methods.append(
+                (make_fan_out(cls_name, story_name, obj, name), contract, protocol)
+            )
+            continue
+
+        if type(name) is tuple:
+            methods.append(
+                (make_parallel(cls_name, story_name, obj, name), contract, protocol)
+            )
+            continue
+
         attr = getattr(obj, name)
 
         if type(attr) is not MountedStory:
-            methods.append((attr, contract, protocol))
+            methods.append((limit_step(attr), contract, protocol))
             continue
 
         combine_contract(contract, attr.contract)
@@ -31,15 +52,68 @@ def wrap_story(arguments, collected, cls_name, story_name, obj, spec, failures):
             failures, cls_name, story_name, attr.failures, attr.cls_name, attr.name
         )
 
-        # FIXME: Is there a way to avoid this modification?
-        attr.methods[0][0].set_parent(name, attr.obj is obj)
-
-        methods.extend(attr.methods)
+        beginning, beginning_contract, beginning_protocol = attr.methods[0]
+        methods.append(
+            (
+                beginning.with_parent(name, attr.obj is obj),
+                beginning_contract,
+                beginning_protocol,
+            )
+        )
+        methods.extend(attr.methods[1:])
 
     methods.append((EndOfStory(is_empty=not collected), contract, protocol))
 
     maybe_extend_downstream_argsets(methods, contract)
 
+    methods = make_dataflow(methods, contract)
+
     methods = maybe_disable_null_protocol(methods, failures)
 
     return methods, contract, failures
+
+
+def make_parallel(cls_name, story_name, obj, names):
+    __tracebackhide__ = True
+
+    group = [limit_step(getattr(obj, name)) for name in names]
+
+    for name, attr in zip(names, group):
+        if type(attr) is MountedStory:
+            message = parallel_substory_template.format(
+                cls=cls_name, method=story_name, substory=name
+            )
+            raise StoryDefinitionError(message)
+
+    return Parallel(group)
+
+
+def make_fan_out(cls_name, story_name, obj, call):
+    __tracebackhide__ = True
+
+    story = getattr(obj, call.name)
+
+    if type(story) is not MountedStory or call.item not in story.arguments:
+        message = wrong_fan_out_template.format(
+            cls=cls_name, method=story_name, substory=call.name, item=call.item
+        )
+        raise StoryDefinitionError(message)
+
+    return FanOut(obj, call.name, story, call.over, call.item, call.into, call.limit)
+
+
+# Messages.
+
+
+parallel_substory_template = """
+Story can not be used in the parallel group: {substory}
+
+Story method: {cls}.{method}
+""".strip()
+
+
+wrong_fan_out_template = """
+Fan-out step should be a story with {item!r} argument: {substory}
+
+Story method: {cls}.{method}
+""".strip()
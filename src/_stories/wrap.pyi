@@ -1,24 +1,30 @@
 from typing import Any
 from typing import Callable
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
+from _stories.bulkhead import Bulkhead
+from _stories.collect import FanOutCall
 from _stories.contract import NullContract
 from _stories.contract import SpecContract
 from _stories.failures import NotNullExecProtocol
 from _stories.failures import NullExecProtocol
+from _stories.fanout import FanOut
 from _stories.marker import BeginningOfStory
 from _stories.marker import EndOfStory
+from _stories.marker import Parallel
 
 def wrap_story(
     arguments: List[str],
-    collected: List[str],
+    collected: List[Union[str, Tuple[str, ...]]],
     cls_name: str,
     story_name: str,
     obj: Any,
     spec: None,
     failures: None,
+    bulkhead: Optional[Bulkhead],
 ) -> Tuple[
     List[
         Tuple[
@@ -30,3 +36,9 @@ def wrap_story(
     NullContract,
     None,
 ]: ...
+def make_parallel(
+    cls_name: str, story_name: str, obj: Any, names: Tuple[str, ...]
+) -> Parallel: ...
+def make_fan_out(
+    cls_name: str, story_name: str, obj: Any, call: FanOutCall
+) -> FanOut: ...
@@ -8,6 +8,8 @@ This module implements Business Transaction DSL.
 :license: BSD, see LICENSE for more details.
 """
 from _stories.argument import arguments
+from _stories.collect import fan_out
+from _stories.collect import parallel
 from _stories.returned import Failure
 from _stories.returned import Result
 from _stories.returned import Skip
@@ -15,4 +17,13 @@ from _stories.returned import Success
 from _stories.story import Story as story
 
 
-__all__ = ["story", "arguments", "Result", "Success", "Failure", "Skip"]
+__all__ = [
+    "story",
+    "arguments",
+    "parallel",
+    "fan_out",
+    "Result",
+    "Success",
+    "Failure",
+    "Skip",
+]
@@ -0,0 +1,13 @@
+"""
+stories.batch
+-------------
+
+This module contains batch variants of the story steps.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.batch import batch
+
+
+__all__ = ["batch"]
@@ -0,0 +1,13 @@
+"""
+stories.bulkhead
+----------------
+
+This module contains concurrency limits of the story steps.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.bulkhead import bulkhead
+
+
+__all__ = ["bulkhead"]
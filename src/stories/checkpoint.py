@@ -0,0 +1,14 @@
+"""
+stories.checkpoint
+------------------
+
+This module contains checkpoint stores to resume interrupted stories.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.checkpoint import FileStore
+from _stories.checkpoint import SQLiteStore
+
+
+__all__ = ["FileStore", "SQLiteStore"]
@@ -0,0 +1,17 @@
+# type: ignore
+"""
+stories.contrib.columns
+-----------------------
+
+This module contains columnar execution of the story over NumPy
+arrays.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.contrib.columns import columnar
+from _stories.contrib.columns import run_columns
+from _stories.contrib.columns import where
+
+
+__all__ = ["columnar", "where", "run_columns"]
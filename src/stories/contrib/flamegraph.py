@@ -0,0 +1,15 @@
+# type: ignore
+"""
+stories.contrib.flamegraph
+--------------------------
+
+This module contains exporters of story executions to flamegraph tools
+and trace viewers.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.contrib.flamegraph import record
+
+
+__all__ = ["record"]
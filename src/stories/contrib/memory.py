@@ -0,0 +1,14 @@
+# type: ignore
+"""
+stories.contrib.memory
+----------------------
+
+This module contains integration with tracemalloc memory tracer.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.contrib.memory import track_allocations
+
+
+__all__ = ["track_allocations"]
@@ -0,0 +1,15 @@
+# type: ignore
+"""
+stories.contrib.profiler
+------------------------
+
+This module contains integration with Python profilers.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.contrib.profiler import profile
+from _stories.contrib.profiler import sample
+
+
+__all__ = ["profile", "sample"]
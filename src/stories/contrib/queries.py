@@ -0,0 +1,14 @@
+# type: ignore
+"""
+stories.contrib.queries
+-----------------------
+
+This module contains integration with Django database queries.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.contrib.queries import track_queries
+
+
+__all__ = ["track_queries"]
@@ -0,0 +1,14 @@
+"""
+stories.dataflow
+----------------
+
+This module contains data dependencies declaration of the story steps.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.dataflow import reads
+from _stories.dataflow import verify
+
+
+__all__ = ["reads", "verify"]
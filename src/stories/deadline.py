@@ -0,0 +1,14 @@
+"""
+stories.deadline
+----------------
+
+This module contains deadline of the story execution.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.deadline import deadline
+from _stories.deadline import remaining
+
+
+__all__ = ["deadline", "remaining"]
@@ -7,7 +7,9 @@ This module contains errors definitions user can handle.
 :copyright: (c) 2018-2020 dry-python team.
 :license: BSD, see LICENSE for more details.
 """
+from _stories.exceptions import BulkheadFull
 from _stories.exceptions import ContextContractError
+from _stories.exceptions import DeadlineExceeded
 from _stories.exceptions import FailureError
 from _stories.exceptions import FailureProtocolError
 from _stories.exceptions import MutationError
@@ -16,7 +18,9 @@ from _stories.exceptions import StoryError
 
 
 __all__ = [
+    "BulkheadFull",
     "ContextContractError",
+    "DeadlineExceeded",
     "FailureError",
     "FailureProtocolError",
     "MutationError",
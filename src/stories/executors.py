@@ -0,0 +1,15 @@
+"""
+stories.executors
+-----------------
+
+This module contains executors configuration of the asynchronous stories.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.executors import inline
+from _stories.executors import offload
+from _stories.executors import set_executor
+
+
+__all__ = ["inline", "offload", "set_executor"]
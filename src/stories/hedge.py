@@ -0,0 +1,14 @@
+"""
+stories.hedge
+-------------
+
+This module contains hedged calls of the asynchronous story steps.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.hedge import get_hedge
+from _stories.hedge import hedge
+
+
+__all__ = ["hedge", "get_hedge"]
@@ -0,0 +1,29 @@
+"""
+stories.instrument
+------------------
+
+This module contains hooks to observe the execution of story steps.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.instrument import add_instruments
+from _stories.instrument import Collector
+from _stories.instrument import current_step
+from _stories.instrument import install_instruments
+from _stories.instrument import Instrument
+from _stories.instrument import instrumented
+from _stories.instrument import remove_instruments
+from _stories.instrument import uninstall_instruments
+
+
+__all__ = [
+    "Instrument",
+    "Collector",
+    "current_step",
+    "instrumented",
+    "add_instruments",
+    "remove_instruments",
+    "install_instruments",
+    "uninstall_instruments",
+]
@@ -0,0 +1,14 @@
+"""
+stories.jobs
+------------
+
+This module contains the local job queue for background story runs.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.jobs import Job
+from _stories.jobs import Queue
+
+
+__all__ = ["Job", "Queue"]
@@ -0,0 +1,14 @@
+"""
+stories.loader
+--------------
+
+This module contains batched loading for the asynchronous stories.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.loader import Loader
+from _stories.loader import scope
+
+
+__all__ = ["Loader", "scope"]
@@ -0,0 +1,15 @@
+"""
+stories.pool
+------------
+
+This module contains process and interpreter pools to run stories on
+many cores.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.pool import InterpreterPool
+from _stories.pool import ProcessPool
+
+
+__all__ = ["InterpreterPool", "ProcessPool"]
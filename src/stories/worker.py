@@ -0,0 +1,19 @@
+"""
+stories.worker
+--------------
+
+This module contains the worker to run stories from the local job
+queue.  Run it with `python -m stories.worker module:Class.story`.
+
+:copyright: (c) 2018-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _stories.worker import drain
+from _stories.worker import main
+
+
+__all__ = ["drain", "main"]
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,12 @@
+import sys
+
+
 pytest_plugins = ["examples"]
+
+
+collect_ignore = []
+
+
+if sys.version_info < (3, 5):
+    # Coroutine steps and stories are defined with `async def` syntax.
+    collect_ignore.append("test_coroutine.py")
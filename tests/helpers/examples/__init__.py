@@ -1,6 +1,18 @@
 import pytest
 
+import examples.batch  # noqa: F401
+import examples.bulkhead  # noqa: F401
+import examples.checkpoint  # noqa: F401
+import examples.coalesce  # noqa: F401
+import examples.dataflow  # noqa: F401
+import examples.deadline  # noqa: F401
+import examples.effects  # noqa: F401
+import examples.fanout  # noqa: F401
+import examples.jobs  # noqa: F401
 import examples.methods  # noqa: F401
+import examples.parallel  # noqa: F401
+import examples.pool  # noqa: F401
+import examples.stream  # noqa: F401
 
 
 def contracts():
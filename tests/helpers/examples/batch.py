@@ -0,0 +1,77 @@
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import Skip
+from stories import story
+from stories import Success
+from stories.batch import batch
+
+
+# Batch steps.
+
+
+class Billing(object):
+    @story
+    @arguments("customer_id")
+    def charge(I):
+        I.find_customer
+        I.check_discount
+        I.find_price
+        I.finish
+
+    @story
+    def check_discount(I):
+        I.has_discount
+        I.apply_discount
+
+    batches = []
+
+    @batch("find_customers")
+    def find_customer(self, ctx):
+        return self.find_customers([ctx])[0]
+
+    def find_customers(self, ctxs):
+        self.batches.append(("find_customers", [ctx.customer_id for ctx in ctxs]))
+        return [
+            Failure("unknown")
+            if ctx.customer_id < 0
+            else Success(customer=ctx.customer_id)
+            for ctx in ctxs
+        ]
+
+    def has_discount(self, ctx):
+        if ctx.customer % 2:
+            return Skip()
+        return Success()
+
+    def apply_discount(self, ctx):
+        if ctx.customer == 0:
+            raise DiscountError()
+        return Success(discount=1)
+
+    @batch("find_prices")
+    def find_price(self, ctx):
+        return self.find_prices([ctx])[0]
+
+    def find_prices(self, ctxs):
+        self.batches.append(("find_prices", [ctx.customer for ctx in ctxs]))
+        return [
+            Result("free") if ctx.customer == 3 else Success(price=ctx.customer * 10)
+            for ctx in ctxs
+        ]
+
+    def finish(self, ctx):
+        discount = ctx.discount if "discount" in dir(ctx) else 0
+        return Result(ctx.price - discount)
+
+
+Billing.charge.failures(["unknown"])
+
+
+class DiscountError(Exception):
+    pass
+
+
+class WrongBatch(Billing):
+    def find_prices(self, ctxs):
+        return []
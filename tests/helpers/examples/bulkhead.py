@@ -0,0 +1,107 @@
+from threading import Event
+from threading import Lock
+from time import sleep
+
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import story
+from stories import Success
+from stories.bulkhead import bulkhead
+
+
+# Limited step.
+
+
+class Payments(object):
+    @story
+    @arguments("amount")
+    def pay(I):
+        I.validate
+        I.persist
+        I.finish
+
+    lock = Lock()
+    running = 0
+    most = 0
+
+    def validate(self, ctx):
+        return Success()
+
+    @bulkhead(2)
+    def persist(self, ctx):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.most = max(cls.most, cls.running)
+        sleep(0.02)
+        with cls.lock:
+            cls.running -= 1
+        return Success(payment=ctx.amount)
+
+    def finish(self, ctx):
+        return Result(ctx.payment)
+
+
+# Limited queue.
+
+
+class Gateway(object):
+    @story
+    def charge(I):
+        I.call
+
+    entered = Event()
+    release = Event()
+
+    @bulkhead(1, queue=0)
+    def call(self, ctx):
+        self.entered.set()
+        self.release.wait(0.5)
+        return Result(True)
+
+
+# Limited substory.
+
+
+class Warehouse(object):
+    @story
+    @arguments("amount")
+    def ship(I):
+        I.reserve
+        I.finish
+
+    @bulkhead(1)
+    @story
+    @arguments("amount")
+    def reserve(I):
+        I.lock_stock
+        I.pack
+
+    lock = Lock()
+    running = 0
+    most = 0
+
+    def lock_stock(self, ctx):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.most = max(cls.most, cls.running)
+        sleep(0.01)
+        return Success()
+
+    def pack(self, ctx):
+        sleep(0.01)
+        cls = type(self)
+        with cls.lock:
+            cls.running -= 1
+        if ctx.amount < 0:
+            return Failure("negative")
+        return Success(package=ctx.amount)
+
+    def finish(self, ctx):
+        return Result(ctx.package)
+
+
+Warehouse.ship.failures(["negative"])
+Warehouse.reserve.failures(["negative"])
@@ -0,0 +1,88 @@
+from stories import arguments
+from stories import Failure
+from stories import parallel
+from stories import Result
+from stories import story
+from stories import Success
+
+
+# Long-running story.
+
+
+class Import(object):
+    @story
+    @arguments("rows")
+    def load(I):
+        I.parse
+        parallel(I.count, I.check)
+        I.prepare
+        I.save
+        I.finish
+
+    @story
+    def prepare(I):
+        I.normalize
+
+    calls = []
+    reported = []
+    crash = False
+
+    def parse(self, ctx):
+        self.calls.append("parse")
+        parsed = [int(row) for row in ctx.rows]
+        return Success(parsed=parsed).defer(self.report, len(parsed))
+
+    def count(self, ctx):
+        self.calls.append("count")
+        return Success(total=len(ctx.parsed))
+
+    def check(self, ctx):
+        self.calls.append("check")
+        return Success(valid=all(number >= 0 for number in ctx.parsed))
+
+    def normalize(self, ctx):
+        self.calls.append("normalize")
+        return Success(scaled=[number * 10 for number in ctx.parsed])
+
+    def save(self, ctx):
+        self.calls.append("save")
+        if type(self).crash:
+            type(self).crash = False
+            raise ImportCrash()
+        return Success(saved=sum(ctx.scaled))
+
+    def finish(self, ctx):
+        if not ctx.total:
+            return Failure()
+        return Result(ctx.saved)
+
+    def report(self, parsed):
+        self.reported.append((self, parsed))
+
+
+def integer(value):
+    if isinstance(value, int):
+        return value, None
+    return None, "Invalid value"
+
+
+def anything(value):
+    return value, None
+
+
+Import.prepare.contract(
+    Import.load.contract(
+        {
+            "rows": anything,
+            "parsed": anything,
+            "total": integer,
+            "valid": anything,
+            "scaled": anything,
+            "saved": integer,
+        }
+    )
+)
+
+
+class ImportCrash(Exception):
+    pass
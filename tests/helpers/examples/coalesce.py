@@ -0,0 +1,44 @@
+from threading import Event
+from threading import Lock
+
+from stories import arguments
+from stories import Result
+from stories import story
+
+
+# Coalesced story.
+
+
+class Stats(object):
+    @story
+    @arguments("key")
+    def fetch(I):
+        I.load
+
+    lock = Lock()
+    calls = 0
+    entered = Event()
+    release = Event()
+
+    def load(self, ctx):
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+        cls.entered.set()
+        cls.release.wait(0.5)
+        if ctx.key == 0:
+            raise StatsError()
+        if ctx.key == -1 and cls.calls == 1:
+            raise StatsInterrupt()
+        return Result(len(ctx.key) if isinstance(ctx.key, list) else ctx.key * 2)
+
+
+Stats.fetch.coalesce()
+
+
+class StatsError(Exception):
+    pass
+
+
+class StatsInterrupt(BaseException):
+    pass
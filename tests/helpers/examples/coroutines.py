@@ -0,0 +1,473 @@
+import asyncio
+
+from _stories.compat import get_ident
+from stories import arguments
+from stories import Failure
+from stories import fan_out
+from stories import parallel
+from stories import Result
+from stories import Skip
+from stories import story
+from stories import Success
+from stories.bulkhead import bulkhead
+from stories.dataflow import reads
+from stories.executors import inline
+from stories.executors import offload
+from stories.hedge import hedge
+from stories.instrument import current_step
+from stories.loader import Loader
+
+
+# Simple story.
+
+
+class Simple(object):
+    @story
+    @arguments("foo", "bar")
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    async def one(self, ctx):
+        await asyncio.sleep(0)
+        return Success()
+
+    async def two(self, ctx):
+        await asyncio.sleep(0)
+
+        if ctx.foo > 1:
+            return Failure()
+
+        if ctx.bar < 0:
+            return Skip()
+
+        return Success(baz=4)
+
+    def three(self, ctx):
+        return Result(ctx.bar - ctx.baz)
+
+
+# Substory in the same class.
+
+
+class SimpleSubstory(Simple):
+    @story
+    @arguments("spam")
+    def y(I):
+        I.start
+        I.before
+        I.x
+        I.after
+
+    def start(self, ctx):
+        return Success(foo=ctx.spam - 1)
+
+    async def before(self, ctx):
+        await asyncio.sleep(0)
+        return Success(bar=ctx.spam + 1)
+
+    async def after(self, ctx):
+        return Result(ctx.spam * 2)
+
+
+# Async substory in the sync story.
+
+
+class SyncParent(object):
+    @story
+    @arguments("spam")
+    def z(I):
+        I.start
+        I.x
+        I.finish
+
+    def start(self, ctx):
+        return Success(foo=ctx.spam, bar=ctx.spam)
+
+    def finish(self, ctx):
+        return Result(ctx.spam)
+
+    def __init__(self):
+        self.x = SimpleSubstory().x
+
+
+# Failure reasons.
+
+
+class Reasons(object):
+    @story
+    def x(I):
+        I.one
+
+    async def one(self, ctx):
+        return Failure("foo")
+
+
+Reasons.x.failures(["foo", "bar"])
+
+
+# Errors.
+
+
+class StepError(Exception):
+    pass
+
+
+class Raise(object):
+    @story
+    def x(I):
+        I.one
+
+    async def one(self, ctx):
+        await asyncio.sleep(0)
+        raise StepError()
+
+
+class WrongResult(object):
+    @story
+    def x(I):
+        I.one
+
+    async def one(self, ctx):
+        return 1
+
+
+# Executors.
+
+
+class Threads(object):
+    @story
+    def x(I):
+        I.blocking
+        I.cheap
+        I.legacy
+        I.coroutine
+        I.finish
+
+    def blocking(self, ctx):
+        return Success(blocking=(get_ident(), current_step()))
+
+    @inline
+    def cheap(self, ctx):
+        return Success(cheap=(get_ident(), current_step()))
+
+    @offload("legacy")
+    def legacy(self, ctx):
+        return Success(legacy=(get_ident(), current_step()))
+
+    async def coroutine(self, ctx):
+        return Success(coroutine=(get_ident(), current_step()))
+
+    def finish(self, ctx):
+        return Result(ctx)
+
+
+@inline
+class InlineThreads(Threads):
+    def blocking(self, ctx):
+        return Success(blocking=(get_ident(), current_step()))
+
+
+# Parallel group.
+
+
+class Gather(object):
+    @story
+    def x(I):
+        parallel(I.one, I.three, I.two)
+        I.finish
+
+    def __init__(self):
+        self.arrived = 0
+        self.event = None
+
+    async def one(self, ctx):
+        await self.meet()
+        return Success(one=1)
+
+    async def two(self, ctx):
+        await self.meet()
+        return Failure()
+
+    def three(self, ctx):
+        return Success(three=get_ident())
+
+    def finish(self, ctx):
+        return Result((ctx.one, ctx.two, ctx.three))
+
+    async def meet(self):
+        if self.event is None:
+            self.event = asyncio.Event()
+        self.arrived += 1
+        if self.arrived == 2:
+            self.event.set()
+        await asyncio.wait_for(self.event.wait(), 0.5)
+
+
+# Dataflow.
+
+
+@reads
+class Dataflow(Gather):
+    @story
+    def y(I):
+        I.one
+        I.two
+        I.three
+        I.finish
+
+    async def one(self, ctx):
+        await self.meet()
+        return Success(one=1)
+
+    async def two(self, ctx):
+        await self.meet()
+        return Success(two=2)
+
+    async def three(self, ctx):
+        return Success(three=ctx.one + ctx.two)
+
+    def finish(self, ctx):
+        return Result(ctx.three)
+
+
+@reads
+class StalledDataflow(object):
+    @story
+    def y(I):
+        I.one
+        I.two
+        I.finish
+
+    cancelled = False
+
+    async def one(self, ctx):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return Success(one=1)
+
+    async def two(self, ctx):
+        return Success(two=2)
+
+    def finish(self, ctx):
+        return Result(ctx.one + ctx.two)
+
+
+# Fan-out substory.
+
+
+class FanOut(object):
+    @story
+    @arguments("items")
+    def x(I):
+        fan_out(I.y, over="items", item="item", into="results", limit=2)
+        I.finish
+
+    @story
+    @arguments("item")
+    def y(I):
+        I.double
+
+    def __init__(self):
+        self.running = 0
+        self.most = 0
+
+    async def double(self, ctx):
+        self.running += 1
+        self.most = max(self.most, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return Result(ctx.item * 2)
+
+    def finish(self, ctx):
+        return Result([result.value for result in ctx.results])
+
+
+# Deadline.
+
+
+class Deadline(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+
+    cancelled = False
+
+    async def one(self, ctx):
+        self.ctx = ctx
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return Success()
+
+    def two(self, ctx):
+        return Result(None)
+
+
+# Bulkhead.
+
+
+class Bulkhead(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+
+    running = 0
+    most = 0
+
+    @bulkhead(1)
+    async def one(self, ctx):
+        cls = type(self)
+        cls.running += 1
+        cls.most = max(cls.most, cls.running)
+        await asyncio.sleep(0.01)
+        cls.running -= 1
+        return Success()
+
+    @bulkhead(1)
+    def two(self, ctx):
+        return Result(get_ident())
+
+
+class LimitedSubstory(object):
+    @story
+    def x(I):
+        I.y
+        I.done
+
+    @bulkhead(1)
+    @story
+    def y(I):
+        I.enter
+        I.leave
+
+    running = 0
+    most = 0
+
+    async def enter(self, ctx):
+        cls = type(self)
+        cls.running += 1
+        cls.most = max(cls.most, cls.running)
+        await asyncio.sleep(0.01)
+        return Success()
+
+    async def leave(self, ctx):
+        await asyncio.sleep(0.01)
+        type(self).running -= 1
+        return Success()
+
+    def done(self, ctx):
+        return Result(True)
+
+
+# Hedged step.
+
+
+class Hedged(object):
+    @story
+    @arguments("delays")
+    def x(I):
+        I.load_profile
+        I.finish
+
+    def __init__(self):
+        self.attempts = 0
+
+    @hedge(delay=0.02)
+    async def load_profile(self, ctx):
+        attempt = self.attempts
+        self.attempts += 1
+        await asyncio.sleep(ctx.delays[attempt])
+        return Success(profile=attempt)
+
+    def finish(self, ctx):
+        return Result(ctx.profile)
+
+
+# Coalesced story.
+
+
+class Coalesced(object):
+    @story
+    @arguments("key")
+    def x(I):
+        I.load
+
+    calls = 0
+
+    async def load(self, ctx):
+        type(self).calls += 1
+        await asyncio.sleep(0.01)
+        return Result(ctx.key * 2)
+
+
+Coalesced.x.coalesce()
+
+
+# Batched loading.
+
+
+batches = []
+
+
+def fetch_categories(keys):
+    batches.append(keys)
+    if 0 in keys:
+        raise StepError()
+    return [key * 10 for key in keys]
+
+
+async def fetch_prices(keys):
+    batches.append(keys)
+    await asyncio.sleep(0)
+    return [key + 1 for key in keys]
+
+
+category_loader = Loader(fetch_categories)
+
+
+price_loader = Loader(fetch_prices)
+
+
+class Loaded(object):
+    @story
+    @arguments("category_id")
+    def x(I):
+        I.find_category
+        I.find_price
+        I.finish
+
+    async def find_category(self, ctx):
+        return Success(category=await category_loader.load(ctx.category_id))
+
+    async def find_price(self, ctx):
+        return Success(price=await price_loader.load(ctx.category))
+
+    def finish(self, ctx):
+        return Result((ctx.category, ctx.price))
+
+
+class LoadedTwice(object):
+    @story
+    @arguments("category_id")
+    def x(I):
+        I.find_category
+        I.find_again
+        I.finish
+
+    async def find_category(self, ctx):
+        return Success(category=await category_loader.load(ctx.category_id))
+
+    async def find_again(self, ctx):
+        return Success(again=await category_loader.load(ctx.category_id))
+
+    def finish(self, ctx):
+        return Result((ctx.category, ctx.again))
@@ -0,0 +1,162 @@
+from time import sleep
+
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import Skip
+from stories import story
+from stories import Success
+from stories.dataflow import reads
+
+
+# Declared reads.
+
+
+class Checkout(object):
+    @story
+    @arguments("user_id")
+    def buy(I):
+        I.find_user
+        I.find_category
+        I.find_price
+        I.find_profile
+        I.checkout
+
+    def __init__(self, rendezvous=None):
+        self.rendezvous = rendezvous
+
+    @reads("user_id")
+    def find_user(self, ctx):
+        self.meet()
+        return Success(user=ctx.user_id * 10)
+
+    @reads("user_id")
+    def find_category(self, ctx):
+        self.meet()
+        return Success(category=ctx.user_id + 1)
+
+    @reads("category")
+    def find_price(self, ctx):
+        return Success(price=ctx.category * 100)
+
+    @reads("user")
+    def find_profile(self, ctx):
+        return Success(profile=ctx.user + 1)
+
+    @reads("price", "profile")
+    def checkout(self, ctx):
+        return Result((ctx.price, ctx.profile))
+
+    def meet(self):
+        if self.rendezvous is not None:
+            assert self.rendezvous.wait()
+
+
+# Inferred reads.
+
+
+@reads
+class InferredCheckout(Checkout):
+    def find_user(self, ctx):
+        self.meet()
+        return Success(user=ctx.user_id * 10)
+
+    def find_category(self, ctx):
+        self.meet()
+        return Success(category=ctx.user_id + 1)
+
+    def find_price(self, ctx):
+        return Success(price=ctx.category * 100)
+
+    def find_profile(self, ctx):
+        return Success(profile=ctx.user + 1)
+
+    def checkout(self, ctx):
+        return Result((ctx.price, ctx.profile))
+
+
+class Escape(Checkout):
+    @reads
+    def find_profile(self, ctx):
+        return Success(profile=profile_of(ctx))
+
+
+def profile_of(ctx):
+    return ctx.user + 1
+
+
+# Outcomes.
+
+
+class Outcomes(object):
+    @story
+    @arguments("first", "second")
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    @reads("first")
+    def one(self, ctx):
+        sleep(0.05)
+        return self.outcome(ctx.first, foo=1)
+
+    @reads("second")
+    def two(self, ctx):
+        return self.outcome(ctx.second, bar=2)
+
+    @reads("foo", "bar")
+    def three(self, ctx):
+        return Result((ctx.foo, ctx.bar))
+
+    def outcome(self, kind, **kwargs):
+        if kind == "success":
+            return Success(**kwargs)
+        elif kind == "failure":
+            return Failure(kwargs.popitem()[0])
+        elif kind == "skip":
+            return Skip()
+        else:
+            raise StepError(kwargs.popitem()[0])
+
+
+Outcomes.x.failures(["foo", "bar"])
+
+
+class SequentialOutcomes(Outcomes):
+    def one(self, ctx):
+        return self.outcome(ctx.first, foo=1)
+
+    def two(self, ctx):
+        return self.outcome(ctx.second, bar=2)
+
+    def three(self, ctx):
+        return Result((ctx.foo, ctx.bar))
+
+
+class StepError(Exception):
+    pass
+
+
+# Wrong declarations.
+
+
+class WrongOrder(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+
+    @reads("foo")
+    def one(self, ctx):
+        return Result(ctx.foo)
+
+    @reads()
+    def two(self, ctx):
+        return Success(foo=1)
+
+
+class Undeclared(Checkout):
+    @reads("user")
+    def find_profile(self, ctx):
+        return Success(profile=ctx.user + ctx.category)
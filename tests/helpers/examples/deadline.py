@@ -0,0 +1,34 @@
+from time import sleep
+
+from stories import arguments
+from stories import Result
+from stories import story
+from stories import Success
+from stories.deadline import remaining
+
+
+# Slow story.
+
+
+class Slow(object):
+    @story
+    @arguments("delay")
+    def x(I):
+        I.one
+        I.y
+        I.two
+
+    @story
+    def y(I):
+        I.three
+
+    def one(self, ctx):
+        self.ctx = ctx
+        sleep(ctx.delay)
+        return Success(left=remaining())
+
+    def three(self, ctx):
+        return Success(nested=remaining())
+
+    def two(self, ctx):
+        return Result((ctx.left, ctx.nested))
@@ -0,0 +1,98 @@
+from stories import arguments
+from stories import Failure
+from stories import fan_out
+from stories import parallel
+from stories import Result
+from stories import story
+from stories import Success
+from stories.batch import batch
+
+
+# Deferred effects.
+
+
+class Subscribe(object):
+    @story
+    @arguments("user_id")
+    def x(I):
+        I.create_subscription
+        I.check_user
+        I.finish
+
+    sent = []
+    logged = []
+
+    def create_subscription(self, ctx):
+        if ctx.user_id == 0:
+            raise SubscriptionError()
+        return (
+            Success(subscription=ctx.user_id * 10)
+            .defer(self.notify, ctx.user_id)
+            .defer(self.log, "subscribed", ctx.user_id)
+        )
+
+    def check_user(self, ctx):
+        if ctx.user_id < 0:
+            return Failure("banned")
+        return Success().defer(self.notify, ctx.user_id + 1)
+
+    def finish(self, ctx):
+        return Result(ctx.subscription)
+
+    @batch("notify_all")
+    def notify(self, user_id):
+        self.notify_all([(user_id,)])
+
+    def notify_all(self, calls):
+        self.sent.append([user_id for (user_id,) in calls])
+
+    def log(self, message, user_id):
+        self.logged.append((message, user_id))
+
+
+Subscribe.x.failures(["banned"])
+
+
+class SubscriptionError(Exception):
+    pass
+
+
+# Deferred effects of the parallel group.
+
+
+class Welcome(Subscribe):
+    @story
+    @arguments("user_id")
+    def x(I):
+        parallel(I.send_email, I.send_sms)
+        I.create_subscription
+        I.check_user
+        I.finish
+
+    def send_email(self, ctx):
+        return Success(email=True).defer(self.log, "email", ctx.user_id)
+
+    def send_sms(self, ctx):
+        return Success(sms=True).defer(self.log, "sms", ctx.user_id)
+
+
+Welcome.x.failures(["banned"])
+
+
+# Deferred effects of fan-out items.
+
+
+class Campaign(Subscribe):
+    @story
+    @arguments("user_ids", "approved")
+    def y(I):
+        fan_out(I.x, over="user_ids", item="user_id", into="subscriptions")
+        I.approve
+
+    def approve(self, ctx):
+        if not ctx.approved:
+            return Failure("rejected")
+        return Result([summary.is_success for summary in ctx.subscriptions])
+
+
+Campaign.y.failures(["rejected"])
@@ -0,0 +1,119 @@
+from threading import Lock
+from time import sleep
+
+from _stories.compat import get_ident
+from stories import arguments
+from stories import Failure
+from stories import fan_out
+from stories import parallel
+from stories import Result
+from stories import story
+from stories import Success
+
+
+# Fan-out substory.
+
+
+class Orders(object):
+    @story
+    @arguments("order_id", "items")
+    def checkout(I):
+        I.start
+        fan_out(I.reserve, over="items", item="item", into="reservations", limit=2)
+        I.finish
+
+    @story
+    @arguments("order_id", "item")
+    def reserve(I):
+        I.check_stock
+        I.hold
+
+    def __init__(self):
+        self.lock = Lock()
+        self.running = 0
+        self.most = 0
+        self.threads = set()
+
+    def start(self, ctx):
+        return Success()
+
+    def check_stock(self, ctx):
+        with self.lock:
+            self.running += 1
+            self.most = max(self.most, self.running)
+            self.threads.add(get_ident())
+        sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        if ctx.item == 0:
+            raise StockError()
+        if ctx.item < 0:
+            return Failure("no_stock")
+        return Success()
+
+    def hold(self, ctx):
+        return Result((ctx.order_id, ctx.item))
+
+    def finish(self, ctx):
+        if any(result.is_failure for result in ctx.reservations):
+            return Failure("no_stock")
+        return Result([result.value for result in ctx.reservations])
+
+
+Orders.checkout.failures(["no_stock"])
+Orders.reserve.failures(["no_stock"])
+
+
+class StockError(Exception):
+    pass
+
+
+class Sequential(Orders):
+    @story
+    @arguments("order_id", "items")
+    def checkout(I):
+        I.start
+        fan_out(I.reserve, over="items", item="item", into="reservations", limit=1)
+        I.finish
+
+
+# Nested fan-out.
+
+
+class Shipments(object):
+    @story
+    @arguments("orders")
+    def ship(I):
+        fan_out(I.pack, over="orders", item="order", into="packages", limit=4)
+        I.finish
+
+    @story
+    @arguments("order")
+    def pack(I):
+        fan_out(I.wrap, over="order", item="item", into="wrapped", limit=4)
+        parallel(I.weigh, I.label)
+        I.seal
+
+    @story
+    @arguments("item")
+    def wrap(I):
+        I.box
+
+    def box(self, ctx):
+        sleep(0.01)
+        return Result(ctx.item * 10)
+
+    def weigh(self, ctx):
+        sleep(0.01)
+        return Success(weight=len(ctx.order))
+
+    def label(self, ctx):
+        sleep(0.01)
+        return Success(label="#" + str(ctx.order[0]))
+
+    def seal(self, ctx):
+        boxes = [result.value for result in ctx.wrapped]
+        return Result((boxes, ctx.weight, ctx.label))
+
+    def finish(self, ctx):
+        return Result([result.value for result in ctx.packages])
@@ -0,0 +1,36 @@
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import story
+from stories import Success
+
+
+# Background jobs.
+
+
+class Notify(object):
+    @story
+    @arguments("user", "message")
+    def send(I):
+        I.find_user
+        I.deliver
+
+    attempts = {}
+
+    def find_user(self, ctx):
+        if ctx.user < 0:
+            return Failure()
+        return Success()
+
+    def deliver(self, ctx):
+        attempts = self.attempts.get(ctx.user, 0) + 1
+        self.attempts[ctx.user] = attempts
+        if ctx.message == "flaky" and attempts < 3:
+            raise DeliveryError()
+        if ctx.message == "broken":
+            raise DeliveryError()
+        return Result(ctx.message.upper())
+
+
+class DeliveryError(Exception):
+    pass
@@ -0,0 +1,120 @@
+from threading import Event
+from threading import Lock
+from time import sleep
+
+from _stories.compat import get_ident
+from stories import arguments
+from stories import Failure
+from stories import parallel
+from stories import Result
+from stories import Skip
+from stories import story
+from stories import Success
+
+
+# Helper functions.
+
+
+class Rendezvous(object):
+    def __init__(self, parties):
+        self.parties = parties
+        self.arrived = 0
+        self.lock = Lock()
+        self.event = Event()
+
+    def wait(self):
+        with self.lock:
+            self.arrived += 1
+            if self.arrived == self.parties:
+                self.event.set()
+        return self.event.wait(0.5)
+
+
+# Parallel group.
+
+
+class Subscription(object):
+    @story
+    @arguments("user_id")
+    def buy(I):
+        I.find_user
+        parallel(I.find_category, I.find_price, I.find_profile)
+        I.checkout
+
+    def __init__(self, rendezvous=None):
+        self.rendezvous = rendezvous
+
+    def find_user(self, ctx):
+        return Success(user=ctx.user_id * 10)
+
+    def find_category(self, ctx):
+        return Success(category=self.meet(ctx))
+
+    def find_price(self, ctx):
+        return Success(price=self.meet(ctx))
+
+    def find_profile(self, ctx):
+        return Success(profile=self.meet(ctx))
+
+    def checkout(self, ctx):
+        return Result((ctx.category, ctx.price, ctx.profile))
+
+    def meet(self, ctx):
+        met = self.rendezvous.wait() if self.rendezvous else True
+        return ctx.user, get_ident(), met
+
+
+# Parallel group outcomes.
+
+
+class Outcomes(object):
+    @story
+    @arguments("first", "second")
+    def x(I):
+        I.one
+        parallel(I.two, I.three)
+        I.four
+
+    @story
+    @arguments("first", "second")
+    def y(I):
+        I.x
+        I.five
+
+    def one(self, ctx):
+        return Success()
+
+    def two(self, ctx):
+        sleep(0.05)
+        return self.outcome(ctx.first, foo=2)
+
+    def three(self, ctx):
+        return self.outcome(ctx.second, bar=3)
+
+    def four(self, ctx):
+        return Result((ctx.foo, ctx.bar))
+
+    def five(self, ctx):
+        return Result("five")
+
+    def outcome(self, kind, **kwargs):
+        if kind == "success":
+            return Success(**kwargs)
+        elif kind == "conflict":
+            return Success(foo=1)
+        elif kind == "failure":
+            return Failure(kwargs.popitem()[0])
+        elif kind == "result":
+            return Result(kwargs.popitem()[1])
+        elif kind == "skip":
+            return Skip()
+        else:
+            raise StepError(kwargs.popitem()[0])
+
+
+Outcomes.x.failures(["foo", "bar"])
+Outcomes.y.failures(["foo", "bar"])
+
+
+class StepError(Exception):
+    pass
@@ -0,0 +1,21 @@
+from stories import arguments
+from stories import Result
+from stories import story
+from stories import Success
+
+
+# Large buffers.
+
+
+class Measure(object):
+    @story
+    @arguments("data")
+    def size(I):
+        I.count
+        I.finish
+
+    def count(self, ctx):
+        return Success(total=len(ctx.data))
+
+    def finish(self, ctx):
+        return Result((ctx.total, ctx.data))
@@ -0,0 +1,38 @@
+from threading import Lock
+from time import sleep
+
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import story
+from stories import Success
+
+
+# Streamed story.
+
+
+class Parse(object):
+    @story
+    @arguments("number", "delay")
+    def document(I):
+        I.wait
+        I.finish
+
+    lock = Lock()
+    running = 0
+    most = 0
+
+    def wait(self, ctx):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.most = max(cls.most, cls.running)
+        sleep(ctx.delay)
+        with cls.lock:
+            cls.running -= 1
+        if ctx.number < 0:
+            return Failure()
+        return Success()
+
+    def finish(self, ctx):
+        return Result(ctx.number)
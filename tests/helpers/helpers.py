@@ -1,28 +1,23 @@
 import configparser
 import textwrap
 
-import _stories.context
+from _stories.instrument import add_instruments
+from _stories.instrument import Collector
+from _stories.instrument import remove_instruments
 
 
 def make_collector():
-    # FIXME: Rewrite to the context manager.  Disable instrumentation
-    # on exit.
+    # FIXME: Rewrite to the context manager.
 
-    storage = []
-
-    origin_context_init = _stories.context.Context.__init__
-
-    def wrapper(ctx):
-        origin_context_init(ctx)
-        storage.append(ctx)
-
-    _stories.context.Context.__init__ = wrapper
+    collector = Collector()
+    add_instruments(collector)
 
     def getter():
-        length = len(storage)
+        remove_instruments(collector)
+        length = len(collector.runs)
         error_message = "Context() was called {length} times".format(length=length)
         assert length == 1, error_message
-        return storage[0]
+        return collector.runs[0].ctx
 
     return getter
 
@@ -0,0 +1,77 @@
+import pytest
+
+import examples
+from stories.batch import batch
+from stories.exceptions import StoryDefinitionError
+
+
+def test_run_many_same_as_run():
+
+    kwargs_list = [{"customer_id": i} for i in (1, -1, 2, 3, 4)]
+
+    del examples.batch.Billing.batches[:]
+    results = examples.batch.Billing().charge.run_many(kwargs_list)
+    assert examples.batch.Billing.batches == [
+        ("find_customers", [1, -1, 2, 3, 4]),
+        ("find_prices", [1, 2, 3, 4]),
+    ]
+
+    expected = [examples.batch.Billing().charge.run(**kw) for kw in kwargs_list]
+    for result, single in zip(results, expected):
+        assert result.is_success is single.is_success
+        assert result.failed_because("unknown") is single.failed_because("unknown")
+        assert result.failed_on("find_customer") is single.failed_on("find_customer")
+        if result.is_success:
+            assert result.value == single.value
+
+    assert [result.value for result in results if result.is_success] == [
+        10,
+        19,
+        "free",
+        39,
+    ]
+    assert repr(results[1].ctx) == repr(expected[1].ctx)
+
+
+def test_run_many_history():
+
+    results = examples.batch.Billing().charge.run_many([{"customer_id": -1}])
+    assert repr(results[0].ctx).splitlines()[:3] == [
+        "Billing.charge",
+        "  find_customer (failed: 'unknown')",
+        "",
+    ]
+
+
+def test_run_many_error():
+
+    with pytest.raises(examples.batch.DiscountError):
+        examples.batch.Billing().charge.run_many(
+            [{"customer_id": 1}, {"customer_id": 0}]
+        )
+
+
+def test_run_many_wrong_batch():
+
+    with pytest.raises(AssertionError) as exc_info:
+        examples.batch.WrongBatch().charge.run_many([{"customer_id": 1}])
+
+    assert str(exc_info.value) == (
+        "Batch variant of the step should return one result for each context.\n"
+        "\n"
+        "Got 0 results for 1 contexts: find_price"
+    )
+
+
+def test_run_many_empty():
+
+    assert examples.batch.Billing().charge.run_many([]) == []
+
+
+def test_wrong_batch():
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        batch(1)
+    assert str(exc_info.value) == (
+        "Batch variant of the step can only be defined with its name"
+    )
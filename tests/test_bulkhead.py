@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import examples
+from stories.bulkhead import bulkhead
+from stories.exceptions import BulkheadFull
+from stories.exceptions import StoryDefinitionError
+from stories.instrument import Collector
+from stories.instrument import instrumented
+
+
+def test_concurrency_limit():
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [
+            executor.submit(examples.bulkhead.Payments().pay, amount=amount)
+            for amount in range(6)
+        ]
+        assert [future.result() for future in futures] == list(range(6))
+
+    assert examples.bulkhead.Payments.most == 2
+
+
+def test_queue_limit():
+
+    gateway = examples.bulkhead.Gateway()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(gateway.charge)
+        assert gateway.entered.wait(0.5)
+        with pytest.raises(BulkheadFull) as exc_info:
+            gateway.charge()
+        gateway.release.set()
+        assert future.result() is True
+
+    assert str(exc_info.value) == (
+        "Bulkhead queue is full: 0 calls are waiting for 1 slots"
+    )
+    assert gateway.charge() is True
+
+
+def test_wait_time_reported():
+
+    collector = Collector()
+
+    def pay(amount):
+        with instrumented(collector):
+            return examples.bulkhead.Payments().pay(amount=amount)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(pay, range(3)))
+
+    steps = [step for run in collector.runs for step in run.steps]
+    waited = sorted(step.waited for step in steps if step.name == "persist")
+    assert waited[:2] == [0.0, 0.0]
+    assert waited[2] > 0.01
+    assert all(step.waited is None for step in steps if step.name != "persist")
+    assert all(step.duration < 0.02 + 0.01 for step in steps)
+
+
+def test_limited_substory():
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(examples.bulkhead.Warehouse().ship.run, amount=amount)
+            for amount in [1, -1, 2, 3]
+        ]
+        results = [future.result() for future in futures]
+
+    assert examples.bulkhead.Warehouse.most == 1
+    assert [result.is_success for result in results] == [True, False, True, True]
+    assert results[1].failed_on("pack")
+
+    # Failed substory released its slot.
+    assert examples.bulkhead.Warehouse().ship(amount=4) == 4
+
+
+def test_wrong_bulkhead():
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        bulkhead(0)
+    assert str(exc_info.value) == "Bulkhead limit should be a positive integer"
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        bulkhead(1, queue=-1)
+    assert str(exc_info.value) == "Bulkhead queue should be a non-negative integer"
@@ -0,0 +1,135 @@
+import pickle
+
+import pytest
+
+import examples
+from stories.checkpoint import FileStore
+from stories.checkpoint import SQLiteStore
+from stories.exceptions import ContextContractError
+from stories.exceptions import StoryError
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteStore(str(tmp_path / "checkpoints.sqlite3"))
+    else:
+        store = FileStore(str(tmp_path / "checkpoints"))
+    examples.checkpoint.Import.load.checkpoint(store)
+    del examples.checkpoint.Import.calls[:]
+    del examples.checkpoint.Import.reported[:]
+    yield store
+    examples.checkpoint.Import.load.checkpoint(None)
+    examples.checkpoint.Import.crash = False
+
+
+def crash(rows):
+    examples.checkpoint.Import.crash = True
+    with pytest.raises(examples.checkpoint.ImportCrash):
+        examples.checkpoint.Import().load.run(rows=rows)
+    [run_id] = examples.checkpoint.Import().load.pending()
+    return run_id
+
+
+def test_resume(store):
+
+    run_id = crash(["1", "2"])
+
+    assert examples.checkpoint.Import.calls == [
+        "parse",
+        "count",
+        "check",
+        "normalize",
+        "save",
+    ]
+
+    result = examples.checkpoint.Import().load.resume(run_id)
+
+    assert result.value == 30
+    assert examples.checkpoint.Import.calls[5:] == ["save"]
+    assert examples.checkpoint.Import().load.pending() == []
+
+
+def test_resume_preserves_history(store):
+
+    run_id = crash([])
+    result = examples.checkpoint.Import().load.resume(run_id)
+
+    expected = """
+Import.load
+  parse
+  count
+  check
+  prepare
+    normalize
+  save
+  finish (failed)
+
+Context:
+  rows: []     # Story argument
+  parsed: []   # Set by Import.parse
+  total: 0     # Set by Import.count
+  valid: True  # Set by Import.check
+  scaled: []   # Set by Import.normalize
+  saved: 0     # Set by Import.save
+    """.strip()
+
+    assert result.is_failure
+    assert repr(result.ctx) == expected
+
+
+def test_resume_makes_deferred_effects(store):
+
+    run_id = crash(["1", "2"])
+    assert examples.checkpoint.Import.reported == []
+
+    # Effects of steps done before the crash are bound to the new
+    # service object.
+
+    obj = examples.checkpoint.Import()
+    assert obj.load.resume(run_id).value == 30
+    assert examples.checkpoint.Import.reported == [(obj, 2)]
+
+
+def test_finished_run_has_no_checkpoint(store):
+
+    examples.checkpoint.Import().load.run(rows=["1"])
+    examples.checkpoint.Import.crash = True
+    with pytest.raises(examples.checkpoint.ImportCrash):
+        examples.checkpoint.Import().load(rows=["1"])
+
+    assert len(examples.checkpoint.Import().load.pending()) == 1
+
+
+def test_restored_context_is_validated(store):
+
+    run_id = crash(["1", "2"])
+
+    state = pickle.loads(store.load(run_id))
+    state["assigned"] = [
+        (position, {"total": "two"} if "total" in kwargs else kwargs)
+        for position, kwargs in state["assigned"]
+    ]
+    store.save(run_id, "examples.checkpoint:Import.load", pickle.dumps(state))
+
+    with pytest.raises(ContextContractError):
+        examples.checkpoint.Import().load.resume(run_id)
+
+
+def test_resume_errors():
+
+    with pytest.raises(StoryError) as exc_info:
+        examples.checkpoint.Import().load.resume("x")
+
+    assert str(exc_info.value) == (
+        "Story does not have the checkpoint store: Import.load\n\n"
+        "Use `Import.load.checkpoint(store)` to define one."
+    )
+
+
+def test_resume_unknown_run(store):
+
+    with pytest.raises(StoryError) as exc_info:
+        examples.checkpoint.Import().load.resume("x")
+
+    assert str(exc_info.value).startswith("There is no checkpoint of the run: 'x'")
@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+
+import pytest
+
+import examples
+
+
+@pytest.fixture()
+def stats():
+    cls = examples.coalesce.Stats
+    cls.calls = 0
+    cls.entered.clear()
+    cls.release.clear()
+    yield cls
+    cls.release.set()
+
+
+def concurrently(stats, f, kwargs, number):
+    flights = stats.fetch.coalesce()
+    coalesced = flights.coalesced
+    with ThreadPoolExecutor(max_workers=number) as executor:
+        futures = [executor.submit(f, **kwargs)]
+        assert stats.entered.wait(0.5)
+        futures.extend(executor.submit(f, **kwargs) for _ in range(number - 1))
+        for _ in range(50):
+            if flights.coalesced - coalesced == number - 1:
+                break
+            sleep(0.005)
+        stats.release.set()
+        return futures, flights.coalesced - coalesced
+
+
+def separately(stats, calls):
+    flights = stats.fetch.coalesce()
+    coalesced = flights.coalesced
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        (f, kwargs), rest = calls[0], calls[1:]
+        futures = [executor.submit(f, **kwargs)]
+        assert stats.entered.wait(0.5)
+        futures.extend(executor.submit(f, **kwargs) for f, kwargs in rest)
+        for _ in range(50):
+            if stats.calls == len(calls):
+                break
+            sleep(0.005)
+        stats.release.set()
+        return [future.result() for future in futures], flights.coalesced - coalesced
+
+
+def test_concurrent_calls_share_execution(stats):
+
+    futures, coalesced = concurrently(stats, stats().fetch, {"key": 2}, 4)
+
+    assert [future.result() for future in futures] == [4, 4, 4, 4]
+    assert stats.calls == 1
+    assert coalesced == 3
+
+
+def test_concurrent_runs_share_summary(stats):
+
+    futures, coalesced = concurrently(stats, stats().fetch.run, {"key": 3}, 3)
+
+    results = [future.result() for future in futures]
+    assert results[0].value == 6
+    assert results[1] is results[0]
+    assert results[2] is results[0]
+    assert stats.calls == 1
+    assert coalesced == 2
+
+
+def test_concurrent_calls_share_error(stats):
+
+    futures, coalesced = concurrently(stats, stats().fetch, {"key": 0}, 3)
+
+    errors = [future.exception() for future in futures]
+    assert isinstance(errors[0], examples.coalesce.StatsError)
+    assert errors[1] is errors[0]
+    assert errors[2] is errors[0]
+    assert stats.calls == 1
+
+
+def test_interrupted_call_is_run_again(stats):
+
+    futures, coalesced = concurrently(stats, stats().fetch, {"key": -1}, 3)
+
+    assert isinstance(futures[0].exception(), examples.coalesce.StatsInterrupt)
+    assert [future.result() for future in futures[1:]] == [-2, -2]
+    assert stats.calls >= 2
+
+
+def test_calls_of_other_objects_are_not_shared(stats):
+
+    results, coalesced = separately(
+        stats, [(stats().fetch, {"key": 2}), (stats().fetch, {"key": 2})]
+    )
+
+    assert results == [4, 4]
+    assert stats.calls == 2
+    assert coalesced == 0
+
+
+def test_equal_arguments_of_other_types_are_not_shared(stats):
+
+    story = stats()
+    results, coalesced = separately(
+        stats, [(story.fetch, {"key": 1}), (story.fetch, {"key": True})]
+    )
+
+    assert results == [2, 2]
+    assert stats.calls == 2
+    assert coalesced == 0
+
+
+def test_sequential_calls_are_not_shared(stats):
+
+    stats.release.set()
+
+    assert stats().fetch(key=1) == 2
+    assert stats().fetch(key=1) == 2
+    assert stats.calls == 2
+
+
+def test_unhashable_arguments_are_not_shared(stats):
+
+    stats.release.set()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(stats().fetch, key=[1, 2]) for _ in range(3)]
+        assert [future.result() for future in futures] == [2, 2, 2]
+
+    assert stats.calls == 3
@@ -0,0 +1,178 @@
+import pytest
+
+from stories import arguments
+from stories import Failure
+from stories import Result
+from stories import Skip
+from stories import story
+from stories import Success
+from stories.exceptions import ContextContractError
+
+
+numpy = pytest.importorskip("numpy")
+
+from stories.contrib.columns import columnar  # noqa: E402  # isort:skip
+from stories.contrib.columns import run_columns  # noqa: E402  # isort:skip
+from stories.contrib.columns import where  # noqa: E402  # isort:skip
+
+
+class Pricing(object):
+    @story
+    @arguments("price", "discount")
+    def total(I):
+        I.check_price
+        I.apply_discount
+        I.round_total
+        I.finish
+
+    @story
+    def apply_discount(I):
+        I.check_discount
+        I.subtract
+
+    @columnar
+    def check_price(self, ctx):
+        return where(ctx.price < 0, Failure("negative"), Success())
+
+    def check_discount(self, ctx):
+        if ctx.discount == 0:
+            return Skip()
+        return Success()
+
+    @columnar
+    def subtract(self, ctx):
+        return Success(discounted=ctx.price - ctx.discount)
+
+    def round_total(self, ctx):
+        if ctx.price == 0:
+            return Result("free")
+        discounted = ctx.discounted if "discounted" in dir(ctx) else ctx.price
+        return Success(total=round(discounted, 1))
+
+    @columnar
+    def finish(self, ctx):
+        return Result(ctx.total)
+
+
+Pricing.total.failures(["negative"])
+
+
+def test_columns():
+
+    result = run_columns(
+        Pricing().total,
+        price=numpy.array([10.0, -1.0, 5.0, 0.0, 7.25]),
+        discount=numpy.array([1.0, 0.0, 0.0, 2.0, 0.5]),
+    )
+
+    assert len(result) == 5
+    assert result.is_failure.tolist() == [False, True, False, False, False]
+    assert result.is_success.tolist() == [True, False, True, True, True]
+    assert result.failed_on("check_price").tolist() == [
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert result.failed_because("negative").tolist() == result.is_failure.tolist()
+    assert result.value.tolist() == [9.0, None, 5.0, "free", 6.8]
+    assert result.columns["discounted"][[0, 4]].tolist() == [9.0, 6.75]
+    assert repr(result) == "ColumnSummary(rows=5, failed=1)"
+
+
+def test_wrong_columns():
+
+    with pytest.raises(ContextContractError):
+        run_columns(Pricing().total, price=numpy.array([1.0]))
+
+    with pytest.raises(ContextContractError):
+        run_columns(Pricing().total, price=numpy.array([1.0]), discount=numpy.array([]))
+
+
+def positive(value):
+    if value > 0:
+        return value, None
+    return None, "Invalid value"
+
+
+class Shares(object):
+    @story
+    @arguments("price")
+    def total(I):
+        I.split
+        I.round_share
+        I.finish
+
+    @columnar
+    def split(self, ctx):
+        return Success(share=ctx.price / 2)
+
+    def round_share(self, ctx):
+        return Success(rounded=round(ctx.share))
+
+    @columnar
+    def finish(self, ctx):
+        return Result(ctx.rounded)
+
+
+Shares.total.contract({"price": positive, "share": positive, "rounded": positive})
+
+
+def test_columns_contract():
+
+    result = run_columns(Shares().total, price=numpy.array([3.0, 4.0]))
+    assert result.value.tolist() == [2, 2]
+
+    with pytest.raises(ContextContractError):
+        run_columns(Shares().total, price=numpy.array([3.0, -4.0]))
+
+    with pytest.raises(ContextContractError):
+        run_columns(Shares().total, price=numpy.array([3.0, 0.5]))
+
+
+class Override(object):
+    @story
+    @arguments("price")
+    def total(I):
+        I.change_price
+
+    @columnar
+    def change_price(self, ctx):
+        return Success(price=ctx.price + 1)
+
+
+def test_columns_override():
+
+    with pytest.raises(ContextContractError):
+        run_columns(Override().total, price=numpy.array([1.0]))
+
+
+class Mixed(object):
+    @story
+    @arguments("price")
+    def total(I):
+        I.discount
+        I.label
+        I.finish
+
+    @columnar
+    def discount(self, ctx):
+        return where(ctx.price > 1, Success(discount=1), Success(discount=0.5))
+
+    @columnar
+    def label(self, ctx):
+        return where(ctx.price > 2, Success(name=1), Success(name="cheap"))
+
+    @columnar
+    def finish(self, ctx):
+        return Result(ctx.price - ctx.discount)
+
+
+def test_columns_widen_type():
+
+    result = run_columns(Mixed().total, price=numpy.array([3.0, 1.0, 2.0]))
+
+    assert result.value.tolist() == [2.0, 0.5, 1.0]
+    assert result.columns["discount"].tolist() == [1.0, 0.5, 1.0]
+    assert result.columns["name"].tolist() == [1, "cheap", "cheap"]
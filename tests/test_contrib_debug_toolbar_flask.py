@@ -1,7 +1,37 @@
 import pytest
 
+import examples
+from _stories.instrument import get_instruments
 
-pytest.importorskip("foo")
-from stories.contrib.debug_toolbars.flask import (  # FIXME: isort:skip  # pragma: no cover  # noqa
-    StoriesPanel,
-)
+
+flask = pytest.importorskip("flask")
+pytest.importorskip("flask_debugtoolbar")
+
+from flask_debugtoolbar import DebugToolbarExtension  # noqa: E402  # isort:skip
+
+
+def test_collector_removed_after_request():
+
+    app = flask.Flask(__name__)
+    app.config.update(
+        DEBUG_TB_PANELS=["stories.contrib.debug_toolbars.flask.StoriesPanel"],
+        SECRET_KEY="secret",
+    )
+    app.debug = True
+    DebugToolbarExtension(app)
+
+    panels = []
+
+    @app.route("/")
+    def index():
+        panels.append(flask.g.stories_panel)
+        examples.methods.Simple().x(foo=1, bar=2)
+        return flask.Response("ok", mimetype="text/plain")
+
+    client = app.test_client()
+    instruments = get_instruments()
+    client.get("/")
+    client.get("/")
+
+    assert [len(panel.collector.runs) for panel in panels] == [1, 1]
+    assert get_instruments() == instruments
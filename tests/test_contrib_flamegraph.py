@@ -0,0 +1,99 @@
+import json
+
+import examples
+from stories import Result
+from stories import story
+from stories import Success
+from stories.contrib.flamegraph import record
+
+
+class Outer(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+
+    def one(self, ctx):
+        return Success(value=examples.methods.Simple().x(foo=1, bar=3))
+
+    def two(self, ctx):
+        return Result(ctx.value)
+
+
+def test_collapsed_stacks():
+
+    with record() as recorder:
+        examples.methods.SimpleSubstory().y.run(spam=2)
+        examples.methods.SimpleSubstory().y.run(spam=2)
+        Outer().x()
+
+    lines = recorder.collapsed().splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert stacks == [
+        "Outer.x;one",
+        "Outer.x;one;Simple.x;one",
+        "Outer.x;one;Simple.x;three",
+        "Outer.x;one;Simple.x;two",
+        "Outer.x;two",
+        "SimpleSubstory.y;SimpleSubstory.x;one",
+        "SimpleSubstory.y;SimpleSubstory.x;three",
+        "SimpleSubstory.y;SimpleSubstory.x;two",
+        "SimpleSubstory.y;before",
+        "SimpleSubstory.y;start",
+    ]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in lines)
+
+
+def test_chrome_trace():
+
+    with record(trace=True) as recorder:
+        examples.methods.SimpleSubstory().y.run(spam=2)
+        examples.methods.SimpleSubstory().y.run(spam=3)
+
+    trace = json.loads(recorder.chrome_trace())
+    events = trace["traceEvents"]
+    assert all(event["ph"] == "X" for event in events)
+
+    stories = [event for event in events if event["cat"] == "story"]
+    assert [event["name"] for event in stories] == [
+        "SimpleSubstory.y",
+        "SimpleSubstory.x",
+        "SimpleSubstory.y",
+        "SimpleSubstory.x",
+    ]
+
+    steps = [event for event in events if event["cat"] == "step"]
+    assert len(steps) == 9
+    assert steps[-1]["name"] == "SimpleSubstory.two"
+    assert steps[-1]["args"] == {
+        "story": "SimpleSubstory.y > SimpleSubstory.x",
+        "outcome": "Failure",
+    }
+
+
+def test_trace_limit():
+
+    with record(trace=True, limit=3) as recorder:
+        examples.methods.SimpleSubstory().y.run(spam=2)
+        examples.methods.SimpleSubstory().y.run(spam=3)
+
+    events = json.loads(recorder.chrome_trace())["traceEvents"]
+    steps = [event["name"] for event in events if event["cat"] == "step"]
+    assert steps == [
+        "SimpleSubstory.before",
+        "SimpleSubstory.one",
+        "SimpleSubstory.two",
+    ]
+    assert len(recorder.collapsed().splitlines()) == 5
+
+
+def test_record_without_trace():
+
+    with record() as recorder:
+        examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert recorder.collapsed()
+    assert json.loads(recorder.chrome_trace()) == {
+        "traceEvents": [],
+        "displayTimeUnit": "ms",
+    }
@@ -0,0 +1,105 @@
+import pytest
+
+from stories import Result
+from stories import story
+from stories import Success
+from stories.exceptions import StoryError
+from stories.instrument import Instrument
+from stories.instrument import instrumented
+
+
+tracemalloc = pytest.importorskip("tracemalloc")
+from _stories.contrib.memory import peak_unavailable_message  # noqa: E402  # isort:skip
+from stories.contrib.memory import track_allocations  # noqa: E402  # isort:skip
+
+
+class Allocate(object):
+    @story
+    def x(I):
+        I.build
+        I.drop
+        I.finish
+
+    def build(self, ctx):
+        return Success(buffer=bytearray(1024 * 1024))
+
+    def drop(self, ctx):
+        temporary = bytearray(2 * 1024 * 1024)
+        del temporary
+        return Success()
+
+    def finish(self, ctx):
+        return Result(len(ctx.buffer))
+
+
+def test_track_allocations_summary():
+
+    with track_allocations(peak=hasattr(tracemalloc, "reset_peak")) as tracker:
+        result = Allocate().x.run()
+
+    assert result.value == 1024 * 1024
+    assert [step.qualname for step in result.steps] == [
+        "Allocate.build",
+        "Allocate.drop",
+        "Allocate.finish",
+    ]
+
+    build, drop, finish = [step.data["memory"] for step in result.steps]
+    assert build.net >= 1024 * 1024
+    assert abs(drop.net) < 64 * 1024
+    assert abs(finish.net) < 64 * 1024
+    if hasattr(tracemalloc, "reset_peak"):
+        assert drop.peak >= 2 * 1024 * 1024
+        assert build.peak < 2 * 1024 * 1024
+    else:
+        assert drop.peak is None
+    assert build.sites[0].filename == __file__
+    assert build.sites[0].size >= 1024 * 1024
+    assert [qualname for qualname, _allocation in tracker.steps] == [
+        "Allocate.build",
+        "Allocate.drop",
+        "Allocate.finish",
+    ]
+    assert not tracemalloc.is_tracing()
+
+
+def test_track_allocations_events():
+
+    seen = []
+
+    class Listener(Instrument):
+        def step_finished(self, step):
+            seen.append(step.data["memory"].net)
+
+    with instrumented(Listener()):
+        with track_allocations(top=0):
+            Allocate().x()
+
+    assert len(seen) == 3
+    assert seen[0] >= 1024 * 1024
+
+
+def test_peak_is_measured_on_request():
+
+    with track_allocations(top=0):
+        result = Allocate().x.run()
+
+    assert [step.data["memory"].peak for step in result.steps] == [None] * 3
+
+
+@pytest.mark.skipif(
+    hasattr(tracemalloc, "reset_peak"), reason="Peak is available on Python 3.9"
+)
+def test_peak_unavailable():
+
+    with pytest.raises(StoryError) as exc_info:
+        with track_allocations(peak=True):
+            pass  # pragma: no cover
+
+    assert str(exc_info.value) == peak_unavailable_message
+
+
+def test_steps_are_empty_without_instruments():
+
+    result = Allocate().x.run()
+    assert result.steps == ()
@@ -0,0 +1,71 @@
+import pstats
+import time
+
+import examples
+from stories import Result
+from stories import story
+from stories import Success
+from stories.contrib.profiler import profile
+from stories.contrib.profiler import sample
+
+
+class Slow(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+
+    def one(self, ctx):
+        return Success()
+
+    def two(self, ctx):
+        time.sleep(0.05)
+        return Result(1)
+
+
+def test_profile_all_steps():
+
+    with profile() as profiler:
+        examples.methods.SimpleSubstory().y.run(spam=2)
+
+    stats = profiler.stats
+    assert sorted(stats) == [
+        "SimpleSubstory.before",
+        "SimpleSubstory.one",
+        "SimpleSubstory.start",
+        "SimpleSubstory.three",
+        "SimpleSubstory.two",
+    ]
+    assert all(isinstance(value, pstats.Stats) for value in stats.values())
+
+
+def test_profile_selected_steps():
+
+    with profile("start", "SimpleSubstory.x") as profiler:
+        examples.methods.SimpleSubstory().y.run(spam=2)
+
+    assert sorted(profiler.stats) == [
+        "SimpleSubstory.one",
+        "SimpleSubstory.start",
+        "SimpleSubstory.three",
+        "SimpleSubstory.two",
+    ]
+
+
+def test_profile_does_not_leak():
+
+    with profile() as profiler:
+        pass
+    examples.methods.Simple().x(foo=1, bar=3)
+    assert profiler.stats == {}
+
+
+def test_sample_current_step():
+
+    with sample("two", interval=0.001) as sampler:
+        Slow().x()
+
+    assert list(sampler.counts) == ["Slow.two"]
+    assert sampler.counts["Slow.two"] > 0
+    for stack in sampler.samples["Slow.two"]:
+        assert stack[0].startswith("two (")
@@ -0,0 +1,36 @@
+import threading
+
+import examples
+from _stories.compat import copy_context
+from _stories.contrib.pytest import ContextTracker
+from stories.instrument import instrumented
+
+
+def test_context_tracker():
+
+    tracker = ContextTracker()
+    with instrumented(tracker):
+        result = examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert result.steps == ()
+    ((src, ctx),) = tracker.storage
+    assert "examples.methods.Simple().x.run(foo=1, bar=3)" in src
+    assert ctx.foo == 1
+
+
+def test_context_tracker_threads():
+    """Stories running in the threads started by the test have no source."""
+    tracker = ContextTracker()
+    with instrumented(tracker):
+        context = copy_context()
+    thread = threading.Thread(
+        target=context.run,
+        args=(examples.methods.Simple().x.run,),
+        kwargs={"foo": 1, "bar": 3},
+    )
+    thread.start()
+    thread.join()
+
+    ((src, ctx),) = tracker.storage
+    assert src is None
+    assert ctx.foo == 1
@@ -0,0 +1,82 @@
+import pytest
+
+from stories import story
+from stories import Success
+
+
+pytest.importorskip("django")
+
+from django.db import connection  # noqa: E402  # isort:skip
+from stories.contrib.queries import track_queries  # noqa: E402  # isort:skip
+
+
+pytestmark = [
+    pytest.mark.filterwarnings("ignore::RuntimeWarning"),
+    pytest.mark.skipif(
+        not hasattr(connection, "execute_wrapper"),
+        reason="Query execution could not be wrapped before Django 2.0",
+    ),
+]
+
+
+def query(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone()
+
+
+class Queries(object):
+    @story
+    def x(I):
+        I.one
+        I.two
+        I.three
+
+    def one(self, ctx):
+        query("select %s", [1])
+        return Success()
+
+    def two(self, ctx):
+        query("select %s", [1])
+        query("select %s", [1])
+        query("select %s", [2])
+        return Success()
+
+    def three(self, ctx):
+        return Success()
+
+
+def test_queries_attributed_to_steps():
+
+    with track_queries() as tracker:
+        query("select %s", [0])
+        Queries().x()
+
+    assert [name for name, queries in tracker.steps] == [
+        "Queries.one",
+        "Queries.two",
+        "Queries.three",
+    ]
+    one, two, three = (queries for name, queries in tracker.steps)
+
+    assert one.count == 1
+    assert one.duplicates == {}
+    assert one.similar == {}
+
+    assert two.count == 3
+    assert two.duration >= 0
+    assert two.duplicates == {"select %s": 2}
+    assert two.similar == {"select %s": 3}
+
+    assert three.count == 0
+
+
+def test_queries_untracked_outside():
+
+    with track_queries("default") as tracker:
+        pass
+
+    Queries().x()
+
+    assert tracker.steps == []
+    assert not connection.execute_wrappers
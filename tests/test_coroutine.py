@@ -0,0 +1,560 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from _stories.compat import get_ident
+from _stories.execute.function import coroutine_step_template
+from stories.exceptions import DeadlineExceeded
+from stories.exceptions import FailureError
+from stories.exceptions import FailureProtocolError
+
+
+asyncio = pytest.importorskip("asyncio")
+
+import examples.checkpoint  # noqa: E402  # isort:skip
+import examples.coroutines  # noqa: E402  # isort:skip
+import examples.effects  # noqa: E402  # isort:skip
+from stories.checkpoint import SQLiteStore  # noqa: E402  # isort:skip
+from stories.deadline import deadline  # noqa: E402  # isort:skip
+from stories.executors import set_executor  # noqa: E402  # isort:skip
+from stories.hedge import get_hedge  # noqa: E402  # isort:skip
+from stories.instrument import add_instruments  # noqa: E402  # isort:skip
+from stories.instrument import Collector  # noqa: E402  # isort:skip
+from stories.instrument import current_step  # noqa: E402  # isort:skip
+from stories.instrument import instrumented  # noqa: E402  # isort:skip
+from stories.loader import Loader  # noqa: E402  # isort:skip
+from stories.loader import scope  # noqa: E402  # isort:skip
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_call():
+
+    result = run(examples.coroutines.Simple().x.acall(foo=1, bar=3))
+    assert result == -1
+
+    with pytest.raises(FailureError):
+        run(examples.coroutines.Simple().x.acall(foo=2, bar=3))
+
+    result = run(examples.coroutines.Simple().x.acall(foo=1, bar=-1))
+    assert result is None
+
+
+def test_run():
+
+    result = run(examples.coroutines.Simple().x.run_async(foo=1, bar=3))
+    assert result.is_success
+    assert result.value == -1
+
+    result = run(examples.coroutines.Simple().x.run_async(foo=2, bar=3))
+    assert result.is_failure
+    assert result.failed_on("two")
+    assert result.ctx.foo == 2
+
+
+def test_substory():
+
+    result = run(examples.coroutines.SimpleSubstory().y.acall(spam=2))
+    assert result == -1
+
+    result = run(examples.coroutines.SimpleSubstory().y.acall(spam=0))
+    assert result == -3
+
+    result = run(examples.coroutines.SimpleSubstory().y.acall(spam=-2))
+    assert result == -4
+
+    result = run(examples.coroutines.SyncParent().z.acall(spam=1))
+    assert result == -3
+
+    result = run(examples.coroutines.SyncParent().z.acall(spam=-1))
+    assert result == -1
+
+
+def test_concurrent_stories():
+    async def gather():
+        return await asyncio.gather(
+            examples.coroutines.Simple().x.acall(foo=1, bar=3),
+            examples.coroutines.Simple().x.acall(foo=1, bar=5),
+        )
+
+    assert run(gather()) == [-1, 1]
+
+
+def test_failure_protocol():
+
+    result = run(examples.coroutines.Reasons().x.run_async())
+    assert result.failed_because("foo")
+
+    with pytest.raises(FailureError) as exc_info:
+        run(examples.coroutines.Reasons().x.acall())
+    assert repr(exc_info.value) == "FailureError('foo')"
+
+    with pytest.raises(FailureProtocolError):
+        result.failed_because("baz")
+
+
+def test_error():
+
+    with pytest.raises(examples.coroutines.StepError):
+        run(examples.coroutines.Raise().x.acall())
+
+    with pytest.raises(AssertionError):
+        run(examples.coroutines.WrongResult().x.acall())
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_sync_call_of_coroutine_step():
+
+    with pytest.raises(AssertionError) as exc_info:
+        examples.coroutines.Simple().x(foo=1, bar=3)
+
+    assert str(exc_info.value) == coroutine_step_template.format(
+        method=examples.coroutines.Simple.one
+    )
+
+
+def test_instruments():
+
+    collector = Collector()
+
+    with instrumented(collector):
+        result = run(examples.coroutines.SimpleSubstory().y.run_async(spam=3))
+
+    assert result.is_failure
+    assert [step.qualname for step in result.steps] == [
+        "SimpleSubstory.start",
+        "SimpleSubstory.before",
+        "SimpleSubstory.one",
+        "SimpleSubstory.two",
+    ]
+    assert collector.runs[0].steps == result.steps
+
+
+def test_current_step_of_concurrent_stories():
+
+    started = []
+    finished = []
+
+    class Seen(Collector):
+        def step_started(self, step):
+            started.append((step, current_step()))
+
+        def step_finished(self, step):
+            finished.append((step.parent, current_step()))
+
+    with instrumented(Seen()):
+
+        async def gather():
+            return await asyncio.gather(
+                examples.coroutines.Simple().x.acall(foo=1, bar=3),
+                examples.coroutines.Simple().x.acall(foo=1, bar=5),
+            )
+
+        run(gather())
+
+    assert len(started) == 6
+    assert all(step is current for step, current in started)
+    assert finished == [(None, None)] * 6
+    assert current_step() is None
+
+
+def test_offload_blocking_steps():
+
+    ctx = run(examples.coroutines.Threads().x.acall())
+
+    loop_thread = get_ident()
+    assert ctx.blocking[0] != loop_thread
+    assert ctx.cheap[0] == loop_thread
+    assert ctx.legacy[0] not in {loop_thread, ctx.blocking[0]}
+    assert ctx.coroutine[0] == loop_thread
+
+
+def test_inline_class_marker():
+
+    ctx = run(examples.coroutines.InlineThreads().x.acall())
+
+    loop_thread = get_ident()
+    assert ctx.blocking[0] == loop_thread
+    assert ctx.cheap[0] == loop_thread
+    assert ctx.legacy[0] != loop_thread
+    assert ctx.coroutine[0] == loop_thread
+
+
+def test_set_executor():
+    class Executor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    default, legacy = Executor(max_workers=1), Executor(max_workers=1)
+    set_executor(None, default)
+    set_executor("legacy", legacy)
+    try:
+        run(examples.coroutines.Threads().x.acall())
+        run(examples.coroutines.Threads().x.acall())
+    finally:
+        set_executor(None, None)
+        set_executor("legacy", None)
+        default.shutdown()
+        legacy.shutdown()
+
+    assert default.submitted == 4
+    assert legacy.submitted == 2
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Context could not be copied to the thread"
+)
+def test_offloaded_step_context():
+
+    with instrumented(Collector()):
+        ctx = run(examples.coroutines.Threads().x.acall())
+
+    assert ctx.blocking[1].name == "blocking"
+    assert ctx.cheap[1].name == "cheap"
+    assert ctx.legacy[1].name == "legacy"
+    assert ctx.coroutine[1].name == "coroutine"
+
+
+def test_parallel():
+
+    result = run(examples.coroutines.Gather().x.run_async())
+
+    assert result.is_failure
+    assert result.failed_on("two")
+    assert result.ctx.one == 1
+    assert result.ctx.three != get_ident()
+
+
+def test_dataflow():
+
+    result = run(examples.coroutines.Dataflow().y.acall())
+    assert result == 3
+
+
+def test_dataflow_story_cancelled():
+    async def main():
+        task = asyncio.ensure_future(obj.y.acall())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    obj = examples.coroutines.StalledDataflow()
+
+    run(main())
+
+    assert obj.cancelled
+
+
+def test_fan_out():
+
+    story = examples.coroutines.FanOut()
+    result = run(story.x.acall(items=[1, 2, 3, 4]))
+    assert result == [2, 4, 6, 8]
+    assert story.most == 2
+
+
+def test_resume():
+
+    story = examples.checkpoint.Import
+    story.load.checkpoint(SQLiteStore(":memory:"))
+    story.crash = True
+    try:
+        with pytest.raises(examples.checkpoint.ImportCrash):
+            run(story().load.run_async(rows=["1"]))
+        [run_id] = story().load.pending()
+        result = run(story().load.resume_async(run_id))
+    finally:
+        story.load.checkpoint(None)
+
+    assert result.value == 10
+    assert story().load.pending() == []
+
+
+def test_deadline_cancels_step():
+
+    obj = examples.coroutines.Deadline()
+
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceeded):
+            run(obj.x.acall())
+
+    assert repr(obj.ctx).splitlines()[:3] == [
+        "Deadline.x",
+        "  one (errored: DeadlineExceeded)",
+        "",
+    ]
+
+
+def test_deadline_story_cancelled():
+    async def main():
+        task = asyncio.ensure_future(obj.x.acall())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    obj = examples.coroutines.Deadline()
+
+    with deadline(10):
+        run(main())
+
+    assert obj.cancelled
+
+
+def test_bulkhead():
+    async def main():
+        stories = [examples.coroutines.Bulkhead().x.acall() for _ in range(3)]
+        return await asyncio.gather(*stories)
+
+    collector = Collector()
+    with instrumented(collector):
+        threads = run(main())
+
+    assert examples.coroutines.Bulkhead.most == 1
+    assert get_ident() not in threads
+
+    steps = [step for run in collector.runs for step in run.steps]
+    waited = sorted(step.waited for step in steps if step.name == "one")
+    assert waited[0] == 0.0
+    assert waited[2] > waited[1] > 0
+
+
+def test_bulkhead_shared_by_event_loops():
+    async def main():
+        stories = [examples.coroutines.Bulkhead().x.acall() for _ in range(2)]
+        return await asyncio.gather(*stories)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(run, main()) for _ in range(2)]
+        for future in futures:
+            future.result()
+
+    assert examples.coroutines.Bulkhead.most == 1
+
+
+def test_limited_substory():
+    async def main():
+        stories = [examples.coroutines.LimitedSubstory().x.acall() for _ in range(3)]
+        return await asyncio.gather(*stories)
+
+    assert run(main()) == [True, True, True]
+    assert examples.coroutines.LimitedSubstory.most == 1
+
+
+def test_hedged_step():
+
+    hedge = get_hedge(examples.coroutines.Hedged.load_profile)
+    issued, won = hedge.issued, hedge.won
+
+    story = examples.coroutines.Hedged()
+    assert run(story.x.acall(delays=[0, 0])) == 0
+    assert story.attempts == 1
+    assert (hedge.issued, hedge.won) == (issued, won)
+    assert hedge.samples[-1] < 0.02
+
+    story = examples.coroutines.Hedged()
+    assert run(story.x.acall(delays=[0.5, 0])) == 1
+    assert story.attempts == 2
+    assert (hedge.issued, hedge.won) == (issued + 1, won + 1)
+    assert hedge.samples[-1] == float("inf")
+
+    story = examples.coroutines.Hedged()
+    assert run(story.x.acall(delays=[0.03, 0.5])) == 0
+    assert story.attempts == 2
+    assert (hedge.issued, hedge.won) == (issued + 2, won + 1)
+    assert hedge.samples[-1] >= 0.03
+
+
+def test_coalesced_story():
+    async def main():
+        story = examples.coroutines.Coalesced()
+        stories = [story.x.acall(key=1) for _ in range(3)]
+        stories.append(story.x.acall(key=2))
+        stories.append(story.x.run_async(key=1))
+        stories.append(examples.coroutines.Coalesced().x.acall(key=1))
+        return await asyncio.gather(*stories)
+
+    flights = examples.coroutines.Coalesced.x.coalesce()
+    coalesced = flights.coalesced
+
+    calls = examples.coroutines.Coalesced.calls
+
+    one, two, three, four, summary, other = run(main())
+
+    assert (one, two, three, four, summary.value, other) == (2, 2, 2, 4, 2, 2)
+    assert examples.coroutines.Coalesced.calls - calls == 4
+    assert flights.coalesced - coalesced == 2
+    assert not flights.running
+
+
+def test_coalesced_story_cancelled():
+    async def main():
+        story = examples.coroutines.Coalesced()
+        first = asyncio.ensure_future(story.x.acall(key=3))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(story.x.acall(key=3))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert run(main()) == 6
+
+
+def test_batched_loading():
+    async def main(*category_ids):
+        stories = [
+            examples.coroutines.Loaded().x.acall(category_id=category_id)
+            for category_id in category_ids
+        ]
+        return await asyncio.gather(*stories)
+
+    def batches():
+        # Stories of the gather are started in arbitrary order on
+        # Python 3.6, so keys of the batch are too.
+        return [sorted(batch) for batch in examples.coroutines.batches]
+
+    del examples.coroutines.batches[:]
+    result = run(main(1, 2, 2, 3))
+    assert result == [(10, 11), (20, 21), (20, 21), (30, 31)]
+    assert batches() == [[1, 2, 3], [10, 20, 30]]
+
+    del examples.coroutines.batches[:]
+    run(main(1))
+    run(main(1))
+    assert batches() == [[1], [10], [1], [10]]
+
+    async def scoped():
+        with scope():
+            await main(1, 2)
+            return await main(2, 3)
+
+    del examples.coroutines.batches[:]
+    assert run(scoped()) == [(20, 21), (30, 31)]
+    assert batches() == [[1, 2], [10, 20], [3], [30]]
+
+    del examples.coroutines.batches[:]
+    assert run(examples.coroutines.LoadedTwice().x.acall(category_id=4)) == (40, 40)
+    assert batches() == [[4]]
+
+
+def test_batched_loading_waiters():
+    async def fetch(keys):
+        await asyncio.sleep(0.01)
+        return keys
+
+    loader = Loader(fetch)
+
+    async def main():
+        first = loader.load(1)
+        second = loader.load(1)
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert run(main()) == 1
+
+
+def test_batched_loading_failures_are_not_cached():
+    batches = []
+
+    async def fetch(keys):
+        batches.append(keys)
+        if len(batches) == 1:
+            raise examples.coroutines.StepError()
+        return keys
+
+    loader = Loader(fetch)
+
+    async def main():
+        with scope():
+            with pytest.raises(examples.coroutines.StepError):
+                await loader.load(1)
+            return await loader.load(1)
+
+    assert run(main()) == 1
+    assert batches == [[1], [1]]
+
+
+def test_batched_loading_error():
+    async def main():
+        stories = [
+            examples.coroutines.Loaded().x.run_async(category_id=category_id)
+            for category_id in (0, 1)
+        ]
+        return await asyncio.gather(*stories, return_exceptions=True)
+
+    first, second = run(main())
+    assert isinstance(first, examples.coroutines.StepError)
+    assert second is first
+
+
+def test_deferred_effects():
+
+    events = []
+
+    async def effect(message, user_id):
+        await asyncio.sleep(0)
+        events.append((message, user_id))
+
+    del examples.effects.Subscribe.sent[:]
+    obj = examples.effects.Subscribe()
+    obj.log = effect
+
+    assert run(obj.x.acall(user_id=1)) == 10
+    assert examples.effects.Subscribe.sent == [[1, 2]]
+    assert events == [("subscribed", 1)]
+
+
+def test_deferred_effects_of_fan_out():
+
+    del examples.effects.Subscribe.sent[:]
+    del examples.effects.Subscribe.logged[:]
+
+    result = run(examples.effects.Campaign().y.run_async(user_ids=[1], approved=False))
+    assert result.failed_because("rejected")
+    assert examples.effects.Subscribe.sent == []
+
+    result = run(examples.effects.Campaign().y.acall(user_ids=[1, 3], approved=True))
+    assert result == [True, True]
+    assert examples.effects.Subscribe.sent == [[1, 2, 3, 4]]
+
+
+def test_task_factory_kept():
+
+    created = []
+
+    def factory(loop, coro):
+        task = asyncio.Task(coro, loop=loop)
+        created.append(task)
+        return task
+
+    async def request(foo):
+        return await examples.coroutines.Simple().x.run_async(foo=foo, bar=3)
+
+    async def main():
+        collector = Collector()
+        add_instruments(collector)
+        await asyncio.gather(request(1), request(2))
+        return collector
+
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(factory)
+    try:
+        collector = loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert len(created) == 3
+    assert len(collector.runs) == 2
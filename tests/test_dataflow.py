@@ -0,0 +1,201 @@
+import pytest
+
+import examples
+from _stories.dataflow import get_instructions
+from _stories.marker import Dataflow
+from stories import Success
+from stories.dataflow import reads
+from stories.dataflow import verify
+from stories.exceptions import ContextContractError
+from stories.exceptions import StoryDefinitionError
+from stories.instrument import Collector
+from stories.instrument import instrumented
+
+
+inference = pytest.mark.skipif(
+    get_instructions is None, reason="Bytecode could not be inspected"
+)
+
+
+def test_independent_steps_run_concurrently():
+
+    pytest.importorskip("concurrent.futures")
+
+    classes = [examples.dataflow.Checkout]
+    if get_instructions is not None:
+        classes.append(examples.dataflow.InferredCheckout)
+
+    for cls in classes:
+        rendezvous = examples.parallel.Rendezvous(2)
+        result = cls(rendezvous).buy.run(user_id=1)
+        assert result.is_success
+        assert result.value == (200, 11)
+
+
+def test_steps_wait_for_their_inputs():
+
+    collector = Collector()
+
+    with instrumented(collector):
+        examples.dataflow.Checkout().buy(user_id=1)
+
+    steps = {step.name: step for step in collector.runs[0].steps}
+    assert steps["find_price"].started >= (
+        steps["find_category"].started + steps["find_category"].duration
+    )
+    assert steps["find_profile"].started >= (
+        steps["find_user"].started + steps["find_user"].duration
+    )
+
+
+@inference
+def test_inferred_reads():
+
+    methods = examples.dataflow.InferredCheckout().buy.methods
+    dataflow = methods[1][0]
+    assert type(dataflow) is Dataflow
+    assert dataflow.reads == [
+        ("user_id",),
+        ("user_id",),
+        ("category",),
+        ("user",),
+        ("price", "profile"),
+    ]
+
+    methods = examples.dataflow.Escape().buy.methods
+    assert [type(method) for method, _contract, _protocol in methods][1:-1] == [
+        Dataflow,
+        type(examples.dataflow.Escape().find_profile),
+        type(examples.dataflow.Escape().checkout),
+    ]
+    assert examples.dataflow.Escape().buy(user_id=1) == (200, 11)
+
+
+def test_linear_plan_without_declarations():
+
+    methods = examples.methods.Simple().x.methods
+    assert all(type(method) is not Dataflow for method, _c, _p in methods)
+
+
+def test_representation():
+
+    expected = """
+Checkout.buy
+  find_user
+  find_category
+  find_price
+  find_profile
+  checkout
+""".strip()
+    assert repr(examples.dataflow.Checkout().buy) == expected
+
+
+def test_failure_in_declaration_order():
+
+    result = examples.dataflow.Outcomes().x.run(first="failure", second="failure")
+    assert result.is_failure
+    assert result.failed_on("one")
+    assert result.failed_because("foo")
+
+    result = examples.dataflow.Outcomes().x.run(first="success", second="failure")
+    assert result.failed_on("two")
+    assert result.failed_because("bar")
+    assert result.ctx.foo == 1
+
+    with pytest.raises(examples.dataflow.StepError) as exc_info:
+        examples.dataflow.Outcomes().x(first="error", second="failure")
+    assert exc_info.value.args == ("foo",)
+
+    result = examples.dataflow.Outcomes().x.run(first="failure", second="error")
+    assert result.failed_on("one")
+
+    result = examples.dataflow.Outcomes().x(first="success", second="success")
+    assert result == (1, 2)
+
+
+@pytest.mark.parametrize("first", ["success", "failure", "skip"])
+@pytest.mark.parametrize("second", ["success", "failure", "skip"])
+def test_same_outcome_as_sequential_steps(first, second):
+
+    dataflow = examples.dataflow.Outcomes().x.run(first=first, second=second)
+    sequential = examples.dataflow.SequentialOutcomes().x.run(
+        first=first, second=second
+    )
+    assert type(examples.dataflow.Outcomes().x.methods[1][0]) is Dataflow
+    assert type(examples.dataflow.SequentialOutcomes().x.methods[1][0]) is not Dataflow
+
+    assert dataflow.is_success is sequential.is_success
+    if dataflow.is_success:
+        assert dataflow.value == sequential.value
+        return
+    assert dataflow.failed_on("one") is sequential.failed_on("one")
+    assert dataflow.failed_on("two") is sequential.failed_on("two")
+    assert variables(dataflow.ctx) == variables(sequential.ctx)
+    assert history(dataflow.ctx) == history(sequential.ctx)
+
+
+def variables(ctx):
+    return {name: getattr(ctx, name) for name in ("foo", "bar") if name in dir(ctx)}
+
+
+def history(ctx):
+    return repr(ctx).split("\n\n")[0].splitlines()[1:]
+
+
+def test_history():
+
+    result = examples.dataflow.Outcomes().x.run(first="success", second="failure")
+    history = repr(result.ctx).split("\n\n")[0]
+    assert (
+        history
+        == """
+Outcomes.x
+  one
+  two (failed: 'bar')
+""".strip()
+    )
+
+
+def test_wrong_read_order():
+
+    with pytest.raises(AttributeError):
+        examples.dataflow.WrongOrder().x()
+
+
+@inference
+def test_verify():
+
+    verify(examples.dataflow.Checkout().buy)
+    verify(examples.dataflow.InferredCheckout().buy)
+    verify(examples.dataflow.Outcomes().x)
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        verify(examples.dataflow.Undeclared().buy)
+    assert str(exc_info.value) == (
+        "Step reads variables which are not declared: 'category'\n\n"
+        "Story method: Undeclared.find_profile"
+    )
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        verify(examples.dataflow.Escape().buy)
+    assert str(exc_info.value) == (
+        "Context usage can not be verified: Escape.find_profile\n\n"
+        "Use context variables as 'ctx.foo' attribute access only."
+    )
+
+
+def test_reads_definition_error():
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        reads("foo", 1)
+    assert str(exc_info.value) == "Step reads can only be defined with string type"
+
+
+def test_contract_error_at_join():
+    class Conflict(examples.dataflow.Checkout):
+        @reads("user_id")
+        def find_category(self, ctx):
+            return Success(user=1)
+
+    with pytest.raises(ContextContractError):
+        Conflict().buy(user_id=1)
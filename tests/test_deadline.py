@@ -0,0 +1,59 @@
+import pytest
+
+import examples
+from stories.deadline import deadline
+from stories.deadline import remaining
+from stories.exceptions import DeadlineExceeded
+
+
+def test_no_deadline():
+
+    assert remaining() is None
+    assert examples.deadline.Slow().x(delay=0) == (None, None)
+
+
+def test_remaining_time():
+
+    with deadline(10):
+        left, nested = examples.deadline.Slow().x(delay=0)
+        assert 0 < nested <= left <= 10
+
+    assert remaining() is None
+
+
+def test_nested_deadline_is_shorter():
+
+    with deadline(1):
+        with deadline(10):
+            assert remaining() <= 1
+        with deadline(0.5):
+            assert remaining() <= 0.5
+        assert 0.5 < remaining() <= 1
+
+
+def test_deadline_exceeded():
+
+    obj = examples.deadline.Slow()
+
+    with deadline(0.01):
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            obj.x.run(delay=0.02)
+
+    assert str(exc_info.value) == "Deadline exceeded on the story step: y"
+    assert repr(obj.ctx).splitlines()[:4] == [
+        "Slow.x",
+        "  one",
+        "  y (errored: DeadlineExceeded)",
+        "",
+    ]
+
+
+def test_expired_deadline():
+
+    obj = examples.deadline.Slow()
+
+    with deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            obj.x(delay=0)
+
+    assert not hasattr(obj, "ctx")
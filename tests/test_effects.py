@@ -0,0 +1,108 @@
+import pytest
+
+import examples
+from stories import Success
+
+
+def setup_function(function):
+    del examples.effects.Subscribe.sent[:]
+    del examples.effects.Subscribe.logged[:]
+
+
+def test_defer_returns_success():
+    def effect(arg):
+        pass
+
+    result = Success(foo=1)
+    assert result.defer(effect, 1).defer(effect, 2) is result
+    assert result.effects == ((effect, (1,)), (effect, (2,)))
+    assert Success().effects == ()
+
+
+def test_effects_flushed_when_story_finished():
+
+    assert examples.effects.Subscribe().x(user_id=1) == 10
+    assert examples.effects.Subscribe.sent == [[1, 2]]
+    assert examples.effects.Subscribe.logged == [("subscribed", 1)]
+
+
+def test_effects_dropped_on_failure():
+
+    result = examples.effects.Subscribe().x.run(user_id=-1)
+    assert result.failed_because("banned")
+    assert examples.effects.Subscribe.sent == []
+    assert examples.effects.Subscribe.logged == []
+
+
+def test_effects_dropped_on_error():
+
+    with pytest.raises(examples.effects.SubscriptionError):
+        examples.effects.Subscribe().x(user_id=0)
+    assert examples.effects.Subscribe.sent == []
+
+
+def test_effects_are_hidden_from_context():
+
+    result = examples.effects.Subscribe().x.run(user_id=-1)
+    assert "_Context__effects" not in dir(result.ctx)
+
+
+def test_effects_of_parallel_steps():
+
+    assert examples.effects.Welcome().x(user_id=1) == 10
+    assert examples.effects.Subscribe.logged == [
+        ("email", 1),
+        ("sms", 1),
+        ("subscribed", 1),
+    ]
+
+
+def test_effects_of_fan_out_items():
+
+    # Effects of items are made by the parent story.  Effects of failed
+    # items are dropped.
+
+    obj = examples.effects.Campaign()
+    assert obj.y(user_ids=[1, -1, 3], approved=True) == [True, False, True]
+    assert examples.effects.Subscribe.sent == [[1, 2, 3, 4]]
+    assert examples.effects.Subscribe.logged == [
+        ("subscribed", 1),
+        ("subscribed", 3),
+    ]
+
+
+def test_effects_of_fan_out_dropped_on_parent_failure():
+
+    result = examples.effects.Campaign().y.run(user_ids=[1, 3], approved=False)
+    assert result.failed_because("rejected")
+    assert examples.effects.Subscribe.sent == []
+    assert examples.effects.Subscribe.logged == []
+
+
+def test_batch_error_drops_all_effects():
+
+    # Error of one run is raised by run_many.  Effects of other runs
+    # are dropped together with their summaries.
+
+    obj = examples.effects.Subscribe()
+    kwargs_list = [{"user_id": user_id} for user_id in (1, 0, 3)]
+
+    with pytest.raises(examples.effects.SubscriptionError):
+        obj.x.run_many(kwargs_list)
+
+    assert examples.effects.Subscribe.sent == []
+    assert examples.effects.Subscribe.logged == []
+
+
+def test_effects_grouped_across_batch():
+
+    obj = examples.effects.Subscribe()
+    kwargs_list = [{"user_id": user_id} for user_id in (1, -1, 3)]
+    results = obj.x.run_many(kwargs_list)
+
+    assert [result.is_success for result in results] == [True, False, True]
+    assert examples.effects.Subscribe.sent == [[1, 2, 3, 4]]
+    assert examples.effects.Subscribe.logged == [
+        ("subscribed", 1),
+        ("subscribed", 3),
+    ]
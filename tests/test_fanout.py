@@ -0,0 +1,166 @@
+import pytest
+
+import examples
+from _stories.compat import get_ident
+from _stories.executors import set_executor
+from stories import fan_out
+from stories import story
+from stories.exceptions import StoryDefinitionError
+from stories.instrument import Collector
+from stories.instrument import instrumented
+
+
+def test_fan_out_results():
+
+    result = examples.fanout.Orders().checkout(order_id=7, items=[1, 3, 4])
+    assert result == [(7, 1), (7, 3), (7, 4)]
+
+    result = examples.fanout.Orders().checkout.run(order_id=7, items=[1, -1, 3])
+    assert result.failed_because("no_stock")
+    reservations = result.ctx.reservations
+    assert [reservation.is_success for reservation in reservations] == [
+        True,
+        False,
+        True,
+    ]
+    assert reservations[1].failed_on("check_stock")
+    assert reservations[1].failed_because("no_stock")
+    assert reservations[2].value == (7, 3)
+
+    result = examples.fanout.Orders().checkout(order_id=7, items=[])
+    assert result == []
+
+
+def test_fan_out_bounded_concurrency():
+
+    pytest.importorskip("concurrent.futures")
+
+    orders = examples.fanout.Orders()
+    result = orders.checkout.run(order_id=7, items=[1, 2, 3, 4, 5, 6])
+    assert result.is_success
+    assert orders.most == 2
+
+    orders = examples.fanout.Sequential()
+    result = orders.checkout.run(order_id=7, items=[1, 2, 3])
+    assert result.is_success
+    assert orders.most == 1
+    assert orders.threads == {get_ident()}
+
+
+def test_nested_fan_out():
+    """Nested fan-outs and parallel groups could share a small executor.
+
+    Outer items wait for the inner work queued behind them in the same
+    executor.  The waiting thread runs it itself.
+    """
+    futures = pytest.importorskip("concurrent.futures")
+
+    orders = [[1, 2, 3], [4], [5, 6], [7, 8, 9], [10]]
+    executor = futures.ThreadPoolExecutor(2)
+    set_executor(None, executor)
+    try:
+        result = examples.fanout.Shipments().ship(orders=orders)
+    finally:
+        set_executor(None, None)
+        executor.shutdown()
+    assert result == [
+        ([10, 20, 30], 3, "#1"),
+        ([40], 1, "#4"),
+        ([50, 60], 2, "#5"),
+        ([70, 80, 90], 3, "#7"),
+        ([100], 1, "#10"),
+    ]
+
+
+def test_fan_out_error():
+
+    with pytest.raises(examples.fanout.StockError):
+        examples.fanout.Orders().checkout(order_id=7, items=[1, 0, 3])
+
+
+def test_fan_out_history():
+
+    result = examples.fanout.Orders().checkout.run(order_id=7, items=[1, -1])
+    history = repr(result.ctx).split("\n\n")[0]
+    assert (
+        history
+        == """
+Orders.checkout
+  start
+  reserve
+    Orders.reserve (item 0)
+      check_stock
+      hold (returned: (7, 1))
+    Orders.reserve (item 1)
+      check_stock (failed: 'no_stock')
+  finish (failed: 'no_stock')
+""".strip()
+    )
+
+
+def test_fan_out_instruments():
+
+    collector = Collector()
+
+    with instrumented(collector):
+        examples.fanout.Orders().checkout(order_id=7, items=[1, 2])
+
+    assert len(collector.runs) == 3
+    parent = [step for step in collector.runs[0].steps if step.name == "reserve"]
+    assert len(parent) == 1
+    for run in collector.runs[1:]:
+        assert all(step.parent is parent[0] for step in run.steps)
+
+
+def test_fan_out_representation():
+
+    expected = """
+Orders.checkout
+  start
+  reserve (fan-out)
+    check_stock
+    hold
+  finish
+""".strip()
+    assert repr(examples.fanout.Orders().checkout) == expected
+    assert repr(examples.fanout.Orders.checkout) == expected
+
+
+def test_fan_out_definition_errors():
+
+    expected = (
+        "Fan-out can only map the story step over the context variable.\n\n"
+        'Use \'fan_out(I.foo, over="items", item="item", into="results")\' in the\n'
+        "story definition."
+    )
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Wrong(object):
+            @story
+            def x(I):
+                fan_out("foo", over="items", item="item", into="results")
+
+    assert str(exc_info.value) == expected
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Limit(object):
+            @story
+            def x(I):
+                fan_out(I.y, over="items", item="item", into="results", limit=0)
+
+    assert str(exc_info.value) == "Fan-out limit should be a positive integer"
+
+    class NotStory(examples.fanout.Orders):
+        @story
+        def x(I):
+            fan_out(I.start, over="items", item="item", into="results")
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        NotStory().x
+
+    assert str(exc_info.value) == (
+        "Fan-out step should be a story with 'item' argument: start\n\n"
+        "Story method: NotStory.x"
+    )
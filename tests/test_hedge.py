@@ -0,0 +1,76 @@
+import pytest
+
+from stories import Result
+from stories import story
+from stories.exceptions import StoryDefinitionError
+from stories.hedge import get_hedge
+from stories.hedge import hedge
+
+
+def test_percentile_delay():
+    @hedge(delay=1, percentile=90)
+    def f(self, ctx):
+        pass
+
+    limit = get_hedge(f)
+    assert limit.get_delay() == 1
+
+    for duration in range(20):
+        limit.observe(duration / 100.0)
+    assert limit.get_delay() == 0.18
+
+
+def test_percentile_delay_of_primary_calls():
+
+    # One call of five is slow.  Hedged calls are fast, so the delay
+    # taken from the whole call would stay with fast calls and every
+    # slow call would be hedged.
+
+    @hedge(delay=0.05, percentile=90)
+    def f(self, ctx):
+        pass
+
+    limit = get_hedge(f)
+    delays = []
+    for call in range(200):
+        delay = limit.get_delay()
+        delays.append(delay)
+        primary = 1.0 if call % 5 == 0 else 0.01
+        hedged = 1.0 if call % 25 == 10 else 0.01
+        if primary <= delay or delay + hedged >= primary:
+            limit.observe(primary)
+        else:
+            limit.outrun()
+    assert set(delays[100:]) == {1.0}
+
+
+def test_regular_story_calls_once():
+    class T(object):
+        @story
+        def x(I):
+            I.one
+
+        calls = 0
+
+        @hedge(delay=0)
+        def one(self, ctx):
+            T.calls += 1
+            return Result(T.calls)
+
+    assert T().x() == 1
+    assert get_hedge(T.one).issued == 0
+
+
+def test_wrong_hedge():
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        hedge()
+    assert str(exc_info.value) == "Hedge should be defined with delay or percentile"
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        hedge(delay=-1)
+    assert str(exc_info.value) == "Hedge delay should be a non-negative number"
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        hedge(percentile=100)
+    assert str(exc_info.value) == "Hedge percentile should be between 0 and 100"
@@ -0,0 +1,183 @@
+import threading
+
+import pytest
+
+import examples
+from stories.instrument import add_instruments
+from stories.instrument import Collector
+from stories.instrument import current_step
+from stories.instrument import install_instruments
+from stories.instrument import Instrument
+from stories.instrument import instrumented
+from stories.instrument import remove_instruments
+from stories.instrument import uninstall_instruments
+
+
+class Recorder(Instrument):
+    def __init__(self):
+        self.events = []
+
+    def step_started(self, step):
+        self.events.append(("started", step.path, step.qualname))
+        assert current_step() is step
+
+    def step_finished(self, step):
+        self.events.append(("finished", step.qualname, step.duration >= 0))
+
+
+def test_step_events():
+
+    recorder = Recorder()
+    with instrumented(recorder):
+        examples.methods.SimpleSubstory().y.run(spam=2)
+
+    assert recorder.events == [
+        ("started", ("SimpleSubstory.y",), "SimpleSubstory.start"),
+        ("finished", "SimpleSubstory.start", True),
+        ("started", ("SimpleSubstory.y",), "SimpleSubstory.before"),
+        ("finished", "SimpleSubstory.before", True),
+        ("started", ("SimpleSubstory.y", "SimpleSubstory.x"), "SimpleSubstory.one"),
+        ("finished", "SimpleSubstory.one", True),
+        ("started", ("SimpleSubstory.y", "SimpleSubstory.x"), "SimpleSubstory.two"),
+        ("finished", "SimpleSubstory.two", True),
+        ("started", ("SimpleSubstory.y", "SimpleSubstory.x"), "SimpleSubstory.three"),
+        ("finished", "SimpleSubstory.three", True),
+    ]
+    assert current_step() is None
+
+
+def test_step_events_skip():
+
+    recorder = Recorder()
+    with instrumented(recorder):
+        examples.methods.Pipe().y.run()
+
+    assert [event[1:] for event in recorder.events if event[0] == "started"] == [
+        (("Pipe.y",), "Pipe.before")
+    ]
+
+
+def test_step_events_error():
+
+    steps = []
+
+    class Collector(Instrument):
+        def step_finished(self, step):
+            steps.append(step)
+
+    with instrumented(Collector()):
+        with pytest.raises(examples.batch.DiscountError):
+            examples.batch.Billing().charge(customer_id=0)
+
+    step = steps[-1]
+    assert step.result is None
+    assert type(step.error) is examples.batch.DiscountError
+    assert repr(step) == (
+        "Step(Billing.charge -> Billing.check_discount -> Billing.apply_discount)"
+    )
+
+
+def test_instrumented_scope():
+
+    recorder = Recorder()
+    with instrumented(recorder):
+        pass
+    examples.methods.Simple().x(foo=1, bar=3)
+    assert recorder.events == []
+
+
+def test_collector():
+
+    collector = Collector()
+    with instrumented(collector):
+        examples.methods.Simple().x.run(foo=1, bar=3)
+        examples.methods.Simple().x.run(foo=2, bar=3)
+
+    first, second = collector.runs
+    assert first.run_id < second.run_id
+    assert first.ctx.baz == 4
+    assert [step.name for step in first.steps] == ["one", "two", "three"]
+    assert [step.name for step in second.steps] == ["one", "two"]
+
+
+def test_collectors_are_thread_local():
+
+    ready = [threading.Event() for _ in range(4)]
+    start = threading.Event()
+    collectors = {}
+
+    def request(number):
+        collector = Collector()
+        collectors[number] = collector
+        add_instruments(collector)
+        try:
+            ready[number - 1].set()
+            start.wait()
+            for _ in range(number):
+                examples.methods.Simple().x.run(foo=1, bar=3)
+        finally:
+            remove_instruments(collector)
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(1, 5)]
+    for thread in threads:
+        thread.start()
+    for event in ready:
+        event.wait()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert {i: len(c.runs) for i, c in collectors.items()} == {1: 1, 2: 2, 3: 3, 4: 4}
+
+
+def test_remove_instruments_order():
+
+    first, second = Collector(), Collector()
+    add_instruments(first)
+    add_instruments(second)
+    remove_instruments(first)
+    examples.methods.Simple().x.run(foo=1, bar=3)
+    remove_instruments(second)
+    examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert len(first.runs) == 0
+    assert len(second.runs) == 1
+
+
+def test_install_instruments():
+
+    collector = Collector()
+    install_instruments(collector)
+    try:
+        thread = threading.Thread(
+            target=lambda: examples.methods.Simple().x.run(foo=1, bar=3)
+        )
+        thread.start()
+        thread.join()
+    finally:
+        uninstall_instruments(collector)
+    examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert len(collector.runs) == 1
+
+
+def test_instruments_without_steps():
+    class Runs(Recorder):
+        observe_steps = False
+
+        def story_started(self, run):
+            self.events.append(("story", run.ctx.foo))
+
+    runs = Runs()
+    with instrumented(runs):
+        result = examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert runs.events == [("story", 1)]
+    assert result.steps == ()
+
+    recorder = Recorder()
+    with instrumented(runs, recorder):
+        result = examples.methods.Simple().x.run(foo=1, bar=3)
+
+    assert runs.events == [("story", 1), ("story", 1)]
+    assert len(result.steps) == len(recorder.events) // 2 > 0
@@ -0,0 +1,144 @@
+import pytest
+
+import examples
+from stories.jobs import Queue
+from stories.worker import drain
+from stories.worker import main
+
+
+@pytest.fixture()
+def database(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobs.sqlite3")
+    monkeypatch.setenv("STORIES_QUEUE", path)
+    examples.jobs.Notify.attempts.clear()
+    return path
+
+
+def test_enqueue_and_drain(database):
+
+    obj = examples.jobs.Notify()
+    ok = obj.send.enqueue(user=1, message="hello")
+    failed = obj.send.enqueue(user=-1, message="hello")
+
+    queue = Queue(database)
+    job = queue.get(ok)
+    assert job.story == "examples.jobs:Notify.send"
+    assert job.kwargs == {"user": 1, "message": "hello"}
+    assert job.state == "queued"
+
+    assert drain(queue, obj.send, workers=2, once=True) == 2
+
+    job = queue.get(ok)
+    assert job.state == "success"
+    assert job.attempts == 1
+    assert job.summary.value == "HELLO"
+
+    job = queue.get(failed)
+    assert job.state == "failure"
+    assert job.summary.failed_on("find_user")
+    assert job.summary.ctx.user == -1
+
+
+def test_retries(database):
+
+    obj = examples.jobs.Notify()
+    flaky = obj.send.enqueue(user=1, message="flaky")
+    broken = obj.send.enqueue(user=2, message="broken")
+
+    queue = Queue(database)
+    drain(queue, obj.send, retries=2, once=True, backoff=0)
+
+    job = queue.get(flaky)
+    assert job.state == "success"
+    assert job.attempts == 3
+
+    job = queue.get(broken)
+    assert job.state == "error"
+    assert job.attempts == 3
+    assert "DeliveryError" in job.error
+
+
+def test_retry_backoff(database):
+
+    obj = examples.jobs.Notify()
+    job_id = obj.send.enqueue(user=1, message="flaky")
+
+    # Failed job is not visible until the backoff delay passed.
+
+    queue = Queue(database)
+    assert drain(queue, obj.send, once=True, backoff=60) == 1
+    assert drain(queue, obj.send, once=True, backoff=60) == 0
+
+    job = queue.get(job_id)
+    assert job.state == "queued"
+    assert job.attempts == 1
+
+
+def test_visibility_timeout(database):
+
+    obj = examples.jobs.Notify()
+    job_id = obj.send.enqueue(user=1, message="hello")
+
+    # Worker died after the claim.
+
+    queue = Queue(database)
+    [job] = queue.claim("examples.jobs:Notify.send", 10, 0, 0)
+    assert job.attempts == 1
+
+    # The job is visible again after the timeout but has no attempts
+    # left.
+
+    assert drain(queue, obj.send, retries=0, once=True) == 0
+    job = queue.get(job_id)
+    assert job.state == "error"
+    assert job.error == "Visibility timeout expired on the last attempt"
+
+    job_id = obj.send.enqueue(user=1, message="hello")
+    queue.claim("examples.jobs:Notify.send", 10, 60, 1)
+    assert drain(queue, obj.send, retries=1, once=True) == 0
+    assert queue.get(job_id).state == "queued"
+
+
+def test_lost_claim(database):
+
+    obj = examples.jobs.Notify()
+    job_id = obj.send.enqueue(user=1, message="hello")
+
+    # The timeout expired while the job was waiting in the batch and
+    # other worker claimed it.
+
+    queue = Queue(database)
+    [lost] = queue.claim("examples.jobs:Notify.send", 10, 0, 1)
+    [job] = queue.claim("examples.jobs:Notify.send", 10, 60, 1)
+
+    assert not queue.extend(lost, 60)
+    assert queue.extend(job, 60)
+
+    lost.state = "error"
+    queue.finish([lost])
+    assert queue.get(job_id).state == "queued"
+
+
+def test_batched_commits(database):
+
+    obj = examples.jobs.Notify()
+    for user in range(5):
+        obj.send.enqueue(user=user, message="hi")
+
+    queue = Queue(database)
+    assert drain(queue, obj.send, workers=2, batch=2, once=True) == 5
+    assert queue.count("success") == 5
+
+
+def test_cli(database, capsys):
+
+    examples.jobs.Notify().send.enqueue(user=1, message="hello")
+
+    main(["examples.jobs:Notify.send", "--once", "--workers", "2"])
+
+    assert Queue(database).count("success") == 1
+
+    with pytest.raises(SystemExit):
+        main(["examples.jobs:Notify.missing", "--once"])
+
+    assert "is not a story of the class" in capsys.readouterr().err
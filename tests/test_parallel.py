@@ -0,0 +1,161 @@
+import pytest
+
+import examples
+from stories import parallel
+from stories import story
+from stories.exceptions import ContextContractError
+from stories.exceptions import StoryDefinitionError
+from stories.instrument import Collector
+from stories.instrument import instrumented
+
+
+def test_parallel_steps_run_concurrently():
+
+    pytest.importorskip("concurrent.futures")
+
+    rendezvous = examples.parallel.Rendezvous(3)
+    category, price, profile = examples.parallel.Subscription(rendezvous).buy(user_id=1)
+
+    assert category[0] == price[0] == profile[0] == 10
+    assert category[2]
+    assert price[2]
+    assert profile[2]
+    assert len({category[1], price[1], profile[1]}) == 3
+
+
+def test_parallel_success_merged():
+
+    result = examples.parallel.Outcomes().x.run(first="success", second="success")
+    assert result.is_success
+    assert result.value == (2, 3)
+
+    with pytest.raises(ContextContractError):
+        examples.parallel.Outcomes().x(first="success", second="conflict")
+
+
+def test_parallel_failure_in_declaration_order():
+
+    result = examples.parallel.Outcomes().x.run(first="failure", second="failure")
+    assert result.is_failure
+    assert result.failed_on("two")
+    assert result.failed_because("foo")
+
+    result = examples.parallel.Outcomes().x.run(first="success", second="failure")
+    assert result.failed_on("three")
+    assert result.failed_because("bar")
+    assert result.ctx.foo == 2
+
+    with pytest.raises(examples.parallel.StepError) as exc_info:
+        examples.parallel.Outcomes().x(first="error", second="error")
+    assert exc_info.value.args == ("foo",)
+
+    with pytest.raises(examples.parallel.StepError) as exc_info:
+        examples.parallel.Outcomes().x(first="failure", second="error")
+    assert exc_info.value.args == ("bar",)
+
+    with pytest.raises(examples.parallel.StepError) as exc_info:
+        examples.parallel.Outcomes().x(first="result", second="error")
+    assert exc_info.value.args == ("bar",)
+
+
+def test_parallel_result_and_skip():
+
+    result = examples.parallel.Outcomes().x(first="result", second="failure")
+    assert result == 2
+
+    result = examples.parallel.Outcomes().x(first="success", second="result")
+    assert result == 3
+
+    result = examples.parallel.Outcomes().y(first="skip", second="result")
+    assert result == "five"
+
+
+def test_parallel_history():
+
+    result = examples.parallel.Outcomes().x.run(first="success", second="failure")
+    history = repr(result.ctx).split("\n\n")[0]
+    assert (
+        history
+        == """
+Outcomes.x
+  one
+  two
+  three (failed: 'bar')
+""".strip()
+    )
+
+
+def test_parallel_instruments():
+
+    collector = Collector()
+
+    with instrumented(collector):
+        examples.parallel.Outcomes().x(first="success", second="success")
+
+    steps = collector.runs[0].steps
+    assert sorted(step.name for step in steps) == ["four", "one", "three", "two"]
+    assert all(step.parent is None for step in steps)
+    assert all(step.path == ("Outcomes.x",) for step in steps)
+
+
+def test_parallel_representation():
+
+    expected = """
+Subscription.buy
+  find_user
+  parallel
+    find_category
+    find_price
+    find_profile
+  checkout
+""".strip()
+
+    assert repr(examples.parallel.Subscription().buy) == expected
+    assert repr(examples.parallel.Subscription.buy) == expected
+
+
+def test_parallel_definition_errors():
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Empty(object):
+            @story
+            def x(I):
+                parallel()
+
+    assert str(exc_info.value) == "Parallel group can not be empty"
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Wrong(object):
+            @story
+            def x(I):
+                parallel(I.one, "two")
+
+    assert str(exc_info.value) == (
+        "Parallel group can only contain story steps.\n\n"
+        "Use 'parallel(I.foo, I.bar)' in the story definition."
+    )
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+
+        class Repeated(object):
+            @story
+            def x(I):
+                parallel(I.one, I.one)
+
+    assert str(exc_info.value) == (
+        "Parallel group can not contain the same step twice: one, one"
+    )
+
+    class Substory(examples.parallel.Outcomes):
+        @story
+        def z(I):
+            parallel(I.one, I.x)
+
+    with pytest.raises(StoryDefinitionError) as exc_info:
+        Substory().z
+
+    assert str(exc_info.value) == (
+        "Story can not be used in the parallel group: x\n\n" "Story method: Substory.z"
+    )
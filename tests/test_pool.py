@@ -0,0 +1,182 @@
+import enum
+import pickle
+
+import pytest
+
+import examples
+from _stories import shared
+from _stories.compat import InterpreterPoolExecutor
+from _stories.compat import SharedMemory
+from stories import Failure
+from stories import story
+from stories.exceptions import FailureProtocolError
+from stories.exceptions import MutationError
+from stories.pool import InterpreterPool
+from stories.pool import ProcessPool
+
+
+def test_run_many():
+
+    kwargs = [{"customer_id": customer_id} for customer_id in [1, -1, 2, 3]]
+
+    with ProcessPool(examples.batch.Billing, "charge", workers=2) as pool:
+        results = pool.run_many(kwargs, chunksize=3)
+
+    assert results[0].value == 10
+    assert results[1].failed_because("unknown")
+    assert results[2].value == 19
+    assert results[3].value == "free"
+
+    # Detached summaries keep the context representation.
+
+    assert repr(results[1].ctx) == repr(
+        examples.batch.Billing().charge.run(customer_id=-1).ctx
+    )
+
+
+def test_imap():
+
+    kwargs = [{"number": number, "delay": 0} for number in [3, -1, 1]]
+
+    with ProcessPool(examples.stream.Parse, "document", workers=2) as pool:
+        results = list(pool.imap(iter(kwargs)))
+
+    assert results[0].value == 3
+    assert results[1].failed_on("wait")
+    assert results[2].value == 1
+
+
+def test_interpreter_pool():
+
+    kwargs = [{"number": number, "delay": 0} for number in [3, -1, 1]]
+
+    with InterpreterPool(examples.stream.Parse, "document", workers=2) as pool:
+        results = pool.run_many(kwargs) + list(pool.imap(kwargs))
+
+    assert [result.is_success for result in results] == [True, False, True] * 2
+    assert results[4].failed_on("wait")
+
+    if InterpreterPoolExecutor is None:
+        assert pool.engine == "processes"
+        assert pool.shared == (None if SharedMemory is None else 1024 * 1024)
+    else:
+        assert pool.engine == "interpreters"
+        assert pool.shared is None
+
+
+@pytest.mark.skipif(SharedMemory is None, reason="Shared memory is not available")
+def test_shared_buffers():
+
+    kwargs = [{"data": bytearray(b"x" * size)} for size in [10, 2048]]
+
+    with ProcessPool(examples.pool.Measure, "size", shared=1024) as pool:
+        results = pool.run_many(kwargs) + list(pool.imap(kwargs))
+
+    assert [result.value[0] for result in results] == [10, 2048, 10, 2048]
+    assert results[1].value[1] == kwargs[1]["data"]
+    assert results[3].value[1] == kwargs[1]["data"]
+
+
+@pytest.mark.skipif(SharedMemory is None, reason="Shared memory is not available")
+def test_shared_arrays():
+
+    numpy = pytest.importorskip("numpy")
+    data = numpy.arange(1024 * 1024, dtype="uint8")
+
+    with ProcessPool(examples.pool.Measure, "size", shared=1024) as pool:
+        [result] = pool.run_many([{"data": data}])
+        [small] = pool.run_many([{"data": data[:10]}])
+
+        total, array = result.value
+        assert total == len(data)
+        assert (array == data).all()
+
+        # The array is backed by the shared memory block.
+
+        assert not array.flags.owndata
+        assert (small.value[1] == data[:10]).all()
+
+    # The array owns the mapping after the pool is shut down.
+
+    assert (array == data).all()
+
+
+@pytest.mark.skipif(SharedMemory is None, reason="Shared memory is not available")
+def test_shared_cleanup(monkeypatch):
+
+    created = []
+
+    class Segment(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super(Segment, self).__init__(*args, **kwargs)
+            created.append(self.name)
+
+    class Broken(object):
+        def __reduce__(self):
+            raise pickle.PicklingError
+
+    monkeypatch.setattr(shared, "SharedMemory", Segment)
+
+    # Blocks created before the pickle failed are unlinked.
+
+    with pytest.raises(pickle.PicklingError):
+        shared.pack([pickle.PickleBuffer(bytearray(2048)), Broken()], 1024)
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(created[0])
+
+
+def test_detach():
+
+    result = examples.batch.Billing().charge.run(customer_id=-1).detach()
+    result = pickle.loads(pickle.dumps(result))
+
+    assert result.failed_because("unknown")
+    assert result.ctx.customer_id == -1
+
+    with pytest.raises(MutationError):
+        result.ctx.customer_id = 1
+
+    result = examples.batch.Billing().charge.run(customer_id=2).detach()
+    result = pickle.loads(pickle.dumps(result))
+
+    assert result.value == 19
+
+
+def test_detach_unpicklable():
+    class Delay(int):
+        pass
+
+    result = examples.stream.Parse().document.run(number=-1, delay=Delay(0))
+    result = result.detach()
+
+    assert result.ctx.number == -1
+    assert "delay" not in dir(result.ctx)
+    assert "delay: 0" in repr(result.ctx)
+
+
+def test_detach_enumeration():
+
+    # Failures defined in the local scope could not be pickled.
+
+    Errors = enum.Enum("Errors", "unknown expired")
+
+    class Billing(object):
+        @story
+        def charge(I):
+            I.find_customer
+
+        def find_customer(self, ctx):
+            return Failure(Errors.unknown)
+
+    Billing.charge.failures(Errors)
+
+    result = Billing().charge.run().detach()
+    result = pickle.loads(pickle.dumps(result))
+
+    assert result.failed_because(Errors.unknown)
+    assert not result.failed_because(Errors.expired)
+
+    with pytest.raises(FailureProtocolError):
+        result.failed_because("unknown")
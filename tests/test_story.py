@@ -1,4 +1,10 @@
+import sys
+
+import pytest
+
 import examples
+from _stories.mounted import no_coroutines_message
+from stories.exceptions import StoryError
 
 
 def test_story_representation():
@@ -128,3 +134,15 @@ SubstoryDI.y
   after
 """.strip()
     assert story == expected
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 5), reason="Coroutines are available")
+def test_await_story_without_coroutines():
+
+    with pytest.raises(StoryError) as exc_info:
+        examples.methods.Simple().x.acall(foo=1, bar=3)
+    assert str(exc_info.value) == no_coroutines_message
+
+    with pytest.raises(StoryError) as exc_info:
+        examples.methods.Simple().x.run_async(foo=1, bar=3)
+    assert str(exc_info.value) == no_coroutines_message
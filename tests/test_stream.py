@@ -0,0 +1,51 @@
+import examples
+
+
+def source(pulled, delays):
+    for number, delay in enumerate(delays):
+        pulled.append(number)
+        yield {"number": number, "delay": delay}
+
+
+def test_imap_ordered():
+
+    pulled = []
+    delays = [0.03, 0.01, 0.02, 0, 0.01]
+    stream = examples.stream.Parse().document.imap(source(pulled, delays), workers=2)
+
+    first = next(stream)
+    assert first.value == 0
+    assert len(pulled) <= 3
+
+    assert [result.value for result in stream] == [1, 2, 3, 4]
+    assert examples.stream.Parse.most <= 2
+
+
+def test_imap_unordered():
+
+    delays = [0.05, 0, 0, 0]
+    stream = examples.stream.Parse().document.imap(
+        source([], delays), workers=2, ordered=False
+    )
+
+    assert [result.value for result in stream] == [1, 2, 3, 0]
+
+
+def test_imap_failure():
+
+    kwargs = [{"number": -1, "delay": 0}, {"number": 1, "delay": 0}]
+    results = list(examples.stream.Parse().document.imap(kwargs))
+
+    assert results[0].is_failure
+    assert results[0].failed_on("wait")
+    assert results[1].value == 1
+
+
+def test_imap_close():
+
+    pulled = []
+    stream = examples.stream.Parse().document.imap(source(pulled, [0] * 100), workers=3)
+
+    assert next(stream).value == 0
+    stream.close()
+    assert len(pulled) <= 4
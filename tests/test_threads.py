@@ -0,0 +1,66 @@
+import threading
+
+import examples
+
+
+# Every access to the story builds its own plan.  Nothing built for one
+# access is changed by the other, so stories could be wrapped and run
+# by many threads at once without the GIL.
+
+
+def test_wrap_does_not_share_state():
+
+    obj = examples.methods.SimpleSubstory()
+    first, second = obj.y, obj.y
+    x = obj.x
+
+    assert all(
+        a is not b for (a, _, _), (b, _, _) in zip(first.methods, second.methods)
+    )
+    assert first.contract is not second.contract
+    assert all(
+        first.contract.argset[key] is not second.contract.argset[key]
+        for key in first.contract.argset
+    )
+
+    # Substory marker is copied, not changed in place.
+
+    assert x.methods[0][0].parent_name is None
+    assert [method.__name__ for method, _, _ in first.methods][:4] == [
+        "SimpleSubstory.y",
+        "start",
+        "before",
+        "x",
+    ]
+
+
+def test_concurrent_wrap_and_run():
+    def outcome(result):
+        return result.value if result.is_success else repr(result.ctx)
+
+    expected = [
+        outcome(examples.methods.SimpleSubstory().y.run(spam=spam)) for spam in [2, 3]
+    ]
+
+    start = threading.Event()
+    errors = []
+    results = [[] for _ in range(8)]
+
+    def worker(result):
+        start.wait()
+        try:
+            for _ in range(50):
+                obj = examples.methods.SimpleSubstory()
+                result.extend(outcome(obj.y.run(spam=spam)) for spam in [2, 3])
+        except Exception as error:  # pragma: no cover
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(result,)) for result in results]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert all(result == expected * 50 for result in results)